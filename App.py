@@ -1,31 +1,105 @@
-from doctest import master
-import logging
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import Label, PhotoImage, ttk
 from tkinter import messagebox
 import ttkbootstrap as ttkb 
-from LogicaFuzzy import LogicaFuzzy
-
-# Configuração do log
-logging.basicConfig(
-    filename='logs.txt',
-    level=logging.INFO,
-    format='%(asctime)s - %(message)s',
-    datefmt='%d-%m-%Y %H:%M:%S'
-)
+from CronometroEtapas import CronometroEtapas
+# LogicaFuzzy (skfuzzy) e matplotlib são importados só na construção do motor, em segundo plano
 
 class App:
 
-    def __init__(self, master, theme="flatly"):
+    TEXTO_CONSULTAR = "Consultar Diagnóstico"
+    TEXTO_AQUECENDO = "Preparando o motor..."
+    TEXTO_CALCULANDO = "Calculando..."
+    INTERVALO_VERIFICACAO = 15  # ms entre as verificações de uma tarefa em segundo plano
+    ESPERA_PREVIA = 20  # ms de agrupamento dos eventos dos sliders antes de uma pré-visualização
+
+    def __init__(self, master, theme="flatly", motor='skfuzzy', inicio=None, previa=False):
+        # inicio: time.perf_counter() do começo do processo, para o relatório de inicialização
+        self.inicio = inicio if inicio is not None else time.perf_counter()
+        self.tempos = {'importacoes': time.perf_counter() - self.inicio}
         self.style = ttkb.Style(theme=theme)
         self.master = master
         self.regras_ativadas = None
-        self.logica_fuzzy = LogicaFuzzy()
+        self.logica_fuzzy = None
+        self.contexto = None
+        self.grafico = None
+        # Consultas rodam em uma thread de trabalho; a interface só recebe o resultado pronto
+        self.trabalhador = ThreadPoolExecutor(max_workers=1, thread_name_prefix='consultas')
+        # Uma consulta por vez; um clique durante ela fica pendente e a substitui
+        self.consulta_em_andamento = None  # (número, entradas, Future, instante do clique)
+        self.consulta_pendente = None  # (entradas, instante do clique) do último clique à espera
+        self.numero_consulta = 0
+        # Pré-visualização ao vivo: thread própria, para não esperar consultas lentas do skfuzzy
+        self.previa_ao_vivo = tk.BooleanVar(value=previa)
+        self.trabalhador_previa = ThreadPoolExecutor(max_workers=1, thread_name_prefix='previa')
+        self.previa_agendada = False  # Há um after() de agrupamento pendente
+        self.previa_em_andamento = None  # (número, Future, instante do envio)
+        self.previa_pendente = False  # Sliders mudaram durante a pré-visualização em andamento
+        self.numero_previa = 0
+        # Tempos por etapa, do clique ao resultado na tela (F9 liga/desliga e imprime o resumo)
+        self.cronometro = CronometroEtapas.compartilhado()
         self.cria_widgets()
+        self.master.bind('<F9>', lambda evento: self.alterna_cronometro())
+
+        # A janela aparece de imediato; o motor é construído em outra thread e o botão de
+        # consulta fica desabilitado até ele ficar pronto
+        self.master.after_idle(self.marca_primeira_pintura)
+        self.construcao_motor = self.trabalhador.submit(self.constroi_motor, motor)
+        self.master.after(100, self.verifica_motor)
+
+    def constroi_motor(self, motor):
+        inicio = time.perf_counter()
+        from ContextoDiagnostico import ContextoDiagnostico
+        from LogicaFuzzy import LogicaFuzzy
+        import matplotlib.backends.backend_tkagg  # Canvas usado em cria_grafico, já importado aqui
+        self.tempos['importacao_motor'] = time.perf_counter() - inicio
+        logica_fuzzy = LogicaFuzzy(motor=motor, modo_grafico='sob_demanda', cronometro=self.cronometro)
+        self.contexto = ContextoDiagnostico(logica_fuzzy)  # Estado das consultas feitas pela tela
+        # A prévia acompanha um slider por vez: avaliação incremental sobre o motor compilado
+        self.avaliacao_previa = logica_fuzzy.nova_avaliacao_incremental()
+        return logica_fuzzy
+
+    def marca_primeira_pintura(self):
+        self.tempos['primeira_pintura'] = time.perf_counter() - self.inicio
+
+    def verifica_motor(self):
+        # Consulta periódica (na thread da interface) do fim da construção do motor
+        if not self.construcao_motor.done():
+            self.master.after(100, self.verifica_motor)
+            return
+        try:
+            self.logica_fuzzy = self.construcao_motor.result()
+        except Exception as e:
+            self.botao_consultar.configure(text="Motor indisponível")
+            messagebox.showerror(title="Erro", message=f"Não foi possível carregar o motor de inferência:\n{e}")
+            return
+        self.cria_grafico()
+        self.botao_consultar.configure(text=self.TEXTO_CONSULTAR, state="normal")
+        self.tempos['motor_pronto'] = time.perf_counter() - self.inicio
+        self.imprime_tempos_inicializacao()
+
+    def imprime_tempos_inicializacao(self):
+        print("\nINICIALIZAÇÃO:")
+        print(f"Importações e criação da janela: {self.tempos['importacoes']:.2f} s")
+        print(f"Primeira pintura da janela: {self.tempos.get('primeira_pintura', float('nan')):.2f} s")
+        print(f"Importação de LogicaFuzzy/matplotlib (segundo plano): {self.tempos['importacao_motor']:.2f} s")
+        print(f"Motor pronto para consulta: {self.tempos['motor_pronto']:.2f} s")
+
+    def alterna_cronometro(self):
+        if not self.cronometro.ativo:
+            self.cronometro.zera()
+            self.cronometro.liga()
+            print("\nCronômetro das etapas ligado (F9 desliga e imprime o resumo)")
+            return
+        self.cronometro.desliga()
+        print("\nTEMPOS POR ETAPA (ms):")
+        print(self.cronometro.relatorio())
 
     def cria_widgets(self):
         self.master.title("Diagnóstico de Transtornos Mentais")
-        self.master.geometry('700x650')
+        self.master.geometry('700x850')
 
         # Imagem de fundo ----------------------------------------
         logo_image = PhotoImage(file="./img/img_.png")
@@ -48,6 +122,7 @@ class App:
 
         def atualiza_valor(valor, var_label):
             var_label.set(f"{float(valor):.1f}")
+            self.agenda_previa()
 
        # Anedonia - Cria um frame para sintoma 
         anedonia_frame = ttk.Frame(self.master)
@@ -219,9 +294,11 @@ class App:
         self.seman_combobox = ttk.Combobox(self.master, bootstyle="info", values=["2 semanas ou mais", "6 meses ou mais", "Desde a infância"], state="readonly", width=15)
         self.seman_combobox.grid(row=11, column=1, sticky="w", padx=(15, 10), pady=(10, 10))
         self.seman_combobox.current(0)
+        self.seman_combobox.bind("<<ComboboxSelected>>", lambda evento: self.agenda_previa())
 
         # Botões:
-        ttk.Button(self.master, text="Consultar Diagnóstico", command=self.consultar_diagnostico, bootstyle="warning").grid(row=12, column=0, sticky="e", padx=(15, 5), pady=(15, 20))
+        self.botao_consultar = ttk.Button(self.master, text=self.TEXTO_AQUECENDO, command=self.consultar_diagnostico, bootstyle="warning", state="disabled")
+        self.botao_consultar.grid(row=12, column=0, sticky="e", padx=(15, 5), pady=(15, 20))
 
         # Estilo personalizado para o botão abaixo
         self.style.configure("BluePastel.TButton", 
@@ -234,6 +311,9 @@ class App:
 
         ttk.Button(self.master, text="Limpar", command=self.limpar_campos, bootstyle="danger").place(x=680, y=10, anchor=tk.NE)
 
+        ttk.Checkbutton(self.master, text="Prévia ao vivo", variable=self.previa_ao_vivo, command=self.agenda_previa,
+                        bootstyle="info-round-toggle").grid(row=13, column=0, columnspan=2, pady=(0, 5))
+
     def cria_campos_resultados(self):
         # Cria um Frame
         self.result_frame = ttk.Frame(self.master, padding=10, relief="solid", borderwidth=1)
@@ -248,9 +328,28 @@ class App:
         ttk.Label(self.result_frame, textvariable=self.result_ansiedade).grid(row=2, column=0, sticky="w")
         ttk.Label(self.result_frame, textvariable=self.result_tea).grid(row=3, column=0, sticky="w")
 
+    def cria_grafico(self):
+        # Gráficos das saídas: um único canvas, atualizado a cada diagnóstico
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from GraficoDiagnostico import GraficoDiagnostico
+
+        self.grafico = GraficoDiagnostico(self.logica_fuzzy)
+        self.canvas_grafico = FigureCanvasTkAgg(self.grafico.figura, master=self.master)
+        self.canvas_grafico.get_tk_widget().grid(row=15, column=0, columnspan=2, padx=15, pady=(0, 10))
+        self.canvas_grafico.draw()
+
 
     def consultar_diagnostico(self):
-        entradas = {
+        clique = time.perf_counter()
+        entradas = self.coleta_entradas()
+        if self.consulta_em_andamento is not None:
+            # Só uma consulta por vez: as entradas mais novas substituem as que aguardavam a vez
+            self.consulta_pendente = (entradas, clique)
+            return
+        self.inicia_consulta(entradas, clique)
+
+    def coleta_entradas(self):
+        return {
             'anedonia': self.anedonia_slider.get(),
             'humor_deprimido': self.humor_deprimido_slider.get(),
             'alteracao_sono': self.alteracao_sono_slider.get(),
@@ -265,26 +364,118 @@ class App:
             'seman_sint_present': self.direciona_valor(),
         }
 
+    def inicia_consulta(self, entradas, clique):
+        self.numero_consulta += 1
+        # O botão continua habilitado: um novo clique substitui esta consulta
+        self.botao_consultar.configure(text=self.TEXTO_CALCULANDO)
+        tarefa = self.trabalhador.submit(self.executa_consulta, entradas, time.perf_counter())
+        self.consulta_em_andamento = (self.numero_consulta, entradas, tarefa, clique)
+        self.master.after(self.INTERVALO_VERIFICACAO, self.verifica_consulta)
+
+    def executa_consulta(self, entradas, enviada):
+        # Thread de trabalho: inferência, log, regras ativadas e geometria dos gráficos
+        self.cronometro.registra('app.espera_trabalhador', time.perf_counter() - enviada)
+        with self.cronometro.etapa('app.consulta'):
+            diagnosis = self.contexto.calcula_diagnostico(entradas)
+            return diagnosis, self.contexto.ativacoes(), self.contexto.saida_grafico()
+
+    def verifica_consulta(self):
+        # Thread da interface: aguarda a consulta em andamento e exibe o resultado
+        numero, entradas, tarefa, clique = self.consulta_em_andamento
+        if not tarefa.done():
+            self.master.after(self.INTERVALO_VERIFICACAO, self.verifica_consulta)
+            return
+        self.consulta_em_andamento = None
+        if self.consulta_pendente is not None:
+            # Resultado superado por um clique mais novo: descartado sem redesenhar a tela
+            (entradas, clique), self.consulta_pendente = self.consulta_pendente, None
+            self.inicia_consulta(entradas, clique)
+            return
+        self.botao_consultar.configure(text=self.TEXTO_CONSULTAR)
+        if numero != self.numero_consulta:
+            return  # Tela limpa enquanto a consulta rodava
+
+        if self.cronometro.ativo:
+            # Clique -> resultado na tela: registrado depois que o Tk processar os redesenhos pendentes
+            self.master.after_idle(lambda: self.cronometro.registra('app.clique_resultado',
+                                                                    time.perf_counter() - clique))
         try:
-            diagnosis = self.logica_fuzzy.calcula_diagnostico(entradas)
-            self.regras_ativadas = self.logica_fuzzy.ativacoes()
+            diagnosis, self.regras_ativadas, saida = tarefa.result()
+            with self.cronometro.etapa('app.atualiza_tela'):
+                self.grafico.atualiza(saida)
 
-            # Atualiza valores resultados
-            self.result_depressao.set(f"Depressão: {diagnosis['depressao']:.2f}/10")
-            self.result_ansiedade.set(f"Ansiedade: {diagnosis['ansiedade']:.2f}/10")
-            self.result_tea.set(f"TEA: {diagnosis['tea']:.2f}/10")
+                # Atualiza valores resultados
+                self.result_depressao.set(f"Depressão: {diagnosis['depressao']:.2f}/10")
+                self.result_ansiedade.set(f"Ansiedade: {diagnosis['ansiedade']:.2f}/10")
+                self.result_tea.set(f"TEA: {diagnosis['tea']:.2f}/10")
 
             print("\nVALORES DE ENTRADA:")
             for chave, valor in entradas.items():
                 print(f"{chave}: {valor}")
 
         except KeyError as e:
-            self.grava_log_erro(entradas)
+            # A consulta sem regra já foi registrada pelo LogicaFuzzy (tipo 'sem_regra')
+            self.grafico.limpa()
             messagebox.showwarning(
                 title="Atenção",
                 message=f"Não existem regras cadastradas para as entradas fornecidas."
             )
+        except Exception as e:
+            # Falha na consulta (ou ao desenhar o resultado): a tela volta ao estado sem diagnóstico
+            self.grafico.limpa()
+            self.result_depressao.set("")
+            self.result_ansiedade.set("")
+            self.result_tea.set("")
+            messagebox.showerror(title="Erro", message=f"Não foi possível calcular o diagnóstico:\n{e}")
+
+    def agenda_previa(self):
+        # Chamado a cada evento dos sliders: eventos próximos são agrupados em uma única pré-visualização
+        if not self.previa_ao_vivo.get() or self.logica_fuzzy is None or self.previa_agendada:
+            return
+        self.previa_agendada = True
+        self.master.after(self.ESPERA_PREVIA, self.inicia_previa)
+
+    def inicia_previa(self):
+        self.previa_agendada = False
+        if self.previa_em_andamento is not None:
+            # No máximo uma pré-visualização por vez: as posições intermediárias são descartadas e
+            # a posição atual é calculada quando a anterior terminar
+            self.previa_pendente = True
+            return
+        self.previa_pendente = False
+        tarefa = self.trabalhador_previa.submit(self.logica_fuzzy.previa, self.coleta_entradas(),
+                                                self.avaliacao_previa)
+        self.previa_em_andamento = (self.numero_previa, tarefa, time.perf_counter())
+        self.master.after(self.INTERVALO_VERIFICACAO, self.verifica_previa)
+
+    def verifica_previa(self):
+        numero, tarefa, inicio = self.previa_em_andamento
+        if not tarefa.done():
+            self.master.after(self.INTERVALO_VERIFICACAO, self.verifica_previa)
+            return
+        self.previa_em_andamento = None
+        if self.previa_pendente:
+            self.inicia_previa()
+        if numero != self.numero_previa or self.consulta_em_andamento is not None:
+            return  # Tela limpa ou consulta completa em andamento: o resultado dela prevalece
 
+        try:
+            saidas = tarefa.result()
+        except Exception as e:
+            # Falha na pré-visualização: sem caixa de diálogo (dispara a cada movimento dos sliders),
+            # só os rótulos indicam que não há valor para a posição atual
+            print(f"Erro na pré-visualização: {e}")
+            saidas = None
+        for variavel, rotulo, nome in ((self.result_depressao, "Depressão", 'depressao'),
+                                       (self.result_ansiedade, "Ansiedade", 'ansiedade'),
+                                       (self.result_tea, "TEA", 'tea')):
+            if saidas is None:
+                variavel.set(f"{rotulo}: indisponível (prévia)")
+            else:
+                variavel.set(f"{rotulo}: {saidas[nome]:.2f}/10 (prévia)" if nome in saidas else f"{rotulo}: sem regras (prévia)")
+        if saidas is None:
+            return
+        self.cronometro.registra('app.previa', time.perf_counter() - inicio)
 
     def direciona_valor(self):
         valores = ["2 semanas ou mais", "6 meses ou mais", "Desde a infância"]
@@ -343,19 +534,6 @@ class App:
             print(f"Erro ao formatar o grau de ativação: {str(e)}")
             return "Erro"
 
-    def grava_log_erro(self, entradas):
-        entradas_formatadas = []
-        linha = f"TESTES | "
-        linha += "[Entradas => "
-        for chave, valor in entradas.items():
-            entradas_formatadas.append(f"{chave}: {round(valor, 2):.2f}, ")
-        
-        # Remove a última vírgula e espaço
-        entradas_formatadas[-1] = entradas_formatadas[-1].rstrip(', ')
-        
-        linha += ''.join(entradas_formatadas) + "] [Saída => REGRAS NÃO COMPUTADAS PARA AS ENTRADAS]"
-        logging.info(linha)
-
     def limpar_campos(self):
         # Limpa sliders
         self.anedonia_slider.set(0)
@@ -375,5 +553,12 @@ class App:
         self.result_depressao.set("")
         self.result_ansiedade.set("")
         self.result_tea.set("")
+        # Descarta o resultado de uma consulta ou pré-visualização que ainda esteja em andamento
+        self.numero_consulta += 1
+        self.consulta_pendente = None
+        self.numero_previa += 1
+        self.previa_pendente = False
+        if self.grafico is not None:
+            self.grafico.limpa()
 
   
\ No newline at end of file
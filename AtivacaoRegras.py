@@ -0,0 +1,26 @@
+import numpy as np
+
+
+class AtivacaoRegras:
+    # Grau de disparo de todas as regras em um diagnóstico, lido direto do cálculo
+    # (sem print_state nem expressões regulares). A posição no vetor é o número da regra (RULE #n)
+
+    def __init__(self, graus, rotulos_consequentes):
+        self.graus = np.asarray(graus, dtype=np.float64)  # Vetor com um grau por regra
+        self.ids = np.arange(self.graus.size)  # Número de cada regra
+        self.consequentes = rotulos_consequentes  # Rótulo do consequente de cada regra, ex.: 'depressao[leve]'
+
+    def ativadas(self):
+        # Números das regras com grau de disparo maior que zero
+        return np.flatnonzero(self.graus > 0.0)
+
+    def obter_ativacoes(self):
+        # Lista de (número da regra, grau) das regras ativadas, no formato exibido pela tela
+        return [(int(r), float(self.graus[r])) for r in self.ativadas()]
+
+    def por_consequente(self):
+        # Regras ativadas agrupadas pelo consequente: {'depressao[leve]': [(regra, grau), ...]}
+        grupos = {}
+        for r in self.ativadas():
+            grupos.setdefault(self.consequentes[r], []).append((int(r), float(self.graus[r])))
+        return grupos
@@ -0,0 +1,133 @@
+import numpy as np
+
+
+class AvaliacaoIncremental:
+    # Avaliação incremental de consultas sucessivas sobre um MotorVetorizado (ex.: a tela, onde
+    # entre duas consultas só um ou dois sliders mudam). Guarda as pertinências, os valores das
+    # cláusulas, os graus das premissas e os cortes da consulta anterior; a cada nova consulta
+    # refaz só as variáveis alteradas, as premissas com alguma cláusula alterada e as saídas cujos
+    # cortes mudaram. O resultado é idêntico ao de MotorVetorizado.avalia. Estado de uma única
+    # sequência de consultas: cada thread usa a sua (ver ContextoDiagnostico)
+
+    def __init__(self, motor):
+        self.motor = motor
+        n_entradas = len(motor.nomes_entrada)
+        self.indices_premissa = motor.indice_clausula.reshape(motor.n_premissas, n_entradas)
+        self.ultimas_entradas = None
+        self.mu = np.zeros((1, n_entradas, motor.max_termos))
+        self.valores = np.zeros((1, n_entradas, motor.n_codigos))
+        self.graus = np.zeros((1, motor.n_premissas))
+        self.cortes = None
+        self.saidas = np.full((1, len(motor.nomes_saida)), np.nan)
+        self.zera_contadores()
+
+    def zera_contadores(self):
+        self.contadores = {
+            'consultas': 0,
+            'variaveis_fuzzificadas': 0, 'variaveis_reaproveitadas': 0,
+            'regras_avaliadas': 0, 'regras_reaproveitadas': 0,
+            'saidas_defuzzificadas': 0, 'saidas_reaproveitadas': 0,
+        }
+
+    def estatisticas(self):
+        # Contadores acumulados e fração do trabalho poupado em cada etapa
+        estatisticas = dict(self.contadores)
+        for etapa, feito, poupado in (('fuzzificacao', 'variaveis_fuzzificadas', 'variaveis_reaproveitadas'),
+                                      ('regras', 'regras_avaliadas', 'regras_reaproveitadas'),
+                                      ('defuzzificacao', 'saidas_defuzzificadas', 'saidas_reaproveitadas')):
+            total = self.contadores[feito] + self.contadores[poupado]
+            estatisticas[f"poupado_{etapa}"] = self.contadores[poupado] / total if total else 0.0
+        return estatisticas
+
+    def reinicia(self):
+        # Descarta o estado guardado: a próxima consulta é avaliada por completo
+        self.ultimas_entradas = None
+        self.cortes = None
+
+    def avalia(self, X):
+        # Mesmo contrato de MotorVetorizado.avalia para uma única linha (matriz 1 x V)
+        motor = self.motor
+        X = np.asarray(X, dtype=np.float64).reshape(1, -1)
+        n_entradas = X.shape[1]
+        if self.ultimas_entradas is None:
+            alteradas = np.arange(n_entradas)
+        else:
+            alteradas = np.flatnonzero(X[0] != self.ultimas_entradas)
+
+        # Pertinências e cláusulas só das variáveis alteradas
+        for v in alteradas:
+            motor.fuzzifica_variavel(X[:, v], v, self.mu[:, v])
+        clausula_alterada = np.zeros(self.valores.size, dtype=bool)
+        if alteradas.size:
+            valores = motor.valores_clausulas(self.mu[:, alteradas])
+            clausula_alterada.reshape(self.valores.shape)[:, alteradas] = valores != self.valores[:, alteradas]
+            if self.ultimas_entradas is None:
+                clausula_alterada[:] = True
+            self.valores[:, alteradas] = valores
+
+        # Premissas com alguma cláusula de valor alterado: mín. dos valores das suas cláusulas
+        afetadas = np.flatnonzero(clausula_alterada[self.indices_premissa].any(axis=1))
+        if afetadas.size:
+            self.graus[0, afetadas] = self.valores.reshape(-1)[self.indices_premissa[afetadas]].min(axis=1)
+        ativacoes = self.graus[:, motor.premissa_da_regra]
+        cortes = motor.agrega(ativacoes)
+
+        # Saídas cujos cortes não mudaram mantêm o valor anterior
+        defuzzificadas = 0
+        for c in range(len(motor.nomes_saida)):
+            inicio = motor.inicio_saida[c]
+            fim = inicio + len(motor.termos_saida[c])
+            if self.cortes is None or not np.array_equal(cortes[:, inicio:fim], self.cortes[:, inicio:fim]):
+                self.saidas[:, c] = motor.defuzzifica_consequente(cortes, c)
+                defuzzificadas += 1
+
+        regras_avaliadas = int(motor.premissas_por_regra[afetadas].sum())
+        self.contadores['consultas'] += 1
+        self.contadores['variaveis_fuzzificadas'] += alteradas.size
+        self.contadores['variaveis_reaproveitadas'] += n_entradas - alteradas.size
+        self.contadores['regras_avaliadas'] += regras_avaliadas
+        self.contadores['regras_reaproveitadas'] += motor.n_regras - regras_avaliadas
+        self.contadores['saidas_defuzzificadas'] += defuzzificadas
+        self.contadores['saidas_reaproveitadas'] += len(motor.nomes_saida) - defuzzificadas
+
+        self.ultimas_entradas = X[0].copy()
+        self.cortes = cortes
+        return self.saidas.copy(), ativacoes, cortes
+
+
+if __name__ == '__main__':
+    # Simula o uso da tela: a cada consulta um slider muda; confere cada resultado com a avaliação
+    # completa e compara os tempos
+    import sys
+    import time
+
+    from LogicaFuzzy import LogicaFuzzy
+
+    consultas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    motor = LogicaFuzzy(motor='vetorizado', cache=False)._compila_motor()
+    rng = np.random.default_rng(0)
+    X = np.empty((consultas, len(motor.nomes_entrada)))
+    X[0] = rng.choice([0., 1., 2., 3., 4., 5.], len(motor.nomes_entrada))
+    for i in range(1, consultas):
+        X[i] = X[i - 1]
+        X[i, rng.integers(len(motor.nomes_entrada))] = np.round(rng.uniform(0, 5), 1)
+
+    inicio = time.perf_counter()
+    completas = [motor.avalia(X[i:i + 1]) for i in range(consultas)]
+    tempo_completo = time.perf_counter() - inicio
+
+    incremental = AvaliacaoIncremental(motor)
+    inicio = time.perf_counter()
+    incrementais = [incremental.avalia(X[i:i + 1]) for i in range(consultas)]
+    tempo_incremental = time.perf_counter() - inicio
+
+    divergencias = sum(not all(np.array_equal(a, b, equal_nan=True) for a, b in zip(completa, parcial))
+                       for completa, parcial in zip(completas, incrementais))
+    print(f"{consultas} consultas (um slider alterado por vez)")
+    print(f"Avaliação completa:    {tempo_completo / consultas * 1e3:.3f} ms/consulta")
+    print(f"Avaliação incremental: {tempo_incremental / consultas * 1e3:.3f} ms/consulta")
+    for chave, valor in incremental.estatisticas().items():
+        print(f"{chave}: {valor:.2%}" if chave.startswith('poupado') else f"{chave}: {valor}")
+    print(f"Divergências em relação à avaliação completa: {divergencias}")
+    if divergencias:
+        raise SystemExit(1)
@@ -0,0 +1,80 @@
+import csv
+import os
+
+from skfuzzy import control as ctrl
+
+
+class BaseRegras:
+    # Base de regras declarativa: uma linha do CSV por regra, com a seção, uma descrição,
+    # o(s) termo(s) de cada antecedente ("baixo", "baixo|medio" ou vazio quando a variável
+    # não participa da premissa) e o consequente (saida, termo).
+    # A ordem das linhas define a numeração das regras (RULE #n).
+
+    ARQUIVO_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'regras.csv')
+    SEPARADOR_OU = '|'
+
+    def __init__(self, nomes_entrada, linhas):
+        self.nomes_entrada = list(nomes_entrada)
+        self.linhas = linhas  # dicts com secao, descricao, premissa {variavel: (termos,)}, consequente
+
+    @classmethod
+    def carrega(cls, caminho=None):
+        caminho = caminho or cls.ARQUIVO_PADRAO
+        with open(caminho, newline='', encoding='utf-8') as arquivo:
+            leitor = csv.DictReader(arquivo)
+            nomes_entrada = [c for c in leitor.fieldnames if c not in ('secao', 'descricao', 'saida', 'termo')]
+            linhas = []
+            for numero, campos in enumerate(leitor, start=2):
+                premissa = {}
+                for nome in nomes_entrada:
+                    valor = (campos[nome] or '').strip()
+                    if valor:
+                        premissa[nome] = tuple(t.strip() for t in valor.split(cls.SEPARADOR_OU))
+                if not premissa or not campos['saida'] or not campos['termo']:
+                    raise ValueError(f"{caminho}:{numero}: regra sem premissa ou sem consequente")
+                linhas.append({
+                    'secao': campos['secao'],
+                    'descricao': campos['descricao'],
+                    'premissa': premissa,
+                    'consequente': (campos['saida'].strip(), campos['termo'].strip()),
+                })
+        return cls(nomes_entrada, linhas)
+
+    def salva(self, caminho=None):
+        caminho = caminho or self.ARQUIVO_PADRAO
+        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.writer(arquivo, lineterminator='\n')
+            escritor.writerow(['secao', 'descricao'] + self.nomes_entrada + ['saida', 'termo'])
+            for linha in self.linhas:
+                escritor.writerow(
+                    [linha['secao'], linha['descricao']]
+                    + [self.SEPARADOR_OU.join(linha['premissa'].get(nome, ())) for nome in self.nomes_entrada]
+                    + list(linha['consequente']))
+
+    def regras(self):
+        # Formato consumido pelo MotorVetorizado: (premissa, (consequente, termo))
+        return [(linha['premissa'], linha['consequente']) for linha in self.linhas]
+
+    def valida(self, variaveis):
+        # Confere variáveis e termos contra as variáveis fuzzy definidas ({rotulo: FuzzyVariable})
+        for numero, linha in enumerate(self.linhas):
+            saida, termo = linha['consequente']
+            itens = [(v, t) for v, termos in linha['premissa'].items() for t in termos] + [(saida, termo)]
+            for variavel, t in itens:
+                if variavel not in variaveis or t not in variaveis[variavel].terms:
+                    raise ValueError(f"Regra #{numero}: termo desconhecido {variavel}['{t}']")
+
+    def regras_skfuzzy(self, variaveis):
+        # Monta os ctrl.Rule equivalentes (usados pelo ControlSystem do skfuzzy)
+        self.valida(variaveis)
+        regras = []
+        for linha in self.linhas:
+            premissa = None
+            for variavel, termos in linha['premissa'].items():
+                clausula = variaveis[variavel][termos[0]]
+                for termo in termos[1:]:
+                    clausula = clausula | variaveis[variavel][termo]
+                premissa = clausula if premissa is None else premissa & clausula
+            saida, termo = linha['consequente']
+            regras.append(ctrl.Rule(premissa, variaveis[saida][termo]))
+        return regras
@@ -0,0 +1,67 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class CacheDiagnosticos:
+    # Cache LRU de diagnósticos, com chave no vetor exato de entradas: só a mesma consulta reaproveita
+    # um resultado. Com `passo`, a chave é quantizada em passos de `passo` (opcional e aproximado:
+    # entradas na mesma célula recebem o resultado da primeira consulta).
+    # Guarda saídas e ativações juntas; ao atingir a capacidade descarta o item usado há mais tempo.
+
+    CAPACIDADE_PADRAO = 256
+
+    def __init__(self, capacidade=None, passo=None):
+        if passo is not None and passo <= 0:
+            raise ValueError(f"passo do cache deve ser positivo, recebido {passo}")
+        self.capacidade = capacidade or self.CAPACIDADE_PADRAO
+        self.passo = passo
+        self.itens = OrderedDict()
+        self.trava = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+
+    def chave(self, valores):
+        # Tupla dos valores exatos ou, com passo, do índice da célula de cada entrada na grade
+        valores = np.asarray(valores, dtype=np.float64)
+        if self.passo is None:
+            return tuple(valores.tolist())
+        return tuple(np.rint(valores / self.passo).astype(np.int64).tolist())
+
+    def obtem(self, chave):
+        # Resultado guardado ou None; um acerto torna o item o mais recente
+        with self.trava:
+            resultado = self.itens.get(chave)
+            if resultado is None:
+                self.falhas += 1
+                return None
+            self.itens.move_to_end(chave)
+            self.acertos += 1
+            return resultado
+
+    def guarda(self, chave, resultado):
+        with self.trava:
+            self.itens[chave] = resultado
+            self.itens.move_to_end(chave)
+            while len(self.itens) > self.capacidade:
+                self.itens.popitem(last=False)
+                self.remocoes += 1
+
+    def invalida(self):
+        # Descarta todos os resultados (base de regras ou funções de pertinência alteradas)
+        with self.trava:
+            self.itens.clear()
+
+    def estatisticas(self):
+        with self.trava:
+            consultas = self.acertos + self.falhas
+            return {
+                'tamanho': len(self.itens),
+                'capacidade': self.capacidade,
+                'acertos': self.acertos,
+                'falhas': self.falhas,
+                'remocoes': self.remocoes,
+                'taxa_acerto': self.acertos / consultas if consultas else 0.0,
+            }
@@ -0,0 +1,159 @@
+import numpy as np
+
+from LoteParalelo import LoteParalelo
+
+
+class CoberturaRegras:
+    # Varredura de cobertura da base de regras: encontra as regiões do espaço de entradas onde
+    # nenhuma regra de uma saída é ativada (o KeyError de calcula_diagnostico / "REGRAS NÃO
+    # COMPUTADAS" do log). Avalia a grade de termos nítidos (cada variável no centro de cada termo)
+    # e uma amostragem contínua, distribuídas entre processos pelo LoteParalelo, e resume as
+    # células descobertas de cada saída em padrões de combinações de termos
+
+    AMOSTRAS_PADRAO = 100000
+
+    def __init__(self, trabalhadores=None, tamanho_bloco=None, artefato=None, arquivo_regras=None):
+        self.lote = LoteParalelo(trabalhadores, tamanho_bloco, artefato, arquivo_regras)
+        self.motor = self.lote.motor
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fecha()
+
+    def fecha(self):
+        self.lote.fecha()
+
+    def centros_termos(self):
+        # Valor nítido de cada termo de cada variável: centro do trecho do universo com pertinência máxima
+        centros = []
+        for universo, pertinencias in zip(self.motor.universos_entrada, self.motor.pertinencias_entrada):
+            centros.append([universo[mf == mf.max()].mean() for mf in pertinencias])
+        return centros
+
+    def grade(self):
+        # Todas as combinações de termos nítidos: (índices dos termos N x V, entradas N x V)
+        centros = self.centros_termos()
+        formato = tuple(len(c) for c in centros)
+        indices = np.indices(formato).reshape(len(formato), -1).T
+        X = np.column_stack([np.asarray(c)[indices[:, v]] for v, c in enumerate(centros)])
+        return indices, X
+
+    def termos_dominantes(self, X):
+        # Termo de maior pertinência de cada variável (empate: o primeiro termo)
+        return self.motor.fuzzifica(X).argmax(axis=2)
+
+    def varre(self, amostras=None, semente=0):
+        # Resultado por saída: células descobertas da grade (booleano com um eixo por variável),
+        # padrões que as resumem e a fração descoberta da amostragem contínua
+        amostras = self.AMOSTRAS_PADRAO if amostras is None else amostras
+        indices, X = self.grade()
+        formato = tuple(int(m) + 1 for m in indices.max(axis=0))
+        descobertas_grade = self.lote.sem_regra(X)
+
+        limites = self.motor.limites_entrada
+        continuas = np.random.default_rng(semente).uniform(limites[:, 0], limites[:, 1],
+                                                           (amostras, len(self.motor.nomes_entrada)))
+        descobertas_continuas = self.lote.sem_regra(continuas)
+        dominantes = self.termos_dominantes(continuas[descobertas_continuas.any(axis=1)])
+        mascara_dominantes = descobertas_continuas[descobertas_continuas.any(axis=1)]
+
+        resultado = {}
+        for c, saida in enumerate(self.motor.nomes_saida):
+            celulas = descobertas_grade[:, c].reshape(formato)
+            # Regiões vistas só na amostragem contínua: pontos descobertos cujo termo dominante
+            # forma uma combinação coberta na grade (buracos entre termos)
+            dominantes_c = dominantes[mascara_dominantes[:, c]]
+            so_continuas = np.zeros(formato, dtype=bool)
+            if dominantes_c.size:
+                so_continuas[tuple(dominantes_c.T)] = True
+                so_continuas &= ~celulas
+            resultado[saida] = {
+                'celulas_descobertas': int(celulas.sum()),
+                'celulas': celulas.size,
+                'padroes': self.padroes(celulas),
+                'fracao_continua_descoberta': float(descobertas_continuas[:, c].mean()) if amostras else 0.0,
+                'padroes_so_continuos': self.padroes(so_continuas),
+            }
+        return resultado
+
+    @staticmethod
+    def padroes(celulas):
+        # Cobertura gulosa das células True por "cubos": em cada variável, um subconjunto de termos.
+        # Cada cubo parte de uma célula ainda não coberta e cresce termo a termo enquanto continuar
+        # inteiramente dentro das células True. Retorna [(tamanho, [termos de cada variável])],
+        # do maior para o menor
+        restantes = celulas.copy()
+        # Um cubo está dentro das células True se não contém nenhuma célula False. Para cada célula
+        # False, `fora` conta as variáveis em que ela está fora do cubo; incluir o termo t da
+        # variável v só é possível se nenhuma célula False com fora == 1 tiver o termo t em v
+        falsas = np.ascontiguousarray(np.argwhere(~celulas).T)
+        padroes = []
+        while restantes.any():
+            celula = np.unravel_index(np.argmax(restantes), celulas.shape)
+            conjuntos = [[int(t)] for t in celula]
+            fora = (falsas != np.array(celula)[:, None]).sum(axis=0)
+            for v, n_termos in enumerate(celulas.shape):
+                for t in range(n_termos):
+                    if t in conjuntos[v]:
+                        continue
+                    com_termo = falsas[v] == t
+                    if not np.any(com_termo & (fora == 1)):
+                        conjuntos[v] = sorted(conjuntos[v] + [t])
+                        fora -= com_termo
+            restantes[np.ix_(*conjuntos)] = False
+            padroes.append((int(np.prod([len(s) for s in conjuntos])), conjuntos))
+        padroes.sort(key=lambda padrao: -padrao[0])
+        return padroes
+
+    def descreve(self, conjuntos):
+        # Padrão legível: variáveis com todos os termos são omitidas (qualquer valor)
+        partes = []
+        for nome, termos, conjunto in zip(self.motor.nomes_entrada, self.motor.termos_entrada, conjuntos):
+            if len(conjunto) < len(termos):
+                partes.append(f"{nome}={'|'.join(termos[t] for t in conjunto)}")
+        return ', '.join(partes) or "(qualquer entrada)"
+
+
+if __name__ == '__main__':
+    # python CoberturaRegras.py [--amostras 100000] [--trabalhadores N] [--padroes 20] [--json arquivo]
+    import argparse
+    import json
+    import time
+
+    parser = argparse.ArgumentParser(description="Regiões de entrada sem regra ativada, por saída")
+    parser.add_argument('--amostras', type=int, default=CoberturaRegras.AMOSTRAS_PADRAO,
+                        help="Pontos da amostragem contínua")
+    parser.add_argument('--trabalhadores', type=int, default=None)
+    parser.add_argument('--regras', default=None, help="Arquivo de regras (padrão: regras.csv)")
+    parser.add_argument('--artefato', default=None)
+    parser.add_argument('--padroes', type=int, default=20, help="Padrões exibidos por saída")
+    parser.add_argument('--json', default=None, help="Grava todos os padrões neste arquivo")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    with CoberturaRegras(args.trabalhadores, artefato=args.artefato, arquivo_regras=args.regras) as cobertura:
+        resultado = cobertura.varre(args.amostras)
+        duracao = time.perf_counter() - inicio
+
+        relatorio = {}
+        for saida, dados in resultado.items():
+            print(f"\n{saida.upper()}: {dados['celulas_descobertas']} de {dados['celulas']} combinações de termos "
+                  f"sem regra ({dados['celulas_descobertas'] / dados['celulas']:.1%}); "
+                  f"amostragem contínua: {dados['fracao_continua_descoberta']:.1%} sem regra")
+            print(f"  {len(dados['padroes'])} padrões (podem se sobrepor); "
+                  f"{len(dados['padroes_so_continuos'])} regiões só entre termos")
+            for tamanho, conjuntos in dados['padroes'][:args.padroes]:
+                print(f"  {tamanho:7d}  {cobertura.descreve(conjuntos)}")
+            if len(dados['padroes']) > args.padroes:
+                print(f"  ... mais {len(dados['padroes']) - args.padroes} padrões")
+            relatorio[saida] = {
+                **{chave: valor for chave, valor in dados.items() if not chave.startswith('padroes')},
+                'padroes': [cobertura.descreve(conjuntos) for _, conjuntos in dados['padroes']],
+                'padroes_so_continuos': [cobertura.descreve(conjuntos) for _, conjuntos in dados['padroes_so_continuos']],
+            }
+    print(f"\nVarredura em {duracao:.1f} s")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
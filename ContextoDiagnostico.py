@@ -0,0 +1,34 @@
+class ContextoDiagnostico:
+    # Estado mutável de uma consulta: simulador do skfuzzy, avaliação incremental e últimos resultados.
+    # As partes imutáveis (variáveis, regras, ControlSystem e motor compilado) ficam no
+    # LogicaFuzzy compartilhado; cada thread usa o seu contexto (ver PoolContextos)
+
+    def __init__(self, logica_fuzzy, motor=None):
+        # motor: motor das consultas deste contexto (padrão: o do LogicaFuzzy)
+        self.logica_fuzzy = logica_fuzzy
+        self.motor = motor or logica_fuzzy.motor
+        self.simulador = logica_fuzzy.novo_simulador() if self.motor == 'skfuzzy' else None
+        self.incremental = logica_fuzzy.nova_avaliacao_incremental() if logica_fuzzy.incremental else None
+        self.ultima_ativacao = None
+        self.ultima_saida = None
+
+    def calcula_diagnostico(self, entradas):
+        # Mesmo contrato de LogicaFuzzy.calcula_diagnostico (KeyError quando não há regra ativada)
+        saidas, self.ultima_ativacao, self.ultima_saida = self.logica_fuzzy.infere(
+            entradas, self.simulador, self.incremental, self.motor)
+        self.logica_fuzzy.grava_log(entradas, saidas, self.ultima_ativacao)
+        return {
+            'depressao': saidas['depressao'],
+            'ansiedade': saidas['ansiedade'],
+            'tea': saidas['tea']
+        }
+
+    def ativacoes(self):
+        return self.ultima_ativacao.obter_ativacoes()
+
+    def saida_grafico(self):
+        # (valores, ativações, cortes) da última consulta deste contexto, para GraficoDiagnostico
+        if self.ultima_saida is None:
+            with self.logica_fuzzy.cronometro.etapa('reconstroi_saida'):
+                self.ultima_saida = self.logica_fuzzy.reconstroi_saida(self.ultima_ativacao)
+        return self.ultima_saida
@@ -0,0 +1,112 @@
+import collections
+import contextlib
+import os
+import threading
+import time
+
+
+class CronometroEtapas:
+    # Cronômetros por etapa do diagnóstico (atribuição das entradas, compute(), inferência
+    # vetorizada, grava_log, gráficos, latência do clique na tela...). Desligado, `etapa()` devolve
+    # um contexto vazio e `registra()` retorna de imediato, então os ganchos podem ficar no código.
+    # Pode ser ligado e desligado a qualquer momento (ou já ligado com CRONOMETRO_ETAPAS=1); cada
+    # medida alimenta as estatísticas da etapa e as funções registradas com adiciona_callback
+
+    AMOSTRAS_RECENTES = 1000  # Medidas guardadas por etapa para os percentis
+    VARIAVEL_AMBIENTE = 'CRONOMETRO_ETAPAS'
+
+    _NULO = contextlib.nullcontext()
+    _compartilhado = None
+    _trava_compartilhado = threading.Lock()
+
+    def __init__(self, ativo=False):
+        self.ativo = ativo
+        self.trava = threading.Lock()
+        self.callbacks = []
+        self.zera()
+
+    @classmethod
+    def compartilhado(cls):
+        # Cronômetro único do processo, usado pelo LogicaFuzzy e pela App quando nenhum é informado
+        with cls._trava_compartilhado:
+            if cls._compartilhado is None:
+                cls._compartilhado = cls(ativo=os.environ.get(cls.VARIAVEL_AMBIENTE, '') not in ('', '0'))
+            return cls._compartilhado
+
+    def liga(self):
+        self.ativo = True
+
+    def desliga(self):
+        self.ativo = False
+
+    def zera(self):
+        with self.trava:
+            self.etapas = {}
+
+    def adiciona_callback(self, funcao):
+        # funcao(etapa, segundos), chamada na thread que mediu a etapa
+        self.callbacks.append(funcao)
+
+    def remove_callback(self, funcao):
+        self.callbacks.remove(funcao)
+
+    def etapa(self, nome):
+        # with cronometro.etapa('compute'): ...
+        if not self.ativo:
+            return self._NULO
+        return self._mede(nome)
+
+    @contextlib.contextmanager
+    def _mede(self, nome):
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.registra(nome, time.perf_counter() - inicio)
+
+    def registra(self, nome, segundos):
+        # Medida feita fora de `etapa()`, ex.: intervalos que começam em uma thread e terminam em outra
+        if not self.ativo:
+            return
+        with self.trava:
+            dados = self.etapas.get(nome)
+            if dados is None:
+                dados = self.etapas[nome] = {'chamadas': 0, 'total': 0.0, 'minimo': segundos, 'maximo': segundos,
+                                             'recentes': collections.deque(maxlen=self.AMOSTRAS_RECENTES)}
+            dados['chamadas'] += 1
+            dados['total'] += segundos
+            dados['minimo'] = min(dados['minimo'], segundos)
+            dados['maximo'] = max(dados['maximo'], segundos)
+            dados['recentes'].append(segundos)
+        for funcao in self.callbacks:
+            funcao(nome, segundos)
+
+    def resumo(self):
+        # {etapa: {chamadas, total, media, minimo, maximo, p50, p95}} em segundos; percentis das
+        # últimas AMOSTRAS_RECENTES medidas
+        with self.trava:
+            copia = {nome: (dict(dados), sorted(dados['recentes'])) for nome, dados in self.etapas.items()}
+        resumo = {}
+        for nome, (dados, recentes) in copia.items():
+            resumo[nome] = {
+                'chamadas': dados['chamadas'],
+                'total': dados['total'],
+                'media': dados['total'] / dados['chamadas'],
+                'minimo': dados['minimo'],
+                'maximo': dados['maximo'],
+                'p50': recentes[len(recentes) // 2],
+                'p95': recentes[min(len(recentes) - 1, int(len(recentes) * 0.95))],
+            }
+        return resumo
+
+    def relatorio(self):
+        # Tabela em ms, da etapa com maior tempo total para a menor
+        resumo = self.resumo()
+        if not resumo:
+            return "Nenhuma etapa medida"
+        linhas = [f"{'etapa':<28} {'chamadas':>8} {'total':>10} {'média':>9} {'p50':>9} {'p95':>9} {'máx.':>9}"]
+        for nome, dados in sorted(resumo.items(), key=lambda item: -item[1]['total']):
+            linhas.append(f"{nome:<28} {dados['chamadas']:8d} {dados['total'] * 1e3:10.1f} "
+                          f"{dados['media'] * 1e3:9.3f} {dados['p50'] * 1e3:9.3f} {dados['p95'] * 1e3:9.3f} "
+                          f"{dados['maximo'] * 1e3:9.3f}")
+        return '\n'.join(linhas)
@@ -0,0 +1,104 @@
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon
+
+
+class GraficoDiagnostico:
+    # Figura única com um gráfico por consequente (depressão, ansiedade, TEA), reaproveitada em
+    # todas as consultas: as curvas dos termos são desenhadas uma vez e a cada diagnóstico só a
+    # área agregada de cada termo e o marcador do centróide são atualizados
+
+    def __init__(self, logica_fuzzy, figura=None):
+        self.logica_fuzzy = logica_fuzzy
+        self.figura = figura or Figure(figsize=(6.6, 1.9), dpi=100)
+        self.areas = []  # Por consequente: {termo: Polygon}
+        self.centroides = []  # Por consequente: Line2D do valor crisp
+        self._cria_eixos()
+
+    def _cria_eixos(self):
+        consequentes = self.logica_fuzzy.consequentes()
+        eixos = self.figura.subplots(1, len(consequentes), sharey=True)
+        for ax, variavel in zip(eixos, consequentes):
+            ax.set_ylim([0, 1.01])
+            ax.set_xlim([variavel.universe.min(), variavel.universe.max()])
+            ax.set_title(variavel.label, fontsize=9)
+            ax.tick_params(labelsize=7)
+            areas = {}
+            for rotulo, termo in variavel.terms.items():
+                linha, = ax.plot(variavel.universe, termo.mf, label=rotulo, lw=1)
+                areas[rotulo] = ax.add_patch(Polygon(np.zeros((1, 2)), closed=True, facecolor=linha.get_color(),
+                                                     alpha=0.4, visible=False))
+            centroide, = ax.plot([], [], color='k', lw=3)
+            self.areas.append(areas)
+            self.centroides.append(centroide)
+        eixos[-1].legend(fontsize=7, framealpha=0.5)
+        self.figura.tight_layout()
+
+    def atualiza(self, saida=None):
+        # Desenha o diagnóstico `saida` (padrão: o último calculado) sobre as curvas fixas
+        if saida is None:
+            saida = self.logica_fuzzy.saida_grafico()
+        for c, (areas, centroide) in enumerate(zip(self.areas, self.centroides)):
+            pontos, por_termo, valor, altura = self.logica_fuzzy.dados_consequente(c, saida)
+            for rotulo, area in areas.items():
+                if rotulo in por_termo:
+                    borda = np.column_stack([pontos, por_termo[rotulo]])
+                    area.set_xy(np.vstack([[pontos[0], 0.], borda, [pontos[-1], 0.]]))
+                area.set_visible(rotulo in por_termo)
+            if np.isnan(valor):
+                centroide.set_data([], [])
+            else:
+                centroide.set_data([valor, valor], [0, altura])
+        self.figura.canvas.draw_idle()
+
+    def limpa(self):
+        for areas, centroide in zip(self.areas, self.centroides):
+            for area in areas.values():
+                area.set_visible(False)
+            centroide.set_data([], [])
+        self.figura.canvas.draw_idle()
+
+
+if __name__ == '__main__':
+    # Teste de memória: milhares de consultas redesenhando o mesmo canvas; o RSS deve ficar estável
+    import os
+    import sys
+    import time
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    from LogicaFuzzy import LogicaFuzzy
+
+    def rss_mib():
+        # RSS atual (Linux); nos demais sistemas, o pico informado por resource
+        try:
+            with open('/proc/self/statm') as arquivo:
+                return int(arquivo.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+        except OSError:
+            import resource
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+    consultas = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    logica = LogicaFuzzy(motor='vetorizado', cache=False, modo_grafico='sob_demanda', registro=False)
+    grafico = GraficoDiagnostico(logica)
+    FigureCanvasAgg(grafico.figura)  # draw_idle() do canvas Agg redesenha na hora
+    nomes = [v.label for v in logica.antecedentes()]
+    rng = np.random.default_rng(0)
+
+    inicio = time.perf_counter()
+    medidas = []
+    for i in range(consultas):
+        entradas = dict(zip(nomes, rng.uniform(0, 5, len(nomes))))
+        try:
+            logica.calcula_diagnostico(entradas)
+        except KeyError:
+            pass
+        grafico.atualiza()
+        if i % (consultas // 10 or 1) == 0 or i == consultas - 1:
+            medidas.append(rss_mib())
+            print(f"consulta {i + 1:6d}: RSS {medidas[-1]:.1f} MiB")
+
+    # Descarta a primeira medida (aquecimento de caches do matplotlib)
+    crescimento = medidas[-1] - medidas[1] if len(medidas) > 2 else 0.
+    print(f"{consultas} consultas em {time.perf_counter() - inicio:.1f} s; "
+          f"crescimento do RSS após o aquecimento: {crescimento:+.1f} MiB")
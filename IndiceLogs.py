@@ -0,0 +1,313 @@
+import hashlib
+import json
+import math
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+
+
+class IndiceLogs:
+    # Índice colunar do log de diagnósticos (logs.txt, texto livre; também aceita as linhas JSON do
+    # RegistroDiagnosticos). Cada coluna é um arquivo binário de tamanho fixo por registro na pasta
+    # do índice (lido com np.memmap): instante, posição da linha no log, as 12 entradas, as 3 saídas
+    # (NaN sem regra), o indicador de regras não computadas, as ativações em formato esparso (fim de
+    # cada registro, regra e grau) e as anotações escritas à mão no log (só nos registros que têm).
+    # A conversão lê o log em fluxo, com memória constante, e continua do último byte processado:
+    # cada atualização só lê as linhas novas
+
+    FORMATO = 1
+    PASTA_PADRAO = 'logs_indice'
+    LOTE = 10000  # Registros mantidos em memória antes de gravar nas colunas
+    CABECALHO = 4096  # Bytes do início do log usados para detectar um log substituído ou rotacionado
+
+    ENTRADAS = ('anedonia', 'humor_deprimido', 'alteracao_sono', 'morte', 'rigidez_cog', 'medo', 'preoc_exc',
+                'comport_est', 'dif_inte_soc', 'doenca_pre_existente', 'sint_present_maior', 'seman_sint_present')
+    SAIDAS = ('depressao', 'ansiedade', 'tea')
+    ROTULOS_SAIDA = {'Dep.': 'depressao', 'Ans.': 'ansiedade', 'TEA': 'tea'}
+
+    # Colunas: nome -> tipo (um valor por registro, exceto as ativações e as anotações)
+    COLUNAS = {
+        'instante': '<f8',
+        'deslocamento': '<i8',
+        **{f"entrada.{nome}": '<f8' for nome in ENTRADAS},
+        **{f"saida.{nome}": '<f8' for nome in SAIDAS},
+        'sem_regras': 'u1',
+        'ativacoes_fim': '<i8',
+        'ativacoes_regra': '<i4',
+        'ativacoes_grau': '<f4',
+        'anotacao_registro': '<i8',
+    }
+    ARQUIVO_ANOTACOES = 'anotacoes.txt'
+
+    LINHA = re.compile(r"(\d\d)-(\d\d)-(\d{4}) (\d\d):(\d\d):(\d\d)(?:,\d+)? - .*?"
+                       r"\[Entradas => ([^\]]*)\] ?\[Saída => ([^\]]*)\]"
+                       r"(?:\[Regras Ativadas: \[([^\]]*)\]\])?")
+    REGRA = re.compile(r"\('(\d+)', '([-\d.]+)'\)")
+    SEM_REGRAS = 'REGRAS NÃO COMPUTADAS'
+
+    def __init__(self, arquivo_log='logs.txt', pasta=None):
+        self.arquivo_log = os.path.abspath(arquivo_log)
+        self.pasta = pasta or self.PASTA_PADRAO
+        self.metadados = self._le_metadados()
+
+    def _caminho(self, nome):
+        return os.path.join(self.pasta, nome)
+
+    def _metadados_vazios(self):
+        return {'formato': self.FORMATO, 'arquivo': self.arquivo_log, 'deslocamento': 0, 'cabecalho': None,
+                'registros': 0, 'ativacoes': 0, 'anotacoes': 0, 'linhas_ignoradas': 0, 'tamanhos': {}}
+
+    def _le_metadados(self):
+        try:
+            with open(self._caminho('indice.json'), encoding='utf-8') as arquivo:
+                metadados = json.load(arquivo)
+        except FileNotFoundError:
+            return self._metadados_vazios()
+        if metadados.get('formato') != self.FORMATO or metadados.get('arquivo') != self.arquivo_log:
+            return self._metadados_vazios()
+        return metadados
+
+    def _grava_metadados(self):
+        # Gravação atômica: o índice só passa a valer depois que as colunas já foram gravadas
+        temporario = self._caminho('indice.json.tmp')
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.metadados, arquivo, ensure_ascii=False, indent=1)
+        os.replace(temporario, self._caminho('indice.json'))
+
+    def _cabecalho(self, tamanho):
+        with open(self.arquivo_log, 'rb') as log:
+            return hashlib.sha1(log.read(min(tamanho, self.CABECALHO))).hexdigest()
+
+    def _reinicia(self):
+        for nome in [*self.COLUNAS, self.ARQUIVO_ANOTACOES]:
+            caminho = self._caminho(nome)
+            if os.path.exists(caminho):
+                os.remove(caminho)
+        self.metadados = self._metadados_vazios()
+
+    def atualiza(self, reconstroi=False):
+        # Acrescenta ao índice os registros gravados no log desde a última atualização.
+        # Retorna o número de registros novos
+        os.makedirs(self.pasta, exist_ok=True)
+        tamanho_log = os.path.getsize(self.arquivo_log)
+        inicio = self.metadados['deslocamento']
+        if reconstroi or tamanho_log < inicio or (
+                inicio and self.metadados['cabecalho'] != self._cabecalho(inicio)):
+            # Log substituído, truncado ou rotacionado: o índice é refeito do começo
+            inicio = 0
+        if inicio == 0:
+            self._reinicia()
+        # Descarta o que uma atualização interrompida tenha gravado depois dos últimos metadados
+        for nome, tamanho in self.metadados['tamanhos'].items():
+            if os.path.exists(self._caminho(nome)) and os.path.getsize(self._caminho(nome)) > tamanho:
+                os.truncate(self._caminho(nome), tamanho)
+
+        novos = 0
+        colunas = self._buffers()
+        for registro, fim in self.registros(inicio):
+            if registro is not None:
+                self._acrescenta(colunas, registro)
+                novos += 1
+            else:
+                self.metadados['linhas_ignoradas'] += 1
+            # Os metadados só avançam até o fim de um registro completo: anotações lidas depois do
+            # último registro são relidas na próxima atualização, junto com o registro a que pertencem
+            if registro is not None and len(colunas['instante']) >= self.LOTE:
+                self._descarrega(colunas, fim)
+                colunas = self._buffers()
+        if colunas['instante'] or self.metadados['deslocamento'] != self._fim_confirmado:
+            self._descarrega(colunas, self._fim_confirmado)
+        return novos
+
+    def _buffers(self):
+        return {nome: [] for nome in [*self.COLUNAS, self.ARQUIVO_ANOTACOES]}
+
+    def _acrescenta(self, colunas, registro):
+        linha = self.metadados['registros'] + len(colunas['instante'])
+        colunas['instante'].append(registro['instante'])
+        colunas['deslocamento'].append(registro['deslocamento'])
+        for nome in self.ENTRADAS:
+            colunas[f"entrada.{nome}"].append(registro['entradas'].get(nome, math.nan))
+        for nome in self.SAIDAS:
+            colunas[f"saida.{nome}"].append(registro['saidas'].get(nome, math.nan))
+        colunas['sem_regras'].append(registro['sem_regras'])
+        total = self.metadados['ativacoes'] + len(colunas['ativacoes_regra'])
+        for regra, grau in registro['ativacoes']:
+            colunas['ativacoes_regra'].append(regra)
+            colunas['ativacoes_grau'].append(grau)
+        colunas['ativacoes_fim'].append(total + len(registro['ativacoes']))
+        if registro['anotacao']:
+            colunas['anotacao_registro'].append(linha)
+            colunas[self.ARQUIVO_ANOTACOES].append(registro['anotacao'])
+
+    def _descarrega(self, colunas, deslocamento):
+        for nome, tipo in self.COLUNAS.items():
+            with open(self._caminho(nome), 'ab') as arquivo:
+                np.asarray(colunas[nome], dtype=tipo).tofile(arquivo)
+        with open(self._caminho(self.ARQUIVO_ANOTACOES), 'ab') as arquivo:
+            arquivo.write(''.join(texto + '\n' for texto in colunas[self.ARQUIVO_ANOTACOES]).encode('utf-8'))
+        self.metadados['registros'] += len(colunas['instante'])
+        self.metadados['ativacoes'] += len(colunas['ativacoes_regra'])
+        self.metadados['anotacoes'] += len(colunas['anotacao_registro'])
+        self.metadados['deslocamento'] = deslocamento
+        self.metadados['cabecalho'] = self._cabecalho(deslocamento)
+        self.metadados['tamanhos'] = {nome: os.path.getsize(self._caminho(nome))
+                                      for nome in [*self.COLUNAS, self.ARQUIVO_ANOTACOES]}
+        self._grava_metadados()
+
+    def registros(self, inicio=0):
+        # Lê o log a partir do byte `inicio` e gera (registro, byte final) para cada linha de diagnóstico,
+        # ou (None, byte final) para linhas com o formato de diagnóstico que não puderam ser lidas.
+        # Linhas de texto livre entre os registros são anotações do registro seguinte (ex.:
+        # "OK dep. moderada"), assim como textos antes/depois da linha (ex.: "ok 12-12-2024 ... OK").
+        # Uma última linha sem '\n' (ainda sendo gravada) fica para a próxima atualização
+        self._fim_confirmado = inicio
+        anotacoes = []
+        posicao = inicio
+        with open(self.arquivo_log, 'rb') as log:
+            log.seek(inicio)
+            for bruta in log:
+                if not bruta.endswith(b'\n'):
+                    break
+                deslocamento = posicao
+                posicao += len(bruta)
+                texto = bruta.decode('utf-8', errors='replace').strip()
+                if not texto or texto.startswith('//'):
+                    # Linhas em branco e separadores ("// ------")
+                    if not anotacoes:
+                        self._fim_confirmado = posicao
+                    continue
+                registro = self.le_linha(texto)
+                if registro is None:
+                    if '[Entradas =>' not in texto and not texto.startswith('{'):
+                        anotacoes.append(texto)
+                        continue
+                    anotacoes = []
+                    self._fim_confirmado = posicao
+                    yield None, posicao
+                    continue
+                registro['deslocamento'] = deslocamento
+                registro['anotacao'] = ' | '.join(anotacoes + ([registro['anotacao']] if registro['anotacao'] else []))
+                anotacoes = []
+                self._fim_confirmado = posicao
+                yield registro, posicao
+
+    def le_linha(self, texto):
+        # Registro de uma linha do log (texto ou JSON), ou None se a linha não for um diagnóstico
+        if texto.startswith('{'):
+            return self._le_json(texto)
+        m = self.LINHA.search(texto)
+        if m is None:
+            return None
+        dia, mes, ano, hora, minuto, segundo = (int(g) for g in m.groups()[:6])
+        entradas = {}
+        for par in m.group(7).split(','):
+            nome, _, valor = par.partition(':')
+            try:
+                entradas[nome.strip()] = float(valor)
+            except ValueError:
+                return None
+
+        saida = m.group(8)
+        saidas = {}
+        anotacao_saida = ''
+        if saida.startswith(self.SEM_REGRAS):
+            # "REGRAS NÃO COMPUTADAS PARA AS ENTRADAS - dep. grave, ans. moderada": o texto depois do
+            # traço foi acrescentado à mão
+            anotacao_saida = saida.partition(' - ')[2].strip()
+        else:
+            for par in saida.split(','):
+                rotulo, _, valor = par.rpartition(':')
+                if rotulo.strip() in self.ROTULOS_SAIDA:
+                    saidas[self.ROTULOS_SAIDA[rotulo.strip()]] = float(valor)
+
+        ativacoes = [(int(regra), float(grau)) for regra, grau in self.REGRA.findall(m.group(9) or '')]
+        anotacao = ' '.join(parte for parte in (texto[:m.start()].strip(), anotacao_saida,
+                                                  texto[m.end():].strip()) if parte)
+        return {
+            'instante': datetime(ano, mes, dia, hora, minuto, segundo).timestamp(),
+            'entradas': entradas,
+            'saidas': saidas,
+            'sem_regras': len(saidas) < len(self.SAIDAS),
+            'ativacoes': ativacoes,
+            'anotacao': anotacao,
+        }
+
+    def _le_json(self, texto):
+        try:
+            linha = json.loads(texto)
+            return {
+                'instante': float(linha['instante']),
+                'entradas': {nome: float(valor) for nome, valor in linha['entradas'].items()},
+                'saidas': {nome: float(valor) for nome, valor in linha['saidas'].items() if valor is not None},
+                'sem_regras': linha.get('tipo') == 'sem_regra',
+                'ativacoes': [(int(regra), float(grau)) for regra, grau in linha.get('ativacoes', [])],
+                'anotacao': '',
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+    # Consultas sobre o índice: as colunas são mapeadas do disco, sem carregar o log
+
+    def __len__(self):
+        return self.metadados['registros']
+
+    def coluna(self, nome):
+        tipo = self.COLUNAS[nome]
+        quantidade = self.metadados['tamanhos'].get(nome, 0) // np.dtype(tipo).itemsize
+        if quantidade == 0:
+            return np.empty(0, dtype=tipo)
+        return np.memmap(self._caminho(nome), dtype=tipo, mode='r', shape=(quantidade,))
+
+    def entradas(self):
+        # Matriz N x 12, colunas na ordem de LogicaFuzzy.antecedentes() (NaN onde a entrada faltava)
+        return np.column_stack([self.coluna(f"entrada.{nome}") for nome in self.ENTRADAS])
+
+    def saidas(self):
+        # Matriz N x 3 (depressão, ansiedade, TEA) registrada no log; NaN sem regra
+        return np.column_stack([self.coluna(f"saida.{nome}") for nome in self.SAIDAS])
+
+    def sem_regras(self):
+        return self.coluna('sem_regras').astype(bool)
+
+    def ativacoes(self, registro):
+        # [(regra, grau), ...] do registro, como em LogicaFuzzy.ativacoes()
+        fim = self.coluna('ativacoes_fim')
+        inicio = fim[registro - 1] if registro else 0
+        regras = self.coluna('ativacoes_regra')[inicio:fim[registro]]
+        graus = self.coluna('ativacoes_grau')[inicio:fim[registro]]
+        return [(int(regra), float(grau)) for regra, grau in zip(regras, graus)]
+
+    def anotacoes(self):
+        # {registro: texto} dos registros anotados à mão
+        if not self.metadados['anotacoes']:
+            return {}
+        with open(self._caminho(self.ARQUIVO_ANOTACOES), encoding='utf-8') as arquivo:
+            textos = [next(arquivo).rstrip('\n') for _ in range(self.metadados['anotacoes'])]
+        return dict(zip(self.coluna('anotacao_registro').tolist(), textos))
+
+
+if __name__ == '__main__':
+    # python IndiceLogs.py [logs.txt] [--indice logs_indice] [--reconstroi]
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Converte o log de diagnósticos em um índice colunar")
+    parser.add_argument('log', nargs='?', default='logs.txt')
+    parser.add_argument('--indice', default=IndiceLogs.PASTA_PADRAO, help="Pasta do índice")
+    parser.add_argument('--reconstroi', action='store_true', help="Refaz o índice desde o início do log")
+    args = parser.parse_args()
+
+    indice = IndiceLogs(args.log, args.indice)
+    inicio_leitura = indice.metadados['deslocamento']
+    inicio = time.perf_counter()
+    novos = indice.atualiza(args.reconstroi)
+    duracao = time.perf_counter() - inicio
+    lidos = indice.metadados['deslocamento'] - (0 if args.reconstroi else inicio_leitura)
+    print(f"{novos} registros novos ({max(lidos, 0) / 2**20:.1f} MiB lidos em {duracao:.2f} s); "
+          f"índice com {len(indice)} registros, {indice.metadados['ativacoes']} ativações, "
+          f"{indice.metadados['anotacoes']} anotados e {int(indice.sem_regras().sum())} sem regras")
+    if indice.metadados['linhas_ignoradas']:
+        print(f"{indice.metadados['linhas_ignoradas']} linhas de diagnóstico ilegíveis ignoradas")
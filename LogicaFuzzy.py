@@ -1,26 +1,101 @@
+import hashlib
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import numpy as np
 import skfuzzy as fuzz
 from skfuzzy import control as ctrl
-from CapturadorSaida import CapturadorSaida
-from RegrasAtivadas import RegrasAtivadas
-import logging
-
-# Configuração do log
-logging.basicConfig(
-    filename='logs.txt',
-    level=logging.INFO,
-    format='%(asctime)s - %(message)s',
-    datefmt='%d-%m-%Y %H:%M:%S'
-)
+from AtivacaoRegras import AtivacaoRegras
+from AvaliacaoIncremental import AvaliacaoIncremental
+from BaseRegras import BaseRegras
+from CacheDiagnosticos import CacheDiagnosticos
+from CronometroEtapas import CronometroEtapas
+from MotorVetorizado import MotorVetorizado
+from RegistroDiagnosticos import RegistroDiagnosticos
 
 class LogicaFuzzy:
+
+    MOTORES = ('skfuzzy', 'vetorizado')
+    MODOS_GRAFICO = ('nenhum', 'sob_demanda', 'segundo_plano')
+    ARQUIVO_ARTEFATO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'motor_compilado.npz')
+    # Tabela única de funções de pertinência (trapmf) de todos os antecedentes: termo -> [a, b, c, d]
+    TRAPEZIOS_ENTRADA = {'baixo': [0, 0, 1, 2], 'medio': [1, 2, 3, 4], 'alto': [3, 4, 6, 6]}
+    # Mesma tabela para os três consequentes (usada também pela defuzzificação analítica)
+    TRAPEZIOS_SAIDA = {'leve': [0, 0, 2, 4], 'moderado': [2, 4, 6, 8], 'grave': [6, 8, 10, 10]}
     
-    def __init__(self):
+    def __init__(self, motor='skfuzzy', arquivo_regras=None, cache=True,
+                 capacidade_cache=None, passo_cache=None, modo_grafico='nenhum', artefato=None, incremental=False,
+                 defuzzificacao='amostrada', resolucao_saida=None, registro=True, cronometro=None):
+        if motor not in self.MOTORES:
+            raise ValueError(f"Motor de inferência desconhecido: '{motor}'. Opções: {self.MOTORES}")
+        if incremental and motor != 'vetorizado':
+            raise ValueError("O modo incremental requer o motor 'vetorizado'")
+        if defuzzificacao not in MotorVetorizado.DEFUZZIFICACOES:
+            raise ValueError(f"Defuzzificação desconhecida: '{defuzzificacao}'. "
+                             f"Opções: {MotorVetorizado.DEFUZZIFICACOES}")
+        if defuzzificacao != 'amostrada' and motor != 'vetorizado':
+            raise ValueError("A defuzzificação analítica requer o motor 'vetorizado'")
+        if modo_grafico not in self.MODOS_GRAFICO:
+            raise ValueError(f"Modo de gráfico desconhecido: '{modo_grafico}'. Opções: {self.MODOS_GRAFICO}")
+        if resolucao_saida is not None:
+            passos = 10 / resolucao_saida
+            if resolucao_saida <= 0 or abs(passos - round(passos)) > 1e-9 * passos:
+                raise ValueError(f"resolucao_saida deve dividir o universo 0-10 em passos inteiros; "
+                                 f"recebido {resolucao_saida}")
+        self.motor = motor
+        # Gráficos das saídas fora do cálculo: 'nenhum' (lote), 'sob_demanda' (exibe_graficos() /
+        # desenha_graficos()) ou 'segundo_plano' (figuras prontas em self.graficos, um Future)
+        self.modo_grafico = modo_grafico
+        self.graficos = None
+        self.executor_graficos = None
+        self.pedido_grafico = None
+        self.trava_graficos = threading.Lock()
+        # Cache LRU de diagnósticos (chave nas entradas exatas, ou quantizadas se passo_cache); cache=False desliga
+        self.cache = CacheDiagnosticos(capacidade_cache, passo_cache) if cache else None
+        # Registro dos diagnósticos em JSON Lines, gravado em segundo plano: True (padrão) usa o
+        # arquivo padrão (diagnosticos.jsonl), um RegistroDiagnosticos usa o informado e False desliga.
+        # O arquivo e a thread de escrita só são criados no primeiro diagnóstico registrado
+        self.registro = RegistroDiagnosticos.compartilhado() if registro is True else registro
+        # Tempos de cada etapa do diagnóstico (desligado por padrão; ver CronometroEtapas)
+        self.cronometro = cronometro or CronometroEtapas.compartilhado()
+        self.defuzzificacao = defuzzificacao
+        # Passo do universo das saídas (padrão: 1, como no skfuzzy original); 10 / passo deve ser inteiro
+        self.resolucao_saida = resolucao_saida
         self.define_variaveis()
         self.define_funcoes_pertinencia()
-        self.define_regras()
-        self.diagnostico_ctrl = ctrl.ControlSystem(self.regras)
-        self.diagnostico_simulador = ctrl.ControlSystemSimulation(self.diagnostico_ctrl)
+        self.arquivo_regras = arquivo_regras
+        # Artefato .npz do motor vetorizado: carregado se estiver atualizado, senão regravado
+        self.artefato = artefato
+        self.base_regras = BaseRegras.carrega(arquivo_regras)
+        self.rotulos_consequentes = [f"{saida}[{termo}]" for _, (saida, termo) in self.base_regras.regras()]
+        self.motor_vetorizado = None
+        self.diagnostico_simulador = None
+        self.trava_skfuzzy = threading.Lock()
+        self.ultima_ativacao = None
+        self.ultima_saida = None
+        # Modo incremental: consultas sucessivas refazem só o que depende das entradas alteradas
+        self.incremental = incremental
+        self.avaliacao_incremental = None
+
+        if self.motor == 'vetorizado':
+            # Compila a base de regras direto em tabelas NumPy (dispensa os ctrl.Rule e o ControlSystem)
+            self._compila_motor()
+            if incremental:
+                self.avaliacao_incremental = self.nova_avaliacao_incremental()
+        else:
+            # No motor skfuzzy, o vetorizado é compilado sob demanda para o diagnóstico em lote
+            self.define_regras()
+            self.diagnostico_ctrl = ctrl.ControlSystem(self.regras)
+            self.diagnostico_simulador = self.novo_simulador()
+
+    def antecedentes(self):
+        # Mesma ordem dos campos da tela e do log
+        return [self.anedonia, self.humor_deprimido, self.alteracao_sono, self.morte, self.rigidez_cog,
+                self.medo, self.preoc_exc, self.comport_est, self.dif_inte_soc, self.doenca_pre_existente,
+                self.sint_present_maior, self.seman_sint_present]
+
+    def consequentes(self):
+        return [self.depressao, self.ansiedade, self.tea]
 
     def define_variaveis(self):
          # Variáveis de entrada
@@ -38,1573 +113,302 @@ class LogicaFuzzy:
         self.doenca_pre_existente = ctrl.Antecedent(np.arange(0, 6, 1), 'doenca_pre_existente') # Possui doença(a) pré-existente(s)?
 
         # Variáveis de saída
-        self.depressao = ctrl.Consequent(np.arange(0, 11, 1), 'depressao')
-        self.ansiedade = ctrl.Consequent(np.arange(0, 11, 1), 'ansiedade')
-        self.tea = ctrl.Consequent(np.arange(0, 11, 1), 'tea')
+        universo_saida = np.arange(0, 11, 1)
+        if self.resolucao_saida is not None:
+            universo_saida = np.linspace(0, 10, int(round(10 / self.resolucao_saida)) + 1)
+        self.depressao = ctrl.Consequent(universo_saida, 'depressao')
+        self.ansiedade = ctrl.Consequent(universo_saida, 'ansiedade')
+        self.tea = ctrl.Consequent(universo_saida, 'tea')
 
     def define_funcoes_pertinencia(self):
-        # Entrada
-        self.seman_sint_present['baixo'] = fuzz.trapmf(self.seman_sint_present.universe, [0, 0, 1, 2])
-        self.seman_sint_present['medio'] = fuzz.trapmf(self.seman_sint_present.universe, [1, 2, 3, 4])
-        self.seman_sint_present['alto'] = fuzz.trapmf(self.seman_sint_present.universe, [3, 4, 6, 6])
-
-        self.sint_present_maior['baixo'] = fuzz.trapmf(self.sint_present_maior.universe, [0, 0, 1, 2])
-        self.sint_present_maior['medio'] = fuzz.trapmf(self.sint_present_maior.universe, [1, 2, 3, 4])
-        self.sint_present_maior['alto'] = fuzz.trapmf(self.sint_present_maior.universe, [3, 4, 6, 6])
-
-        self.anedonia['baixo'] = fuzz.trapmf(self.anedonia.universe, [0, 0, 1, 2])
-        self.anedonia['medio'] = fuzz.trapmf(self.anedonia.universe, [1, 2, 3, 4])
-        self.anedonia['alto'] = fuzz.trapmf(self.anedonia.universe, [3, 4, 6, 6])
-
-        self.humor_deprimido['baixo'] = fuzz.trapmf(self.humor_deprimido.universe, [0, 0, 1, 2])
-        self.humor_deprimido['medio'] = fuzz.trapmf(self.humor_deprimido.universe, [1, 2, 3, 4])  
-        self.humor_deprimido['alto'] = fuzz.trapmf(self.humor_deprimido.universe, [3, 4, 6, 6])
-
-        self.alteracao_sono['baixo'] = fuzz.trapmf(self.alteracao_sono.universe, [0, 0, 1, 2])
-        self.alteracao_sono['medio'] = fuzz.trapmf(self.alteracao_sono.universe, [1, 2, 3, 4])
-        self.alteracao_sono['alto'] = fuzz.trapmf(self.alteracao_sono.universe, [3, 4, 6, 6])
-
-        self.medo['baixo'] = fuzz.trapmf(self.medo.universe, [0, 0, 1, 2])
-        self.medo['medio'] = fuzz.trapmf(self.medo.universe, [1, 2, 3, 4])
-        self.medo['alto'] = fuzz.trapmf(self.medo.universe, [3, 4, 6, 6])
-
-        self.preoc_exc['baixo'] = fuzz.trapmf(self.preoc_exc.universe, [0, 0, 1, 2])
-        self.preoc_exc['medio'] = fuzz.trapmf(self.preoc_exc.universe, [1, 2, 3, 4])
-        self.preoc_exc['alto'] = fuzz.trapmf(self.preoc_exc.universe, [3, 4, 6, 6])
-
-        self.comport_est['baixo'] = fuzz.trapmf(self.comport_est.universe, [0, 0, 1, 2])
-        self.comport_est['medio'] = fuzz.trapmf(self.comport_est.universe, [1, 2, 3, 4])
-        self.comport_est['alto'] = fuzz.trapmf(self.comport_est.universe, [3, 4, 6, 6])
-
-        self.dif_inte_soc['baixo'] = fuzz.trapmf(self.dif_inte_soc.universe, [0, 0, 1, 2])
-        self.dif_inte_soc['medio'] = fuzz.trapmf(self.dif_inte_soc.universe, [1, 2, 3, 4])
-        self.dif_inte_soc['alto'] = fuzz.trapmf(self.dif_inte_soc.universe, [3, 4, 6, 6])
-
-        self.morte['baixo'] = fuzz.trapmf(self.morte.universe, [0, 0, 1, 2])
-        self.morte['medio'] = fuzz.trapmf(self.morte.universe, [1, 2, 3, 4])
-        self.morte['alto'] = fuzz.trapmf(self.morte.universe, [3, 4, 6, 6])
-
-        self.rigidez_cog['baixo'] = fuzz.trapmf(self.rigidez_cog.universe, [0, 0, 1, 2])
-        self.rigidez_cog['medio'] = fuzz.trapmf(self.rigidez_cog.universe, [1, 2, 3, 4])
-        self.rigidez_cog['alto'] = fuzz.trapmf(self.rigidez_cog.universe, [3, 4, 6, 6])
-
-        self.doenca_pre_existente['baixo'] = fuzz.trapmf(self.doenca_pre_existente.universe, [0, 0, 1, 2])
-        self.doenca_pre_existente['medio'] = fuzz.trapmf(self.doenca_pre_existente.universe, [1, 2, 3, 4])
-        self.doenca_pre_existente['alto'] = fuzz.trapmf(self.doenca_pre_existente.universe, [3, 4, 6, 6])
+        # Entrada: os 12 antecedentes usam a mesma tabela de trapézios (TRAPEZIOS_ENTRADA)
+        for variavel in self.antecedentes():
+            for rotulo, pontos in self.TRAPEZIOS_ENTRADA.items():
+                variavel[rotulo] = fuzz.trapmf(variavel.universe, pontos)
 
         # Saída
-        self.depressao['leve'] = fuzz.trapmf(self.depressao.universe, [0, 0, 2, 4])
-        self.depressao['moderado'] = fuzz.trapmf(self.depressao.universe, [2, 4, 6, 8])
-        self.depressao['grave'] = fuzz.trapmf(self.depressao.universe,  [6, 8, 10, 10])
-
-        self.ansiedade['leve'] = fuzz.trapmf(self.ansiedade.universe, [0, 0, 2, 4])
-        self.ansiedade['moderado'] = fuzz.trapmf(self.ansiedade.universe, [2, 4, 6, 8])
-        self.ansiedade['grave'] = fuzz.trapmf(self.ansiedade.universe,   [6, 8, 10, 10])
-
-        self.tea['leve'] = fuzz.trapmf(self.tea.universe, [0, 0, 2, 4])
-        self.tea['moderado'] = fuzz.trapmf(self.tea.universe, [2, 4, 6, 8])
-        self.tea['grave'] = fuzz.trapmf(self.tea.universe,   [6, 8, 10, 10])
-
-    def define_regras(self): # 234 regras com a totalidade de var. e 24 abrangentes -> REGRAS DEFINIDAS
-        self.regras = []
-        
-        # PRIMEIRO PACK - CASOS ISOLADOS -----------------------------------------------------------------------------------------------------
-
-        '''Depressão LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule((self.anedonia['baixo'] | self.anedonia['medio']) & self.humor_deprimido['medio'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) 
-                                     & self.morte['baixo'] & self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & 
-                                     self.dif_inte_soc['baixo'] & self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['leve']))
-       
-        '''Depressão MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & (self.morte['baixo']  | self.morte['medio']) & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & 
-                                     (self.dif_inte_soc['baixo'] | self.dif_inte_soc['medio']) & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['baixo'] | self.sint_present_maior['medio']) & self.seman_sint_present['baixo'] ,
-                                     self.depressao['moderado']))
-        
-        '''Depressão GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & 
-                                    self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                    self.rigidez_cog['alto'] & self.medo['baixo'] & 
-                                    self.preoc_exc['baixo'] & self.comport_est['baixo'] & 
-                                    self.dif_inte_soc['alto'] & 
-                                    (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio'] | self.doenca_pre_existente['alto']) & 
-                                    self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                    self.depressao['grave']))
-        
-        '''Ansidade LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & 
-                                     (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['leve']))
-        '''Ansidade MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & self.preoc_exc['medio'] & 
-                                     self.comport_est['baixo'] & self.dif_inte_soc['medio'] & (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) &
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['moderado']))
-                                     
-        '''Ansidade GRAVE''' # Quadro 8
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & 
-                                    (self.alteracao_sono['medio'] | self.alteracao_sono['alto']) & 
-                                     self.morte['baixo'] & self.rigidez_cog['baixo'] & 
-                                     self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & 
-                                     (self.dif_inte_soc['medio'] | self.dif_inte_soc['alto']) & 
-                                     (self.doenca_pre_existente['medio'] | self.doenca_pre_existente['alto']) &
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['grave']))
-        
-        '''TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & (self.rigidez_cog['baixo'] | self.rigidez_cog['medio']) & self.medo['baixo'] & self.preoc_exc['baixo'] & 
-                                     self.comport_est['medio'] & self.dif_inte_soc['medio'] & self.doenca_pre_existente['baixo'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-        '''TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & (self.morte['baixo'] | self.morte['medio']) & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        '''TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['grave']))
-        
-        # DEMAIS SAÍDAS ---------------------------------------------------------------------------------------------------------------------------
-
-        ''''Quando depressão saída para ANSIEDADE'''
-        # Depressão LEVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule((self.anedonia['baixo'] | self.anedonia['medio']) & self.humor_deprimido['medio'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) 
-                                     & self.morte['baixo'] & self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & 
-                                     self.dif_inte_soc['baixo'] & self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-       
-        # Depressão MODERADO
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & (self.morte['baixo']  | self.morte['medio']) & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & 
-                                     (self.dif_inte_soc['baixo'] | self.dif_inte_soc['medio']) & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['baixo'] | self.sint_present_maior['medio']) & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-        
-        # Depressão GRAVE
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio'] | self.doenca_pre_existente['alto']) & 
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-        
-        ''''Quando depressão saída para TEA'''
-
-        # Depressão LEVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-        
-        self.regras.append(ctrl.Rule((self.anedonia['baixo'] | self.anedonia['medio']) & self.humor_deprimido['medio'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) 
-                                     & self.morte['baixo'] & self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & 
-                                     self.dif_inte_soc['baixo'] & self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-       
-        # Depressão MODERADO
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & (self.morte['baixo']  | self.morte['medio']) & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & 
-                                     (self.dif_inte_soc['baixo'] | self.dif_inte_soc['medio']) & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['baixo'] | self.sint_present_maior['medio']) & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-        
-        # Depressão GRAVE
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio'] | self.doenca_pre_existente['alto']) & 
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-        
-        # ----------------------------------
-
-        ''''Quando ansiedade saída para DEPRESSÃO'''
-        # Ansidade LEVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & 
-                                     (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-        # Ansidade MODERADO
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & self.preoc_exc['medio'] & 
-                                     self.comport_est['baixo'] & self.dif_inte_soc['medio'] & (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) &
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-        # Ansidade GRAVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['medio'] | self.alteracao_sono['alto']) & 
-                                     self.morte['baixo'] & self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & 
-                                     (self.dif_inte_soc['medio'] | self.dif_inte_soc['alto']) & (self.doenca_pre_existente['medio'] | self.doenca_pre_existente['alto']) &
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-        
-        ''''Quando ansiedade saída para TEA'''
-
-        # Ansidade LEVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & 
-                                     (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-        # Ansidade MODERADO
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & self.preoc_exc['medio'] & 
-                                     self.comport_est['baixo'] & self.dif_inte_soc['medio'] & (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) &
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-        # Ansidade GRAVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & 
-                                    (self.alteracao_sono['medio'] | self.alteracao_sono['alto']) & 
-                                    self.morte['baixo'] & self.rigidez_cog['baixo'] & self.medo['alto'] & 
-                                    self.preoc_exc['alto'] & self.comport_est['baixo'] & 
-                                    (self.dif_inte_soc['medio'] | self.dif_inte_soc['alto']) & 
-                                    (self.doenca_pre_existente['medio'] | self.doenca_pre_existente['alto']) &
-                                    self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                    self.tea['leve']))
-        
-        ''''Quando TEA saída para ANSIEDADE'''
-
-         # TEA LEVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & (self.rigidez_cog['baixo'] | self.rigidez_cog['medio']) & self.medo['baixo'] & self.preoc_exc['baixo'] & 
-                                     self.comport_est['medio'] & self.dif_inte_soc['medio'] & self.doenca_pre_existente['baixo'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        # TEA MODERADO
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & (self.morte['baixo'] | self.morte['medio']) & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        # TEA GRAVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        ''''Quando TEA saída para DEPRESSÃO'''
-
-          # TEA LEVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & (self.alteracao_sono['baixo'] | self.alteracao_sono['medio']) & 
-                                     self.morte['baixo'] & (self.rigidez_cog['baixo'] | self.rigidez_cog['medio']) & self.medo['baixo'] & self.preoc_exc['baixo'] & 
-                                     self.comport_est['medio'] & self.dif_inte_soc['medio'] & self.doenca_pre_existente['baixo'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        # TEA MODERADO
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & (self.morte['baixo'] | self.morte['medio']) & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        # TEA GRAVE
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-                
-        # SEGUNDO PACK - DEPRESSÃO E ANSIEDADE ---------------------------------------------------
-
-        '''Depressão LEVE e ansiedade MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Depressão MODERADO e ansiedade MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                self.depressao['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                self.ansiedade['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                self.tea['leve']))
-                                
-        '''Depressão GRAVE e ansiedade GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                     self.depressao['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                     self.ansiedade['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                     self.tea['leve']))
-
-        '''Ansiedade LEVE e depressão MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade LEVE e depressão GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade GRAVE e depressão LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade MODERADO e depressão GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['medio'] ,
-                                     self.depressao['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade GRAVE e depressão MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['alto'] | self.sint_present_maior['medio']) & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['alto'] | self.sint_present_maior['medio']) & self.seman_sint_present['medio'] ,
-                                     self.depressao['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['alto'] | self.sint_present_maior['medio']) & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-        
-        # ----- Acima estão 54 regras [18 regras distintas x 3]
-
-        '''Ansiedade LEVE e TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['alto'],
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['alto'],
-                                     self.tea['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['alto'],
-                                     self.depressao['leve']))
-
-        '''Ansiedade MODERADO e TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & self.sint_present_maior['medio'] & 
-                                     self.seman_sint_present['alto'] ,
-                                     self.ansiedade['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & self.sint_present_maior['medio'] & 
-                                     self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & self.sint_present_maior['medio'] & 
-                                     self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        
-        '''Ansiedade GRAVE e TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & (self.morte['alto'] | self.morte['medio']) & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['alto'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & (self.morte['alto'] | self.morte['medio']) & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['alto'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & (self.morte['alto'] | self.morte['medio']) & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['alto'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        '''Ansiedade LEVE e TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        '''Ansiedade LEVE e TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        '''Ansiedade MODERADO e TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        
-        '''Ansiedade GRAVE e TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        '''Ansiedade GRAVE e TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & 
-                                     (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & 
-                                     (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & 
-                                     (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        
-        '''Ansiedade MODERADO e TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & 
-                                     self.seman_sint_present['alto'] ,
-                                     self.ansiedade['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & 
-                                     self.seman_sint_present['alto'] ,
-                                     self.tea['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & 
-                                     self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        '''Depressão LEVE e TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        '''Depressão MODERADO e TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-
-        '''Depressão GRAVE e TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        '''Depressão LEVE e TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        '''Depressão LEVE e TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        '''Depressão MODERADO e TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-
-        '''Depressão GRAVE e TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        '''Depressão GRAVE e TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        '''Depressão MODERADO e TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.depressao['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.tea['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & (self.sint_present_maior['medio'] | self.sint_present_maior['alto']) & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        # ----- Acima estão 54 regras [18 regras distintas x 3] => 54 do começo + 54 do último intervalo = 108 regras 
-
-        '''Depressão MODERADO, Ansiedade LEVE, TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']),
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']),
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']),
-                                     self.tea['leve']))
-        
-        '''Depressão GRAVE, Ansiedade MODERADO, TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.depressao['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.tea['moderado']))
-        
-        '''Depressão LEVE, Ansiedade GRAVE, TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['medio'] | self.seman_sint_present['alto']),
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['medio'] | self.seman_sint_present['alto']),
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     (self.doenca_pre_existente['baixo'] | self.doenca_pre_existente['medio']) & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['medio'] | self.seman_sint_present['alto']),
-                                     self.tea['grave']))
-
-        '''Depressão LEVE, Ansiedade LEVE, TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        '''Depressão MODERADO, Ansiedade LEVE, TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.tea['moderado']))
-
-        '''Depressão MODERADO, Ansiedade LEVE, TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.tea['grave']))
-
-        '''Depressão GRAVE, Ansiedade LEVE, TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.tea['leve']))
-
-        '''Depressão GRAVE, Ansiedade LEVE, TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.tea['moderado']))
-        
-        '''Depressão GRAVE, Ansiedade LEVE, TEA GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['alto']) ,
-                                     self.tea['grave']))
-
-        '''Depressão MODERADO, Ansiedade GRAVE, TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['medio'] | self.seman_sint_present['alto']) ,
-                                     self.depressao['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['medio'] | self.seman_sint_present['alto']) ,
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['medio'] | self.seman_sint_present['alto']) ,
-                                     self.tea['leve']))
-        
-        '''Depressão LEVE, Ansiedade GRAVE, TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['medio'] | self.seman_sint_present['alto']) ,
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['medio'] | self.seman_sint_present['alto']) ,
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & (self.seman_sint_present['medio'] | self.seman_sint_present['alto']) ,
-                                     self.tea['moderado']))
-        
-        '''Depressão GRAVE, Ansiedade GRAVE, TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['baixo'] | self.seman_sint_present['medio'] | self.seman_sint_present['alto']),
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['baixo'] | self.seman_sint_present['medio'] | self.seman_sint_present['alto']),
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['baixo'] | self.seman_sint_present['medio'] | self.seman_sint_present['alto']),
-                                     self.tea['moderado']))
-        
-        # CASOS DE TESTES (REFINAMENTO) ------------------------------------
-
-        '''Depressão GRAVE, Ansiedade LEVE, TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-
-        '''Depressão GRAVE, Ansiedade MODERADO''' #
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-        
-        '''Depressão LEVE, Ansiedade GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-        
-        '''Depressão GRAVE, Ansiedade GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['medio'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['medio'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['medio'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-        
-        '''Depressão GRAVE, Ansiedade GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-
-        '''Depressão GRAVE, TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['alto'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-        
-        '''Depressão GRAVE, Ansiedade GRAVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']) ,
-                                     self.depressao['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']) ,
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['alto'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & 
-                                     (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']) ,
-                                     self.tea['leve']))
-
-        '''Depressão MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        
-        # VISUAL -----------------------------
-        '''Depressão GRAVE, Ansiedade MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-
-        '''Depressão LEVE, Ansiedade LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-
-        '''Depressão LEVE, Ansiedade MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-                                     
-        '''Ansiedade GRAVE, Depressão MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['alto'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade GRAVE, Depressão LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade MODERADO, Depressão MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                     self.depressao['moderado'])) 
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                     self.ansiedade['moderado']))   
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & (self.medo['baixo'] | self.medo['medio']) & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & (self.seman_sint_present['baixo'] | self.seman_sint_present['medio']),
-                                     self.tea['leve']))         
-
-        '''Ansiedade LEVE, Depressão LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Depressão MODERADO, Ansiedade MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['medio'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Depressão MODERADO, Ansiedade MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade GRAVE, Depressão MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['grave']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-        
-        '''Ansiedade MODERADO, Depressão LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['alto'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        '''TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & 
-                                     self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & 
-                                     self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & 
-                                     self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        '''TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & 
-                                     self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & 
-                                     self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['medio'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & (self.preoc_exc['baixo'] | self.preoc_exc['medio']) & 
-                                     self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        '''Depressão MODERADO, Ansiedade MODERADO, TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['alto'] & self.morte['medio'] & 
-                                     self.rigidez_cog['alto'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        '''Depressão MODERADO, TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['medio'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-        
-        '''Ansiedade MODERADO, TEA MODERADO'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['alto'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['alto'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-        
-        '''TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade MODERADO, TEA LEVE''' 
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['medio'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['medio'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-        
-        '''TEA LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['medio'] & self.morte['baixo'] & 
-                                     self.rigidez_cog['medio'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['medio'] & self.dif_inte_soc['alto'] & 
-                                     self.doenca_pre_existente['baixo'] & self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['leve']))
-
-        '''Ansiedade MODERADO, Depressão LEVE'''
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                    self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                    self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                    self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                    self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                    self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                    self.ansiedade['moderado']))
-        
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-                                    self.rigidez_cog['baixo'] & self.medo['alto'] & self.preoc_exc['medio'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-                                    self.doenca_pre_existente['baixo'] & self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                    self.tea['leve']))
-
-
-        # Quando há pensamento de morte --------------------------------------------------------------------------------------------
-        # Moderado
-        # self.regras.append(ctrl.Rule(self.morte['medio'] | self.morte['alto'],
-        #                      self.depressao['moderado']))
-        
-        # self.regras.append(ctrl.Rule(self.morte['medio'] | self.morte['alto'],
-        #                      self.ansiedade['leve']))
-        
-        # self.regras.append(ctrl.Rule(self.morte['medio'] | self.morte['alto'],
-        #                      self.tea['moderado']))
-
-        # Depressão - Anedonia e humor deprimido
-        # self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'],
-        #                             self.depressao['moderado']))
-
-        # self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'],
-        #                             self.ansiedade['leve']))
-
-        # self.regras.append(ctrl.Rule(self.anedonia['medio'] & self.humor_deprimido['medio'],
-        #                             self.tea['leve']))
-
-        # Algumas variáveis [ÚLTIMAS REGRAS]------------------------------------------------------------------------------------------
-
-        # DEPRESSÃO
-
-            # Moderado
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['medio'] & self.morte['medio'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['moderado']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['medio'] & self.morte['medio'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['medio'] & self.morte['medio'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-
-            # Grave
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.morte['alto'] & 
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.depressao['grave']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.morte['alto'] & 
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.ansiedade['leve']))
-
-        self.regras.append(ctrl.Rule(self.anedonia['alto'] & self.humor_deprimido['alto'] & self.morte['alto'] & 
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['baixo'] ,
-                                     self.tea['leve']))
-        
-         # ANSIEDADE
-
-            # Moderado
-        self.regras.append(ctrl.Rule(self.alteracao_sono['medio'] & self.medo['medio'] & self.preoc_exc['medio'] &
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.alteracao_sono['medio'] & self.medo['medio'] & self.preoc_exc['medio'] &
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['moderado']))
-
-        self.regras.append(ctrl.Rule(self.alteracao_sono['medio'] & self.medo['medio'] & self.preoc_exc['medio'] &
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-            # Grave
-        self.regras.append(ctrl.Rule(self.alteracao_sono['alto'] & self.medo['alto'] & self.preoc_exc['alto'] &
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.alteracao_sono['alto'] & self.medo['alto'] & self.preoc_exc['alto'] &
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.ansiedade['grave']))
-
-        self.regras.append(ctrl.Rule(self.alteracao_sono['alto'] & self.medo['alto'] & self.preoc_exc['alto'] &
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['medio'] ,
-                                     self.tea['leve']))
-
-        # TEA
-
-            # Moderado
-        self.regras.append(ctrl.Rule(self.rigidez_cog['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.rigidez_cog['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-
-        self.regras.append(ctrl.Rule(self.rigidez_cog['medio'] & self.comport_est['medio'] & self.dif_inte_soc['medio'] & 
-                                     self.sint_present_maior['medio'] & self.seman_sint_present['alto'] ,
-                                     self.tea['moderado']))
-
-            # Grave
-        self.regras.append(ctrl.Rule(self.rigidez_cog['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.depressao['leve']))
-
-        self.regras.append(ctrl.Rule(self.rigidez_cog['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.ansiedade['leve']))
-
-        self.regras.append(ctrl.Rule(self.rigidez_cog['alto'] & self.comport_est['alto'] & self.dif_inte_soc['alto'] & 
-                                     self.sint_present_maior['alto'] & self.seman_sint_present['alto'] ,
-                                     self.tea['grave']))
-
-        
-
-        # Para copiar apenas abaixo
-
-        # self.regras.append(ctrl.Rule(self.anedonia['baixo'] & self.humor_deprimido['baixo'] & self.alteracao_sono['baixo'] & self.morte['baixo'] & 
-        #                              self.rigidez_cog['baixo'] & self.medo['baixo'] & self.preoc_exc['baixo'] & self.comport_est['baixo'] & self.dif_inte_soc['baixo'] & 
-        #                              self.doenca_pre_existente['baixo'] & self.sint_present_maior['baixo'] & self.seman_sint_present['baixo'] ,
-        #                              self.depressao['leve']))
+        for variavel in self.consequentes():
+            for rotulo, pontos in self.TRAPEZIOS_SAIDA.items():
+                variavel[rotulo] = fuzz.trapmf(variavel.universe, pontos)
+
+    def trapezios_entrada(self):
+        # Parâmetros [a, b, c, d] de cada (antecedente, termo) para a fuzzificação analítica: V x T x 4
+        return np.array([[self.TRAPEZIOS_ENTRADA[rotulo] for rotulo in variavel.terms]
+                         for variavel in self.antecedentes()], dtype=np.float64)
+
+    def trapezios_saida(self):
+        # Parâmetros [a, b, c, d] de cada (consequente, termo) para a defuzzificação analítica: C x T x 4
+        return np.array([[self.TRAPEZIOS_SAIDA[rotulo] for rotulo in variavel.terms]
+                         for variavel in self.consequentes()], dtype=np.float64)
+
+    def define_regras(self):
+        # Regras do skfuzzy montadas a partir da base declarada em regras.csv
+        variaveis = {v.label: v for v in self.antecedentes() + self.consequentes()}
+        self.regras = self.base_regras.regras_skfuzzy(variaveis)
+        self.invalida_cache()
+
+    def invalida_cache(self):
+        # Chamar sempre que a base de regras ou as funções de pertinência forem alteradas
+        if self.cache is not None:
+            self.cache.invalida()
 
     def calcula_diagnostico(self, entradas):
+        saidas, self.ultima_ativacao, self.ultima_saida = self.infere(
+            entradas, self.diagnostico_simulador, self.avaliacao_incremental)
 
-        for chave, valor in entradas.items():
-            self.diagnostico_simulador.input[chave] = valor
-        self.diagnostico_simulador.compute()
-
-        self.depressao.view(sim=self.diagnostico_simulador)
-        self.ansiedade.view(sim=self.diagnostico_simulador)
-        self.tea.view(sim=self.diagnostico_simulador)
+        if self.modo_grafico == 'segundo_plano':
+            # Desenho em outra thread sobre o resultado desta consulta; o diagnóstico não espera. Só as
+            # ativações (e os cortes, se já existem) vão junto: a reconstrução também fica na outra thread
+            self._agenda_graficos(self.ultima_ativacao, self.ultima_saida)
 
-        self.grava_log(entradas)
+        self.grava_log(entradas, saidas)
        
         return {
-            'depressao': self.diagnostico_simulador.output['depressao'],
-            'ansiedade': self.diagnostico_simulador.output['ansiedade'],
-            'tea': self.diagnostico_simulador.output['tea']
+            'depressao': saidas['depressao'],
+            'ansiedade': saidas['ansiedade'],
+            'tea': saidas['tea']
         }
 
-    def ativacoes(self):
-        # Armazena saída do terminal em um buffer e guarda em uma variável 
-        capturador = CapturadorSaida(self.diagnostico_simulador)
-        stringInf = capturador.capturar_inf() 
-        # print(stringInf)  # Imprime inf. sobre o funcionamento interno de um ControlSystemSimulation
-
-        regrasAtivadas = RegrasAtivadas(stringInf) # Obtém somente regra e grau de ativação das regras
-        regrasAtivadas.imprimir_ativacoes()
-        
-        return regrasAtivadas.obter_ativacoes()
+    def infere(self, entradas, simulador=None, incremental=None, motor=None):
+        # Inferência sem gravar estado na instância; segura para várias threads (ver PoolContextos).
+        # incremental: AvaliacaoIncremental da sequência de consultas (motor vetorizado).
+        # motor: 'vetorizado' usa o motor compilado mesmo em uma instância skfuzzy (mesmos valores).
+        # Retorna (saídas, AtivacaoRegras, (valores, ativações, cortes) ou None no skfuzzy)
+        chave = resultado = None
+        if self.cache is not None:
+            with self.cronometro.etapa('cache'):
+                chave = self.cache.chave([entradas[v.label] for v in self.antecedentes()])
+                resultado = self.cache.obtem(chave)
+
+        if resultado is None:
+            if (motor or self.motor) == 'vetorizado':
+                self._compila_motor()
+                resultado = self._calcula_vetorizado(entradas, incremental)
+            else:
+                # As entradas do skfuzzy ficam nos Antecedents (compartilhados por todos os simuladores
+                # do mesmo ControlSystem): atribuição, cálculo e leitura precisam ser atômicos
+                with self.trava_skfuzzy:
+                    with self.cronometro.etapa('entradas'):
+                        for nome, valor in entradas.items():
+                            simulador.input[nome] = valor
+                    with self.cronometro.etapa('compute'):
+                        simulador.compute()
+                    saidas = dict(simulador.output)
+                    # Grau de disparo de cada regra, lido do próprio simulador (mesmo valor do print_state)
+                    with self.cronometro.etapa('leitura_ativacoes'):
+                        ativacao = AtivacaoRegras(
+                            [regra.consequent[0].activation[simulador] for regra in self.regras],
+                            self.rotulos_consequentes)
+                # Cortes dos gráficos calculados só quando pedidos (saida_grafico)
+                resultado = (saidas, ativacao, None)
+            if chave is not None:
+                self.cache.guarda(chave, resultado)
+        return resultado
+
+    def novo_simulador(self):
+        # Simulador do skfuzzy (estado de uma consulta) sobre o ControlSystem compartilhado
+        return ctrl.ControlSystemSimulation(self.diagnostico_ctrl) if self.motor == 'skfuzzy' else None
+
+    def nova_avaliacao_incremental(self):
+        # Estado incremental de uma sequência de consultas sobre o motor compilado
+        return AvaliacaoIncremental(self._compila_motor())
+
+    @staticmethod
+    def chave_artefato(arquivo_regras=None, resolucao_saida=None):
+        # Hash das fontes do motor compilado: a base de regras e este módulo (variáveis e funções
+        # de pertinência), além da versão do formato do artefato e da resolução das saídas
+        h = hashlib.sha256(f"formato {MotorVetorizado.FORMATO_ARTEFATO};".encode())
+        if resolucao_saida is not None:
+            h.update(f"resolucao_saida {resolucao_saida!r};".encode())
+        for caminho in (arquivo_regras or BaseRegras.ARQUIVO_PADRAO, os.path.abspath(__file__)):
+            with open(caminho, 'rb') as arquivo:
+                h.update(arquivo.read())
+        return h.hexdigest()
+
+    def _compila_motor(self):
+        if self.motor_vetorizado is None:
+            chave = None
+            if self.artefato is not None:
+                chave = self.chave_artefato(self.arquivo_regras, self.resolucao_saida)
+                try:
+                    self.motor_vetorizado = MotorVetorizado.carrega(self.artefato, chave)
+                    self.motor_vetorizado.defuzzificacao = self.defuzzificacao
+                    return self.motor_vetorizado
+                except (OSError, ValueError):
+                    pass  # Artefato ausente ou desatualizado: compila e grava de novo
+            self.base_regras.valida({v.label: v for v in self.antecedentes() + self.consequentes()})
+            self.motor_vetorizado = MotorVetorizado(self.antecedentes(), self.consequentes(), self.base_regras.regras(),
+                                                    defuzzificacao=self.defuzzificacao,
+                                                    trapezios_entrada=self.trapezios_entrada(),
+                                                    trapezios_saida=self.trapezios_saida())
+            if chave is not None:
+                self.motor_vetorizado.salva(self.artefato, chave)
+        return self.motor_vetorizado
+
+    def diagnostico_lote(self, entradas):
+        # Diagnóstico de N pacientes em uma única passada vetorizada.
+        # entradas: matriz N x 12 (colunas na ordem de antecedentes()) ou dict {variavel: coluna}.
+        # Retorna matriz N x 3 (depressão, ansiedade, TEA), com NaN nas saídas sem regra ativada,
+        # e a máscara das linhas sem regras computadas (onde calcula_diagnostico lançaria KeyError)
+        X = self._compila_motor().matriz_lote(entradas)
+        saidas, _, _ = self.motor_vetorizado.avalia(X)
+        return saidas, np.isnan(saidas).any(axis=1)
+
+    def previa(self, entradas, incremental=None):
+        # Diagnóstico rápido para a pré-visualização da tela: sempre pelo motor compilado (mesmos
+        # valores do skfuzzy), sem log e sem alterar o último diagnóstico. Saídas sem regra ficam ausentes
+        motor = self._compila_motor()
+        X = motor.matriz_entradas(entradas)
+        valores = (incremental.avalia(X) if incremental is not None else motor.avalia(X))[0][0]
+        return {nome: valor for nome, valor in zip(motor.nomes_saida, valores) if not np.isnan(valor)}
+
+    def _calcula_vetorizado(self, entradas, incremental=None):
+        motor = self.motor_vetorizado
+        X = motor.matriz_entradas(entradas)
+        if incremental is not None:
+            with self.cronometro.etapa('inferencia_incremental'):
+                valores, ativacoes, cortes = incremental.avalia(X)
+        else:
+            # Mesmas etapas de MotorVetorizado.avalia, cada uma com o seu cronômetro
+            with self.cronometro.etapa('fuzzificacao'):
+                mu = motor.fuzzifica(X)
+            with self.cronometro.etapa('regras'):
+                ativacoes = motor.ativa_regras(mu)
+            with self.cronometro.etapa('agregacao'):
+                cortes = motor.agrega(ativacoes)
+            with self.cronometro.etapa('defuzzificacao'):
+                valores = motor.defuzzifica(cortes)
+        # Assim como no skfuzzy, saídas sem regra ativada ficam ausentes (KeyError ao acessar)
+        saidas = {nome: valor for nome, valor in zip(self.motor_vetorizado.nomes_saida, valores[0])
+                  if not np.isnan(valor)}
+        # Sem gráficos, os cortes não são guardados (nem no cache); saida_grafico() os reconstrói se pedidos
+        saida = (valores[0], ativacoes[0], cortes) if self.modo_grafico != 'nenhum' else None
+        return saidas, AtivacaoRegras(ativacoes[0], self.rotulos_consequentes), saida
+
+    def saida_grafico(self):
+        # (valores, ativações, cortes) do último diagnóstico, de onde saem todos os gráficos
+        if self.ultima_saida is None:
+            if self.ultima_ativacao is None:
+                raise ValueError("Nenhum diagnóstico calculado para exibir os gráficos")
+            with self.cronometro.etapa('reconstroi_saida'):
+                self.ultima_saida = self.reconstroi_saida(self.ultima_ativacao)
+        return self.ultima_saida
+
+    def reconstroi_saida(self, ativacao):
+        # No skfuzzy o simulador pode já guardar outra consulta (cache): os cortes e os valores
+        # são refeitos a partir das ativações, com o mesmo resultado do skfuzzy
+        motor = self._compila_motor()
+        graus = ativacao.graus[None, :]
+        cortes = motor.agrega(graus)
+        return motor.defuzzifica(cortes)[0], graus[0], cortes
+
+    def exibe_graficos(self):
+        # Abre uma janela do matplotlib por consequente com o último diagnóstico (modo sob demanda)
+        if self.modo_grafico == 'nenhum':
+            raise ValueError("Gráficos desativados (modo_grafico='nenhum')")
+        import matplotlib.pyplot as plt
+
+        saida = self.saida_grafico()
+        for c in range(len(self.consequentes())):
+            fig, ax = plt.subplots()
+            self.desenha_consequente(ax, c, saida)
+            fig.show()
+
+    def desenha_graficos(self, saida=None):
+        # Figuras do último diagnóstico (ou de `saida`) montadas sem o pyplot, para embutir em outra
+        # tela ou gravar em arquivo
+        from matplotlib.figure import Figure
+
+        if saida is None:
+            saida = self.saida_grafico()
+        figuras = []
+        for c in range(len(self.consequentes())):
+            figura = Figure()
+            self.desenha_consequente(figura.subplots(), c, saida)
+            figuras.append(figura)
+        return figuras
+
+    def _renderiza_graficos(self, ativacao, saida=None):
+        # Tarefa do modo segundo_plano: reconstrói (se preciso), monta e rasteriza as figuras fora
+        # da thread do diagnóstico
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        if saida is None:
+            with self.cronometro.etapa('reconstroi_saida'):
+                saida = self.reconstroi_saida(ativacao)
+        with self.cronometro.etapa('graficos'):
+            figuras = self.desenha_graficos(saida)
+            for figura in figuras:
+                FigureCanvasAgg(figura).draw()
+        return figuras
+
+    def _agenda_graficos(self, ativacao, saida):
+        # Só o pedido mais recente aguarda: um desenho ainda não iniciado é cancelado e substituído,
+        # então no máximo um roda e um espera, por mais rápido que cheguem as consultas
+        futuro = Future()
+        with self.trava_graficos:
+            if self.graficos is not None:
+                self.graficos.cancel()
+            self.graficos = futuro
+            anterior, self.pedido_grafico = self.pedido_grafico, (futuro, ativacao, saida)
+            if anterior is None:
+                self._executor_graficos().submit(self._processa_graficos)
+
+    def _processa_graficos(self):
+        with self.trava_graficos:
+            (futuro, ativacao, saida), self.pedido_grafico = self.pedido_grafico, None
+        if not futuro.set_running_or_notify_cancel():
+            return
+        try:
+            futuro.set_result(self._renderiza_graficos(ativacao, saida))
+        except Exception as erro:
+            futuro.set_exception(erro)
+
+    def _executor_graficos(self):
+        if self.executor_graficos is None:
+            self.executor_graficos = ThreadPoolExecutor(max_workers=1, thread_name_prefix='graficos')
+        return self.executor_graficos
+
+    def dados_consequente(self, c, saida):
+        # Geometria do gráfico do consequente c: universo reamostrado, saída cortada de cada termo
+        # ativado, valor crisp (NaN sem regra) e altura do marcador do centróide
+        variavel = self.consequentes()[c]
+        valores, _, cortes = saida
+        pontos, _, por_termo = self._compila_motor().pertinencias_agregadas(cortes, c)
+        altura = np.nan
+        if not np.isnan(valores[c]):
+            altura = max(np.interp(valores[c], variavel.universe, termo.mf, left=0., right=0.)
+                         for rotulo, termo in variavel.terms.items() if rotulo in por_termo)
+            altura = altura if altura >= 0.1 else 1.
+        return pontos[0], {rotulo: corte[0] for rotulo, corte in por_termo.items()}, valores[c], altura
+
+    def desenha_consequente(self, ax, c, saida):
+        # Mesmo desenho de FuzzyVariable.view(sim=...), a partir dos cortes do motor vetorizado
+        variavel = self.consequentes()[c]
+        pontos, por_termo, valor, altura = self.dados_consequente(c, saida)
+
+        ax.set_ylim([0, 1.01])
+        ax.set_xlim([variavel.universe.min(), variavel.universe.max()])
+        for rotulo, termo in variavel.terms.items():
+            linha = ax.plot(variavel.universe, termo.mf, label=rotulo, lw=1)
+            if rotulo in por_termo:
+                ax.fill_between(pontos, np.zeros_like(pontos), por_termo[rotulo],
+                                facecolor=linha[0].get_color(), alpha=0.4)
+
+        if not np.isnan(valor):
+            ax.plot([valor] * 2, [0, altura], color='k', lw=3, label='crisp value')
+
+        ax.set_ylabel('Membership')
+        ax.set_xlabel(variavel.label)
+        ax.legend(framealpha=0.5)
 
-        # diagnostico_simulador.print_state()
-
-    def grava_log(self, entradas):
-        entradas_formatadas = []
-        linha = f"TESTES | "
-        linha += "[Entradas => "
-        for chave, valor in entradas.items():
-            entradas_formatadas.append(f"{chave}: {round(valor, 2):.2f}, ")
-        
-        # Remove a última vírgula e espaço
-        entradas_formatadas[-1] = entradas_formatadas[-1].rstrip(', ')
-        
-        linha += ''.join(entradas_formatadas) + "] [Saída => "
-        linha += f"Dep.: {round(self.diagnostico_simulador.output['depressao'], 2):.2f}, "
-        linha += f"Ans.: {round(self.diagnostico_simulador.output['ansiedade'], 2):.2f}, "
-        linha += f"TEA: {round(self.diagnostico_simulador.output['tea'], 2):.2f}]"
-        
-        regras_ativadas = self.ativacoes()
-        regras_formatadas = [(regra[0], f"{float(regra[1]):.2f}") for regra in regras_ativadas]
-        
-        linha += f"[Regras Ativadas: {regras_formatadas}"
-        linha += ']'
-        logging.info(linha)
+    def ativacoes(self):
+        # Regras ativadas no último diagnóstico: [(número da regra, grau), ...]
+        return self.ultima_ativacao.obter_ativacoes()
+
+    def grava_log(self, entradas, saidas, ativacao=None):
+        # Só enfileira; a formatação e a escrita ficam com a thread do RegistroDiagnosticos.
+        # Saídas sem regra ativada são registradas como null (tipo 'sem_regra')
+        if self.registro:
+            with self.cronometro.etapa('grava_log'):
+                self.registro.registra(entradas, saidas, ativacao if ativacao is not None else self.ultima_ativacao)
@@ -0,0 +1,138 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from MotorVetorizado import MotorVetorizado
+
+
+class LoteParalelo:
+    # Diagnóstico em lote distribuído entre processos. Entradas e saídas ficam em memória compartilhada
+    # (multiprocessing.shared_memory): cada tarefa recebe só os nomes dos blocos de memória e o intervalo
+    # de linhas, sem serializar as linhas. Cada processo carrega o motor compilado uma única vez, a
+    # partir do artefato .npz (MotorVetorizado.carrega, sem importar o skfuzzy)
+
+    TAMANHO_BLOCO_PADRAO = 2048  # Linhas por tarefa
+
+    _motor = None  # Motor do processo trabalhador, carregado em _inicializa
+
+    def __init__(self, trabalhadores=None, tamanho_bloco=None, artefato=None, arquivo_regras=None):
+        from LogicaFuzzy import LogicaFuzzy
+
+        # Grava (ou confere) o artefato antes de criar os processos, que só o carregam
+        self.artefato = artefato or LogicaFuzzy.ARQUIVO_ARTEFATO
+        logica = LogicaFuzzy(motor='vetorizado', arquivo_regras=arquivo_regras, cache=False, artefato=self.artefato)
+        self.motor = logica.motor_vetorizado
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self.tamanho_bloco = tamanho_bloco or self.TAMANHO_BLOCO_PADRAO
+        self.executor = ProcessPoolExecutor(self.trabalhadores, initializer=LoteParalelo._inicializa,
+                                            initargs=(self.artefato, LogicaFuzzy.chave_artefato(arquivo_regras)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fecha()
+
+    def fecha(self):
+        self.executor.shutdown()
+
+    def diagnostica(self, entradas):
+        # Mesmo contrato de LogicaFuzzy.diagnostico_lote: (saídas N x 3 com NaN, máscara sem regra)
+        saidas = self._distribui(self.motor.matriz_lote(entradas), 'diagnostico')
+        return saidas, np.isnan(saidas).any(axis=1)
+
+    def sem_regra(self, entradas):
+        # N x 3 booleano: saídas sem nenhuma regra ativada (onde o diagnóstico seria NaN), sem defuzzificar
+        return self._distribui(self.motor.matriz_lote(entradas), 'cobertura') > 0
+
+    def _distribui(self, X, etapa):
+        n = X.shape[0]
+        formato_saidas = (n, len(self.motor.nomes_saida))
+        memoria_entradas = shared_memory.SharedMemory(create=True, size=max(X.nbytes, 1))
+        memoria_saidas = shared_memory.SharedMemory(create=True, size=max(n * formato_saidas[1] * 8, 1))
+        try:
+            compartilhada = np.ndarray(X.shape, dtype=np.float64, buffer=memoria_entradas.buf)
+            compartilhada[:] = X
+            del compartilhada
+
+            tarefas = [self.executor.submit(LoteParalelo._avalia_bloco, memoria_entradas.name, memoria_saidas.name,
+                                            n, inicio, min(inicio + self.tamanho_bloco, n), etapa)
+                       for inicio in range(0, n, self.tamanho_bloco)]
+            for tarefa in tarefas:
+                tarefa.result()
+
+            compartilhada = np.ndarray(formato_saidas, dtype=np.float64, buffer=memoria_saidas.buf)
+            saidas = compartilhada.copy()
+            del compartilhada
+        finally:
+            for memoria in (memoria_entradas, memoria_saidas):
+                memoria.close()
+                memoria.unlink()
+        return saidas
+
+    @staticmethod
+    def _inicializa(artefato, chave):
+        LoteParalelo._motor = MotorVetorizado.carrega(artefato, chave)
+
+    @staticmethod
+    def _avalia_bloco(nome_entradas, nome_saidas, n, inicio, fim, etapa='diagnostico'):
+        # Executado no trabalhador: lê as linhas [inicio, fim) e grava as saídas no mesmo intervalo.
+        # etapa 'cobertura': grava 1 nas saídas sem regra ativada (todos os cortes zero) e 0 nas demais
+        motor = LoteParalelo._motor
+        memoria_entradas = shared_memory.SharedMemory(name=nome_entradas)
+        memoria_saidas = shared_memory.SharedMemory(name=nome_saidas)
+        try:
+            X = np.ndarray((n, len(motor.nomes_entrada)), dtype=np.float64, buffer=memoria_entradas.buf)
+            saidas = np.ndarray((n, len(motor.nomes_saida)), dtype=np.float64, buffer=memoria_saidas.buf)
+            if etapa == 'cobertura':
+                cortes = motor.agrega(motor.ativa_regras(motor.fuzzifica(X[inicio:fim])))
+                for c, inicio_saida in enumerate(motor.inicio_saida):
+                    termos = cortes[:, inicio_saida:inicio_saida + len(motor.termos_saida[c])]
+                    saidas[inicio:fim, c] = termos.max(axis=1) == 0
+            else:
+                saidas[inicio:fim] = motor.avalia(X[inicio:fim])[0]
+            del X, saidas
+        finally:
+            memoria_entradas.close()
+            memoria_saidas.close()
+        return fim - inicio
+
+
+if __name__ == '__main__':
+    # Benchmark de escalabilidade: vazão (linhas/s) por número de processos, conferida contra o motor
+    # em um único processo
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Escalabilidade do diagnóstico em lote com vários processos")
+    parser.add_argument('--linhas', type=int, default=20000)
+    parser.add_argument('--trabalhadores', default=None,
+                        help="Lista de quantidades de processos, ex.: 1,2,4 (padrão: potências de 2 até os núcleos)")
+    parser.add_argument('--bloco', type=int, default=LoteParalelo.TAMANHO_BLOCO_PADRAO)
+    parser.add_argument('--artefato', default=None)
+    args = parser.parse_args()
+
+    nucleos = os.cpu_count() or 1
+    if args.trabalhadores:
+        quantidades = [int(q) for q in args.trabalhadores.split(',')]
+    else:
+        quantidades = sorted({2 ** i for i in range(nucleos.bit_length()) if 2 ** i <= nucleos} | {nucleos})
+
+    X = np.random.default_rng(0).uniform(0, 5, (args.linhas, 12))
+    with LoteParalelo(1, args.bloco, args.artefato) as lote:
+        inicio = time.perf_counter()
+        referencia, _, _ = lote.motor.avalia(X)
+        base = args.linhas / (time.perf_counter() - inicio)
+    print(f"{args.linhas} linhas, blocos de {args.bloco}, {nucleos} núcleos disponíveis")
+    print(f"{'processo único (sem pool)':<28} {base:10.0f} linhas/s")
+
+    for quantidade in quantidades:
+        with LoteParalelo(quantidade, args.bloco, args.artefato) as lote:
+            lote.diagnostica(X[:quantidade])  # Sobe os processos antes de medir
+            inicio = time.perf_counter()
+            saidas, _ = lote.diagnostica(X)
+            vazao = args.linhas / (time.perf_counter() - inicio)
+        confere = 'ok' if np.array_equal(saidas, referencia, equal_nan=True) else 'DIVERGENTE'
+        print(f"{quantidade:>3} processo(s){'':<14} {vazao:10.0f} linhas/s  {vazao / base:5.2f}x  {confere}")
@@ -0,0 +1,646 @@
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+
+
+class MotorVetorizado:
+    # Motor de inferência Mamdani compilado em tabelas NumPy densas.
+    # Reproduz o cálculo do ControlSystemSimulation do skfuzzy (min/max, acumulação
+    # por máximo e centróide sobre o universo reamostrado) sem percorrer o grafo de regras.
+
+    TAMANHO_BLOCO = 512  # Linhas avaliadas por vez (limita a memória das tabelas intermediárias)
+    FORMATO_ARTEFATO = 3  # Versão do layout do .npz gravado por salva(); mudar ao alterar as tabelas
+    # 'amostrada': centróide do skfuzzy (universo + pontos de corte de cada termo, idêntico ao skfuzzy);
+    # 'analitica': centróide exato da saída agregada, calculado dos vértices dos trapézios de saída e
+    # dos cortes (não depende do passo do universo)
+    DEFUZZIFICACOES = ('amostrada', 'analitica')
+
+    # Tabelas compiladas gravadas no artefato (o restante é recriado a partir dos metadados)
+    TABELAS = ('incidencia', 'usa_variavel', 'regra_saida', 'matriz_saida', 'termo_com_regra', 'codigo_clausula',
+               'premissas', 'premissa_da_regra', 'indice_clausula', 'ordem_por_saida', 'termos_acumulados',
+               'inicio_grupos', 'bitset_premissas', 'pesos_termo', 'premissas_por_regra', 'trapezios_entrada',
+               'limites_entrada', 'trapezios_saida')
+    LISTAS_TABELAS = ('universos_entrada', 'pertinencias_entrada', 'universos_saida', 'pertinencias_saida',
+                      'termos_por_codigo')
+
+    def __init__(self, antecedentes, consequentes, regras, usa_indice=True, defuzzificacao='amostrada',
+                 trapezios_entrada=None, trapezios_saida=None):
+        # antecedentes/consequentes: ctrl.Antecedent/ctrl.Consequent já com termos definidos
+        # regras: sequência de (premissa, (consequente, termo)), premissa = {variavel: (termos, ...)}
+        # usa_indice: descarta, antes do cálculo, as premissas com alguma cláusula de pertinência zero
+        # defuzzificacao: uma de DEFUZZIFICACOES (pode ser trocada depois, não faz parte do artefato)
+        # trapezios_entrada: parâmetros [a, b, c, d] dos termos de entrada (V x T x 4) para a
+        # fuzzificação analítica; sem eles, as pertinências são interpoladas nos universos amostrados
+        # trapezios_saida: idem para os termos de saída (C x T x 4), usados pela defuzzificação
+        # analítica; sem eles, ela é exata só para as pertinências amostradas
+        if defuzzificacao not in self.DEFUZZIFICACOES:
+            raise ValueError(f"Defuzzificação desconhecida: '{defuzzificacao}'. Opções: {self.DEFUZZIFICACOES}")
+        self.nomes_entrada = [v.label for v in antecedentes]
+        self.nomes_saida = [v.label for v in consequentes]
+        self.usa_indice = usa_indice
+        self.defuzzificacao = defuzzificacao
+        self._compila_entradas(antecedentes, trapezios_entrada)
+        self._compila_saidas(consequentes, trapezios_saida)
+        self._compila_regras(regras)
+        self._compila_indice()
+        self.zera_contadores()
+
+    @classmethod
+    def de_regras(cls, antecedentes, consequentes, regras):
+        # Constrói o motor a partir de uma lista de ctrl.Rule
+        return cls(antecedentes, consequentes, [cls.normaliza_regra(regra) for regra in regras])
+
+    @staticmethod
+    def normaliza_regra(regra):
+        # Converte um ctrl.Rule em (premissa, (consequente, termo)).
+        # Suporta conjunções (&) de cláusulas, onde cada cláusula é um termo ou uma disjunção (|)
+        # de termos da mesma variável
+        from skfuzzy.control.term import Term, TermAggregate
+
+        premissa = {}
+
+        def clausula(expr):
+            if isinstance(expr, Term):
+                return expr.parent.label, (expr.label,)
+            if isinstance(expr, TermAggregate) and expr.kind == 'or':
+                var1, termos1 = clausula(expr.term1)
+                var2, termos2 = clausula(expr.term2)
+                if var1 == var2:
+                    return var1, termos1 + tuple(t for t in termos2 if t not in termos1)
+            raise ValueError(f"Regra não suportada pelo motor vetorizado: {regra}")
+
+        def conjuncao(expr):
+            if isinstance(expr, TermAggregate) and expr.kind == 'and':
+                conjuncao(expr.term1)
+                conjuncao(expr.term2)
+                return
+            variavel, termos = clausula(expr)
+            if variavel in premissa:
+                raise ValueError(f"Variável '{variavel}' repetida na premissa da regra: {regra}")
+            premissa[variavel] = termos
+
+        conjuncao(regra.antecedent)
+
+        if len(regra.consequent) != 1 or regra.consequent[0].weight != 1.:
+            raise ValueError(f"Regra não suportada pelo motor vetorizado: {regra}")
+        termo_saida = regra.consequent[0].term
+        return premissa, (termo_saida.parent.label, termo_saida.label)
+
+    def _compila_entradas(self, antecedentes, trapezios_entrada=None):
+        # Universo e funções de pertinência amostradas de cada antecedente (variável x termo)
+        self.termos_entrada = [list(v.terms.keys()) for v in antecedentes]
+        self.max_termos = max(len(termos) for termos in self.termos_entrada)
+        self.universos_entrada = [np.asarray(v.universe, dtype=np.float64) for v in antecedentes]
+        self.pertinencias_entrada = [
+            np.array([t.mf for t in v.terms.values()], dtype=np.float64) for v in antecedentes
+        ]
+        self.limites_entrada = np.array([[u.min(), u.max()] for u in self.universos_entrada])
+        # Tabela V x T x 4 de trapézios; termos inexistentes (variáveis com menos termos) valem 0
+        # com [inf, inf, inf, inf]. Tabela vazia = fuzzificação por interpolação
+        self.trapezios_entrada = np.empty((0,))
+        if trapezios_entrada is not None:
+            self.trapezios_entrada = np.full((len(antecedentes), self.max_termos, 4), np.inf)
+            for v, termos in enumerate(self.termos_entrada):
+                self.trapezios_entrada[v, :len(termos)] = np.asarray(trapezios_entrada[v], dtype=np.float64)[:len(termos)]
+
+    def _compila_saidas(self, consequentes, trapezios_saida=None):
+        self.termos_saida = [list(v.terms.keys()) for v in consequentes]
+        self.universos_saida = [np.asarray(v.universe, dtype=np.float64) for v in consequentes]
+        self.pertinencias_saida = [
+            np.array([t.mf for t in v.terms.values()], dtype=np.float64) for v in consequentes
+        ]
+        # Tabela C x T x 4 de trapézios de saída, no mesmo formato da de entrada (vazia = sem trapézios)
+        self.trapezios_saida = np.empty((0,))
+        if trapezios_saida is not None:
+            maximo = max(len(termos) for termos in self.termos_saida)
+            self.trapezios_saida = np.full((len(consequentes), maximo, 4), np.inf)
+            for c, termos in enumerate(self.termos_saida):
+                self.trapezios_saida[c, :len(termos)] = np.asarray(trapezios_saida[c], dtype=np.float64)[:len(termos)]
+        # Índice de cada termo de saída no vetor achatado de cortes
+        self.indice_termo_saida = {}
+        self.inicio_saida = []
+        for c, (nome, termos) in enumerate(zip(self.nomes_saida, self.termos_saida)):
+            self.inicio_saida.append(len(self.indice_termo_saida))
+            for termo in termos:
+                self.indice_termo_saida[(nome, termo)] = len(self.indice_termo_saida)
+
+    def _compila_regras(self, regras):
+        n_regras = len(regras)
+        n_entradas = len(self.nomes_entrada)
+        posicao = {nome: v for v, nome in enumerate(self.nomes_entrada)}
+
+        # Incidência regra x variável x termo e variáveis usadas por regra
+        self.incidencia = np.zeros((n_regras, n_entradas, self.max_termos), dtype=bool)
+        self.usa_variavel = np.zeros((n_regras, n_entradas), dtype=bool)
+        # Regra -> termo de saída (índice no vetor achatado de cortes)
+        self.regra_saida = np.zeros(n_regras, dtype=np.intp)
+
+        for r, (premissa, (consequente, termo)) in enumerate(regras):
+            for variavel, termos in premissa.items():
+                v = posicao[variavel]
+                self.usa_variavel[r, v] = True
+                for t in termos:
+                    self.incidencia[r, v, self.termos_entrada[v].index(t)] = True
+            self.regra_saida[r] = self.indice_termo_saida[(consequente, termo)]
+
+        self.regras = list(regras)
+        self.n_regras = n_regras
+        n_termos_saida = len(self.indice_termo_saida)
+        self.matriz_saida = np.zeros((n_regras, n_termos_saida), dtype=bool)
+        self.matriz_saida[np.arange(n_regras), self.regra_saida] = True
+        # Termos de saída sem nenhuma regra não participam da defuzzificação (como no skfuzzy)
+        self.termo_com_regra = self.matriz_saida.any(axis=0)
+        # Rótulo do consequente de cada regra, ex.: 'depressao[leve]'
+        rotulos = [f"{nome}[{termo}]" for nome, termo in self.indice_termo_saida]
+        self.rotulos_consequentes = [rotulos[k] for k in self.regra_saida]
+
+        # Cláusula de cada (regra, variável) codificada como máscara de bits dos termos do OR;
+        # código 0 = variável ausente da premissa (vale 1 no AND)
+        pesos = 1 << np.arange(self.max_termos)
+        self.n_codigos = 1 << self.max_termos
+        self.codigo_clausula = (self.incidencia * pesos).sum(axis=2)
+        self.termos_por_codigo = [np.flatnonzero(codigo & pesos) for codigo in range(self.n_codigos)]
+
+        # Premissas idênticas (mesmas cláusulas, consequentes diferentes) são avaliadas uma única vez
+        # e o grau de ativação é replicado para cada regra que as usa
+        _, primeira, inversa = np.unique(self.codigo_clausula, axis=0, return_index=True, return_inverse=True)
+        ordem = np.argsort(primeira)
+        self.premissas = self.codigo_clausula[primeira[ordem]]
+        self.premissa_da_regra = np.argsort(ordem)[inversa.ravel()]
+        self.n_premissas = len(primeira)
+        self.indice_clausula = (np.arange(n_entradas) * self.n_codigos + self.premissas).ravel()
+
+        # Regras ordenadas por termo de saída, para acumular cada termo com um único reduceat
+        self.ordem_por_saida = np.argsort(self.regra_saida, kind='stable')
+        self.termos_acumulados = np.flatnonzero(self.termo_com_regra)
+        self.inicio_grupos = np.searchsorted(self.regra_saida[self.ordem_por_saida], self.termos_acumulados)
+
+    def _compila_indice(self):
+        # Índice de termos: para cada variável e cada conjunto de termos ativos (pertinência > 0,
+        # codificado como máscara de bits), o bitset das premissas que continuam possíveis, isto é,
+        # que não usam a variável ou aceitam algum dos termos ativos. Uma linha só precisa calcular
+        # as premissas presentes na interseção dos bitsets de todas as variáveis
+        codigos = np.arange(self.n_codigos)
+        possiveis = (self.premissas.T[:, None, :] == 0) | (self.premissas.T[:, None, :] & codigos[:, None] != 0)
+        bytes_ = np.packbits(possiveis, axis=-1, bitorder='little')  # V x 2^T x bytes
+        bytes_ = np.pad(bytes_, [(0, 0), (0, 0), (0, -bytes_.shape[-1] % 8)])
+        self.bitset_premissas = np.ascontiguousarray(bytes_).view(np.uint64)  # V x 2^T x palavras
+        self.pesos_termo = 1 << np.arange(self.max_termos)
+        self.premissas_por_regra = np.bincount(self.premissa_da_regra, minlength=self.n_premissas)
+
+    def premissas_candidatas(self, mu):
+        # N x P booleano: premissas cujas cláusulas têm todas algum termo ativo
+        ativos = ((mu > 0) * self.pesos_termo).sum(axis=2)
+        vivas = np.bitwise_and.reduce(self.bitset_premissas[np.arange(ativos.shape[1]), ativos], axis=1)
+        bits = np.unpackbits(vivas.view(np.uint8), axis=-1, count=self.n_premissas, bitorder='little')
+        return bits.astype(bool)
+
+    def zera_contadores(self):
+        # Contadores compartilhados entre threads; as tabelas compiladas são somente leitura
+        self.trava_contadores = threading.Lock()
+        self.contadores = {'chamadas': 0, 'linhas': 0, 'regras_avaliadas': 0, 'regras_ignoradas': 0}
+        self.ultima_poda = {'regras_avaliadas': self.n_regras, 'regras_ignoradas': 0}
+
+    def estatisticas(self):
+        # Tamanho da base compilada e trabalho poupado pelo índice de termos
+        return {
+            'regras': self.n_regras,
+            'premissas_unicas': self.n_premissas,
+            **self.contadores,
+        }
+
+    def assinatura(self):
+        # Hash do conteúdo compilado (variáveis, funções de pertinência e regras); muda sempre que a base muda
+        h = hashlib.sha256()
+        for nome, termos in zip(self.nomes_entrada + self.nomes_saida, self.termos_entrada + self.termos_saida):
+            h.update(f"{nome}:{','.join(termos)};".encode())
+        for tabela in (self.universos_entrada + self.pertinencias_entrada + self.universos_saida
+                       + self.pertinencias_saida + [self.codigo_clausula, self.regra_saida, self.trapezios_entrada,
+                                                   self.trapezios_saida]):
+            h.update(np.ascontiguousarray(tabela, dtype=np.float64).tobytes())
+        return h.hexdigest()
+
+    def salva(self, caminho, chave=''):
+        # Grava as tabelas compiladas em um .npz (sem pickle); chave identifica as fontes que
+        # geraram o motor (ver LogicaFuzzy.chave_artefato) e é conferida em carrega()
+        metadados = {
+            'formato': self.FORMATO_ARTEFATO,
+            'chave': chave,
+            'assinatura': self.assinatura(),
+            'nomes_entrada': self.nomes_entrada,
+            'nomes_saida': self.nomes_saida,
+            'termos_entrada': self.termos_entrada,
+            'termos_saida': self.termos_saida,
+            'inicio_saida': self.inicio_saida,
+            'max_termos': self.max_termos,
+            'n_codigos': self.n_codigos,
+            'n_regras': self.n_regras,
+            'n_premissas': self.n_premissas,
+            'usa_indice': self.usa_indice,
+            'rotulos_consequentes': self.rotulos_consequentes,
+            'regras': [[{v: list(termos) for v, termos in premissa.items()}, list(consequente)]
+                       for premissa, consequente in self.regras],
+            'tamanhos_listas': {nome: len(getattr(self, nome)) for nome in self.LISTAS_TABELAS},
+        }
+        tabelas = {nome: getattr(self, nome) for nome in self.TABELAS}
+        for nome in self.LISTAS_TABELAS:
+            for i, tabela in enumerate(getattr(self, nome)):
+                tabelas[f"{nome}__{i}"] = tabela
+        # Grava em arquivo temporário e troca no fim: outro processo nunca lê um artefato pela metade
+        temporario = f"{caminho}.{os.getpid()}.tmp"
+        with open(temporario, 'wb') as arquivo:
+            np.savez(arquivo, metadados=np.array(json.dumps(metadados, ensure_ascii=False)), **tabelas)
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def carrega(cls, caminho, chave=None):
+        # Reconstrói o motor a partir do artefato, sem skfuzzy e sem recompilar a base de regras
+        with np.load(caminho, allow_pickle=False) as dados:
+            metadados = json.loads(dados['metadados'].item())
+            if metadados['formato'] != cls.FORMATO_ARTEFATO:
+                raise ValueError(f"O artefato '{caminho}' usa o formato {metadados['formato']}; "
+                                 f"esperado {cls.FORMATO_ARTEFATO}. Gere-o novamente.")
+            if chave is not None and metadados['chave'] != chave:
+                raise ValueError(f"O artefato '{caminho}' foi gerado para outra base de regras; gere-o novamente.")
+
+            motor = cls.__new__(cls)
+            for nome in cls.TABELAS:
+                setattr(motor, nome, dados[nome])
+            for nome, tamanho in metadados['tamanhos_listas'].items():
+                setattr(motor, nome, [dados[f"{nome}__{i}"] for i in range(tamanho)])
+
+        for nome in ('nomes_entrada', 'nomes_saida', 'termos_entrada', 'termos_saida', 'inicio_saida', 'max_termos',
+                     'n_codigos', 'n_regras', 'n_premissas', 'usa_indice', 'rotulos_consequentes'):
+            setattr(motor, nome, metadados[nome])
+        motor.regras = [({v: tuple(termos) for v, termos in premissa.items()}, tuple(consequente))
+                        for premissa, consequente in metadados['regras']]
+        motor.indice_termo_saida = {(nome, termo): motor.inicio_saida[c] + t
+                                    for c, (nome, termos) in enumerate(zip(motor.nomes_saida, motor.termos_saida))
+                                    for t, termo in enumerate(termos)}
+        motor.defuzzificacao = 'amostrada'
+        motor.zera_contadores()
+        if motor.assinatura() != metadados['assinatura']:
+            raise ValueError(f"O artefato '{caminho}' está corrompido (assinatura não confere).")
+        return motor
+
+    # Etapas da inferência -------------------------------------------------------------
+
+    def matriz_entradas(self, entradas):
+        # Dicionário {variavel: valor} -> vetor 1 x V na ordem dos antecedentes
+        return np.array([[entradas[nome] for nome in self.nomes_entrada]], dtype=np.float64)
+
+    def matriz_lote(self, entradas):
+        # Matriz N x V (colunas na ordem dos antecedentes) ou dict {variavel: coluna} -> matriz N x V
+        if isinstance(entradas, dict):
+            faltando = [nome for nome in self.nomes_entrada if nome not in entradas]
+            if faltando:
+                raise KeyError(f"Colunas ausentes nas entradas: {faltando}")
+            return np.column_stack([np.asarray(entradas[nome], dtype=np.float64).ravel()
+                                    for nome in self.nomes_entrada])
+        X = np.asarray(entradas, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != len(self.nomes_entrada):
+            raise ValueError(f"Esperada matriz N x {len(self.nomes_entrada)} com colunas {self.nomes_entrada}, "
+                             f"recebido formato {X.shape}")
+        return X
+
+    def fuzzifica(self, X):
+        # Pertinência de cada entrada a cada termo: N x V x T
+        X = np.asarray(X, dtype=np.float64)
+        if self.trapezios_entrada.size:
+            # Todas as variáveis e termos de uma vez, pela tabela de trapézios
+            x = np.fmax(np.fmin(X, self.limites_entrada[:, 1]), self.limites_entrada[:, 0])
+            return self.pertinencia_trapezio(x[:, :, None], self.trapezios_entrada)
+        mu = np.zeros((X.shape[0], len(self.nomes_entrada), self.max_termos))
+        for v in range(len(self.nomes_entrada)):
+            self.fuzzifica_variavel(X[:, v], v, mu[:, v])
+        return mu
+
+    def fuzzifica_variavel(self, x, v, mu_v):
+        # Pertinência dos valores x aos termos da variável v, gravada em mu_v (N x T)
+        universo = self.universos_entrada[v]
+        x = np.fmax(np.fmin(x, universo.max()), universo.min())
+        if self.trapezios_entrada.size:
+            mu_v[:] = self.pertinencia_trapezio(x[:, None], self.trapezios_entrada[v])
+            return
+        for t, mf in enumerate(self.pertinencias_entrada[v]):
+            mu_v[:, t] = np.interp(x, universo, mf, left=0., right=0.)
+
+    @staticmethod
+    def pertinencia_trapezio(x, trapezios):
+        # trapmf avaliado no valor exato de x; trapezios [..., 4] = (a, b, c, d), com a == b
+        # (ombro esquerdo) ou c == d (ombro direito). Com vértices sobre o universo amostrado,
+        # coincide bit a bit com a interpolação do skfuzzy
+        a, b, c, d = np.moveaxis(trapezios, -1, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sobe = np.where(b > a, (x - a) / (b - a), np.where(x >= a, 1., 0.))
+            desce = np.where(d > c, (d - x) / (d - c), np.where(x <= d, 1., 0.))
+        return np.clip(np.minimum(sobe, desce), 0., 1.)
+
+    def valores_clausulas(self, mu):
+        # Valor de cada cláusula possível por variável: N x V x 2^T (máximo dos termos do OR)
+        valores = np.empty(mu.shape[:2] + (self.n_codigos,))
+        valores[:, :, 0] = 1.
+        for codigo in range(1, self.n_codigos):
+            valores[:, :, codigo] = mu[:, :, self.termos_por_codigo[codigo]].max(axis=2)
+        return valores
+
+    def ativa_premissas(self, mu):
+        # Grau de cada premissa distinta: OR (máx) dentro da cláusula, AND (mín) entre cláusulas
+        if not self.usa_indice:
+            valores = self.valores_clausulas(mu).reshape(mu.shape[0], -1)
+            graus = np.empty((mu.shape[0], self.n_premissas))
+            for i in range(0, mu.shape[0], self.TAMANHO_BLOCO):
+                bloco = valores[i:i + self.TAMANHO_BLOCO, self.indice_clausula]
+                graus[i:i + self.TAMANHO_BLOCO] = bloco.reshape(-1, self.n_premissas, len(self.nomes_entrada)).min(axis=2)
+            self._conta(mu.shape[0], mu.shape[0] * self.n_regras)
+            return graus
+
+        # Só as premissas candidatas são calculadas; as demais valem exatamente 0
+        candidatas = self.premissas_candidatas(mu)
+        graus = np.zeros((mu.shape[0], self.n_premissas))
+        com_candidata = np.flatnonzero(candidatas.any(axis=1))
+        linhas, premissas = np.nonzero(candidatas[com_candidata])
+        if linhas.size:
+            # Tabela de cláusulas apenas das linhas com alguma premissa candidata
+            valores = self.valores_clausulas(mu[com_candidata]).reshape(com_candidata.size, -1)
+            indices = self.indice_clausula.reshape(self.n_premissas, -1)
+            passo = self.TAMANHO_BLOCO * 16
+            for i in range(0, linhas.size, passo):
+                l, p = linhas[i:i + passo], premissas[i:i + passo]
+                graus[com_candidata[l], p] = valores[l[:, None], indices[p]].min(axis=1)
+        self._conta(mu.shape[0], int(self.premissas_por_regra[premissas].sum()))
+        return graus
+
+    def _conta(self, linhas, regras_avaliadas):
+        total = linhas * self.n_regras
+        with self.trava_contadores:
+            self.ultima_poda = {'regras_avaliadas': regras_avaliadas, 'regras_ignoradas': total - regras_avaliadas}
+            self.contadores['chamadas'] += 1
+            self.contadores['linhas'] += linhas
+            self.contadores['regras_avaliadas'] += regras_avaliadas
+            self.contadores['regras_ignoradas'] += total - regras_avaliadas
+
+    def ativa_regras(self, mu):
+        # Grau de ativação de cada regra, replicado a partir da sua premissa
+        return self.ativa_premissas(mu)[:, self.premissa_da_regra]
+
+    def agrega(self, ativacoes):
+        # Corte de cada termo de saída: máximo das ativações das regras que o concluem
+        cortes = np.zeros((ativacoes.shape[0], self.matriz_saida.shape[1]))
+        if self.termos_acumulados.size:
+            cortes[:, self.termos_acumulados] = np.maximum.reduceat(
+                ativacoes[:, self.ordem_por_saida], self.inicio_grupos, axis=1)
+        return cortes
+
+    def _pontos_corte(self, universo, mf, cortes):
+        # Versão vetorizada de _interp_universe_fast: pontos do universo onde mf cruza o corte
+        maior = np.where(cortes[:, None] == 0., mf > cortes[:, None], mf >= cortes[:, None])
+        cruza = maior[:, 1:] != maior[:, :-1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pontos = (universo[:-1]
+                      + (cortes[:, None] - mf[:-1])
+                      * (universo[1:] - universo[:-1])
+                      / (mf[1:] - mf[:-1]))
+        # Posições sem cruzamento repetem o início do universo (segmento de largura zero)
+        return np.where(cruza, pontos, universo[0])
+
+    def _cruzamentos_termos(self, c):
+        # Pontos do universo do consequente c onde as funções de dois termos se cruzam (fixos)
+        universo = self.universos_saida[c]
+        pertinencias = self.pertinencias_saida[c]
+        pontos = []
+        for i in range(len(pertinencias)):
+            for j in range(i + 1, len(pertinencias)):
+                diferenca = pertinencias[i] - pertinencias[j]
+                cruza = diferenca[:-1] * diferenca[1:] < 0
+                d0, d1 = diferenca[:-1][cruza], diferenca[1:][cruza]
+                pontos.append(universo[:-1][cruza] + d0 / (d0 - d1) * np.diff(universo)[cruza])
+        return np.concatenate(pontos) if pontos else np.empty(0)
+
+    def _arestas_saida(self, c, s):
+        # Arestas inclinadas do trapézio do termo s do consequente c: (x onde vale 0, x onde vale 1)
+        a, b, topo, d = self.trapezios_saida[c, s]
+        return [(x0, x1) for x0, x1 in ((a, b), (d, topo)) if x0 != x1]
+
+    def _pontos_fixos_saida(self, c, termos):
+        # Extremos do universo, vértices dos trapézios e cruzamentos entre arestas de termos diferentes
+        universo = self.universos_saida[c]
+        pontos = [universo.min(), universo.max()]
+        for s in termos:
+            pontos.extend(self.trapezios_saida[c, s])
+        for i, s in enumerate(termos):
+            for t in termos[i + 1:]:
+                for x0, x1 in self._arestas_saida(c, s):
+                    for y0, y1 in self._arestas_saida(c, t):
+                        denominador = (x1 - x0) - (y1 - y0)
+                        if denominador != 0:
+                            altura = (y0 - x0) / denominador
+                            if 0 < altura < 1:
+                                pontos.append(x0 + altura * (x1 - x0))
+        return np.array(pontos)
+
+    def _pontos_analiticos(self, cortes_c, c, termos):
+        # Todos os pontos onde a saída agregada muda de inclinação, tirados dos trapézios: os fixos e
+        # o cruzamento de cada aresta com o corte de cada um dos termos (não só com o do próprio termo).
+        # Entre dois pontos consecutivos a agregada é linear, então o centróide fechado é exato
+        universo = self.universos_saida[c]
+        fixos = self._pontos_fixos_saida(c, termos)
+        partes = [np.broadcast_to(fixos, (cortes_c.shape[0], fixos.size))]
+        for s in termos:
+            for x0, x1 in self._arestas_saida(c, s):
+                for nivel in termos:
+                    partes.append((x0 + cortes_c[:, nivel] * (x1 - x0))[:, None])
+        pontos = np.sort(np.clip(np.concatenate(partes, axis=1), universo.min(), universo.max()), axis=1)
+        return pontos, {s: self.pertinencia_trapezio(pontos, self.trapezios_saida[c, s]) for s in termos}
+
+    def pertinencias_agregadas(self, cortes, c):
+        # Universo reamostrado, saída agregada e saída de cada termo do consequente c
+        universo = self.universos_saida[c]
+        inicio = self.inicio_saida[c]
+        termos = [s for s in range(len(self.termos_saida[c])) if self.termo_com_regra[inicio + s]]
+        cortes_c = cortes[:, inicio:inicio + len(self.termos_saida[c])]
+
+        if self.defuzzificacao == 'analitica' and self.trapezios_saida.size:
+            pontos, pertinencias = self._pontos_analiticos(cortes_c, c, termos)
+        else:
+            partes = [np.broadcast_to(universo, (cortes.shape[0], universo.size))]
+            if self.defuzzificacao == 'analitica':
+                # Sem trapézios: exata para as pertinências amostradas. Cruzamentos entre termos e
+                # cruzamento de cada termo com o corte de cada um dos termos
+                cruzamentos = self._cruzamentos_termos(c)
+                partes.append(np.broadcast_to(cruzamentos, (cortes.shape[0], cruzamentos.size)))
+                for s in termos:
+                    for nivel in termos:
+                        partes.append(self._pontos_corte(universo, self.pertinencias_saida[c][s], cortes_c[:, nivel]))
+            else:
+                for s in termos:
+                    partes.append(self._pontos_corte(universo, self.pertinencias_saida[c][s], cortes_c[:, s]))
+            pontos = np.sort(np.concatenate(partes, axis=1), axis=1)
+            pertinencias = {s: np.interp(pontos, universo, self.pertinencias_saida[c][s], left=0., right=0.)
+                            for s in termos}
+
+        agregada = np.zeros_like(pontos)
+        por_termo = {}
+        for s in termos:
+            por_termo[self.termos_saida[c][s]] = np.minimum(cortes_c[:, s, None], pertinencias[s])
+            np.maximum(agregada, por_termo[self.termos_saida[c][s]], out=agregada)
+        return pontos, agregada, por_termo
+
+    @staticmethod
+    def centroide(pontos, agregada):
+        # Centróide exato da poligonal (mesma sequência de operações de skfuzzy.defuzzify.centroid).
+        # Todos os segmentos de um bloco de linhas são calculados de uma vez; cumsum soma na mesma
+        # ordem do laço do skfuzzy, então o resultado é idêntico bit a bit
+        resultado = np.empty(pontos.shape[0])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for inicio in range(0, pontos.shape[0], MotorVetorizado.TAMANHO_BLOCO):
+                bloco = slice(inicio, inicio + MotorVetorizado.TAMANHO_BLOCO)
+                x1, x2 = pontos[bloco, :-1], pontos[bloco, 1:]
+                y1, y2 = agregada[bloco, :-1], agregada[bloco, 1:]
+
+                momento = np.where(
+                    y1 == y2, 0.5 * (x1 + x2),
+                    np.where((y1 == 0.0) & (y2 != 0.0), 2.0 / 3.0 * (x2 - x1) + x1,
+                             np.where((y2 == 0.0) & (y1 != 0.0), 1.0 / 3.0 * (x2 - x1) + x1,
+                                      (2.0 / 3.0 * (x2 - x1) * (y2 + 0.5 * y1)) / (y1 + y2) + x1)))
+                area = np.where(
+                    y1 == y2, (x2 - x1) * y1,
+                    np.where((y1 == 0.0) & (y2 != 0.0), 0.5 * (x2 - x1) * y2,
+                             np.where((y2 == 0.0) & (y1 != 0.0), 0.5 * (x2 - x1) * y1,
+                                      0.5 * (x2 - x1) * (y1 + y2))))
+
+                valido = ~(((y1 == 0.0) & (y2 == 0.0)) | (x1 == x2))
+                soma_momento_area = np.cumsum(np.where(valido, momento * area, 0.), axis=1)[:, -1]
+                soma_area = np.cumsum(np.where(valido, area, 0.), axis=1)[:, -1]
+                resultado[bloco] = soma_momento_area / np.fmax(soma_area, np.finfo(float).eps)
+        return resultado
+
+    def defuzzifica(self, cortes):
+        # Valor crisp por consequente: N x C, NaN onde nenhuma regra daquela saída foi ativada
+        saidas = np.full((cortes.shape[0], len(self.nomes_saida)), np.nan)
+        for c in range(len(self.nomes_saida)):
+            saidas[:, c] = self.defuzzifica_consequente(cortes, c)
+        return saidas
+
+    @staticmethod
+    def centroide_exato(pontos, agregada):
+        # Centróide da poligonal por integração fechada de cada segmento linear:
+        # área = (x2 - x1)(y1 + y2)/2 e momento = (x2 - x1)(x1(2y1 + y2) + x2(y1 + 2y2))/6
+        x1, x2 = pontos[:, :-1], pontos[:, 1:]
+        y1, y2 = agregada[:, :-1], agregada[:, 1:]
+        largura = x2 - x1
+        area = (largura * (y1 + y2)).sum(axis=1) / 2
+        momento = (largura * (x1 * (2 * y1 + y2) + x2 * (y1 + 2 * y2))).sum(axis=1) / 6
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return momento / area
+
+    def defuzzifica_consequente(self, cortes, c):
+        pontos, agregada, _ = self.pertinencias_agregadas(cortes, c)
+        vazia = agregada.sum(axis=1) == 0
+        centroide = self.centroide_exato if self.defuzzificacao == 'analitica' else self.centroide
+        return np.where(vazia, np.nan, centroide(pontos, agregada))
+
+    def avalia(self, X):
+        # Inferência completa sobre uma matriz N x V de entradas
+        mu = self.fuzzifica(X)
+        ativacoes = self.ativa_regras(mu)
+        cortes = self.agrega(ativacoes)
+        return self.defuzzifica(cortes), ativacoes, cortes
+
+
+if __name__ == '__main__':
+    # python MotorVetorizado.py gera [--artefato caminho]       -> grava o motor compilado
+    # python MotorVetorizado.py benchmark [--repeticoes 5]      -> partida a frio x partida pelo artefato
+    # python MotorVetorizado.py centroide [--resolucao 0.001]   -> centróide analítico x skfuzzy em alta resolução
+    import argparse
+    import statistics
+    import subprocess
+    import sys
+    import time
+
+    from LogicaFuzzy import LogicaFuzzy
+
+    parser = argparse.ArgumentParser(description="Artefato do motor vetorizado compilado")
+    parser.add_argument('comando', choices=('gera', 'benchmark', 'centroide'))
+    parser.add_argument('--artefato', default=LogicaFuzzy.ARQUIVO_ARTEFATO)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--resolucao', type=float, default=0.001, help="Passo do universo de referência")
+    parser.add_argument('--amostras', type=int, default=2000, help="Combinações de cortes sorteadas")
+    args = parser.parse_args()
+
+    if args.comando == 'centroide':
+        import skfuzzy as fuzz
+
+        # Cortes sorteados (com termos zerados) para as saídas do motor na resolução padrão
+        rng = np.random.default_rng(0)
+        motor = LogicaFuzzy(motor='vetorizado', cache=False)._compila_motor()
+        cortes = rng.uniform(0, 1, (args.amostras, motor.matriz_saida.shape[1]))
+        cortes[rng.random(cortes.shape) < 0.3] = 0.
+        cortes[:, ~motor.termo_com_regra] = 0.
+
+        # Referência: skfuzzy.defuzz sobre a saída agregada amostrada no universo fino
+        fina = LogicaFuzzy(motor='vetorizado', cache=False, resolucao_saida=args.resolucao)
+        referencia = np.full((args.amostras, len(motor.nomes_saida)), np.nan)
+        for c, variavel in enumerate(fina.consequentes()):
+            inicio = motor.inicio_saida[c]
+            mfs = np.array([termo.mf for termo in variavel.terms.values()])
+            for i in range(args.amostras):
+                agregada = np.minimum(cortes[i, inicio:inicio + len(mfs), None], mfs).max(axis=0)
+                if agregada.sum() > 0:
+                    referencia[i, c] = fuzz.defuzz(variavel.universe, agregada, 'centroid')
+
+        print(f"{args.amostras} combinações de cortes; referência: skfuzzy com passo {args.resolucao}")
+        for defuzzificacao in MotorVetorizado.DEFUZZIFICACOES:
+            motor.defuzzificacao = defuzzificacao
+            inicio = time.perf_counter()
+            valores = motor.defuzzifica(cortes)
+            lote = (time.perf_counter() - inicio) / args.amostras
+            inicio = time.perf_counter()
+            for i in range(min(args.amostras, 200)):
+                motor.defuzzifica(cortes[i:i + 1])
+            individual = (time.perf_counter() - inicio) / min(args.amostras, 200)
+            erro = np.nanmax(np.abs(valores - referencia))
+            print(f"{defuzzificacao:<10} (passo 1): erro máximo {erro:.2e}; {lote * 1e6:7.1f} µs/linha em lote, "
+                  f"{individual * 1e3:.2f} ms por consulta individual")
+        sys.exit()
+
+    if args.comando == 'gera':
+        motor = LogicaFuzzy(motor='vetorizado', cache=False)._compila_motor()
+        motor.salva(args.artefato, LogicaFuzzy.chave_artefato())
+        print(f"Artefato gravado em {args.artefato} ({os.path.getsize(args.artefato) / 1024:.0f} KiB)")
+        sys.exit()
+
+    def mediana(funcao):
+        tempos = []
+        for _ in range(args.repeticoes):
+            inicio = time.perf_counter()
+            funcao()
+            tempos.append(time.perf_counter() - inicio)
+        return statistics.median(tempos)
+
+    def processo(codigo):
+        # Processo novo (importações incluídas), como uma nova janela ou um worker de lote
+        return lambda: subprocess.run([sys.executable, '-c', codigo],
+                                      check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+
+    LogicaFuzzy(motor='vetorizado', cache=False, artefato=args.artefato)  # Garante o artefato atualizado
+    chave = LogicaFuzzy.chave_artefato()
+    base = LogicaFuzzy(motor='vetorizado', cache=False)
+    casos = [
+        ("compilação da base de regras", lambda: MotorVetorizado(
+            base.antecedentes(), base.consequentes(), base.base_regras.regras(),
+            trapezios_entrada=base.trapezios_entrada(), trapezios_saida=base.trapezios_saida())),
+        ("carga do artefato", lambda: MotorVetorizado.carrega(args.artefato, chave)),
+        ("processo: LogicaFuzzy a frio", processo(
+            "from LogicaFuzzy import LogicaFuzzy; LogicaFuzzy(motor='vetorizado')")),
+        ("processo: LogicaFuzzy com artefato", processo(
+            f"from LogicaFuzzy import LogicaFuzzy; LogicaFuzzy(motor='vetorizado', artefato={args.artefato!r})")),
+        ("processo: só o motor, pelo artefato", processo(
+            f"from MotorVetorizado import MotorVetorizado; MotorVetorizado.carrega({args.artefato!r})")),
+    ]
+    print(f"Mediana de {args.repeticoes} repetições:")
+    for descricao, funcao in casos:
+        print(f"{descricao:<40} {mediana(funcao) * 1000:9.1f} ms")
@@ -0,0 +1,114 @@
+import queue
+from contextlib import contextmanager
+
+from ContextoDiagnostico import ContextoDiagnostico
+
+
+class PoolContextos:
+    # Pool de contextos de diagnóstico sobre um único LogicaFuzzy, para consultas concorrentes.
+    # Uma thread retira um contexto (obtem/contexto), calcula e o devolve; sem contexto livre, espera.
+    # Os contextos usam o motor vetorizado (mesmos valores do skfuzzy) mesmo sobre um LogicaFuzzy
+    # skfuzzy, e as consultas rodam em paralelo. Com motor='skfuzzy' o pool não paraleliza nada: as
+    # entradas, o identificador da simulação e a limpeza do estado passam pelos Antecedents e regras
+    # compartilhados, então toda consulta roda inteira sob a trava do LogicaFuzzy
+
+    TAMANHO_PADRAO = 4
+
+    def __init__(self, logica_fuzzy, tamanho=None, motor='vetorizado'):
+        self.logica_fuzzy = logica_fuzzy
+        self.tamanho = tamanho or self.TAMANHO_PADRAO
+        if motor == 'vetorizado':
+            logica_fuzzy._compila_motor()  # Compilado uma vez, antes das threads
+        self.livres = queue.LifoQueue()
+        for _ in range(self.tamanho):
+            self.livres.put(ContextoDiagnostico(logica_fuzzy, motor))
+
+    def obtem(self, timeout=None):
+        # Lança queue.Empty se nenhum contexto for devolvido dentro do timeout
+        return self.livres.get(timeout=timeout)
+
+    def devolve(self, contexto):
+        self.livres.put(contexto)
+
+    @contextmanager
+    def contexto(self, timeout=None):
+        contexto = self.obtem(timeout)
+        try:
+            yield contexto
+        finally:
+            self.devolve(contexto)
+
+    def calcula_diagnostico(self, entradas):
+        # Consulta completa com um contexto emprestado: (resultado, AtivacaoRegras)
+        with self.contexto() as contexto:
+            return contexto.calcula_diagnostico(entradas), contexto.ultima_ativacao
+
+
+if __name__ == '__main__':
+    # Teste de estresse: várias threads consultando o mesmo LogicaFuzzy; cada resultado e cada vetor
+    # de ativações é comparado com a avaliação sequencial das mesmas entradas
+    import argparse
+    import threading
+    import time
+
+    import numpy as np
+
+    from LogicaFuzzy import LogicaFuzzy
+
+    parser = argparse.ArgumentParser(description="Teste de estresse do pool de contextos")
+    parser.add_argument('--motor', default='vetorizado', choices=LogicaFuzzy.MOTORES,
+                        help="Motor do LogicaFuzzy e dos contextos do pool")
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--consultas', type=int, default=500, help="Consultas por thread")
+    parser.add_argument('--contextos', type=int, default=PoolContextos.TAMANHO_PADRAO)
+    args = parser.parse_args()
+
+    logica = LogicaFuzzy(motor=args.motor, cache=False, registro=False)
+    pool = PoolContextos(logica, args.contextos, args.motor)
+    nomes = [v.label for v in logica.antecedentes()]
+    rng = np.random.default_rng(0)
+    entradas = rng.choice([0., 1., 2., 2.5, 3., 4., 5.], size=(args.threads, args.consultas, len(nomes)))
+    entradas[:, ::2] = rng.uniform(0, 5, entradas[:, ::2].shape)
+    entradas = entradas.reshape(-1, len(nomes))
+    motor = logica._compila_motor()
+    for _ in range(20):
+        # Sorteia de novo parte das entradas sem regra ativada, para exercitar mais regras
+        sem_saida = np.isnan(motor.avalia(entradas)[0]).any(axis=1) & (rng.random(entradas.shape[0]) < 0.8)
+        entradas[sem_saida] = rng.choice([0., 1., 2., 2.5, 3., 4., 5.], size=(sem_saida.sum(), len(nomes)))
+
+    # Referência sequencial, calculada antes das threads
+    esperado, ativacoes_esperadas, _ = motor.avalia(entradas)
+    entradas = entradas.reshape(args.threads, args.consultas, -1)
+    esperado = esperado.reshape(args.threads, args.consultas, -1)
+    ativacoes_esperadas = ativacoes_esperadas.reshape(args.threads, args.consultas, -1)
+
+    divergencias = []
+    sem_regra = [0] * args.threads
+
+    def trabalhador(t):
+        for i in range(args.consultas):
+            try:
+                resultado, ativacao = pool.calcula_diagnostico(dict(zip(nomes, entradas[t, i])))
+            except KeyError:
+                sem_regra[t] += 1
+                if not np.isnan(esperado[t, i]).any():
+                    divergencias.append((t, i))
+                continue
+            obtido = [resultado['depressao'], resultado['ansiedade'], resultado['tea']]
+            if obtido != esperado[t, i].tolist() or not np.array_equal(ativacao.graus, ativacoes_esperadas[t, i]):
+                divergencias.append((t, i))
+
+    inicio = time.perf_counter()
+    threads = [threading.Thread(target=trabalhador, args=(t,)) for t in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duracao = time.perf_counter() - inicio
+
+    total = args.threads * args.consultas
+    print(f"{total} consultas em {args.threads} threads ({args.contextos} contextos): {duracao:.1f} s, "
+          f"{total / duracao:.0f} diagnósticos/s; {sum(sem_regra)} sem regra ativada")
+    print(f"Divergências em relação à avaliação sequencial: {len(divergencias)}")
+    if divergencias:
+        raise SystemExit(1)
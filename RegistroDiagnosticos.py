@@ -0,0 +1,238 @@
+import atexit
+import json
+import logging
+import math
+import os
+import queue
+import threading
+import time
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class RegistroDiagnosticos:
+    # Registro estruturado e assíncrono dos diagnósticos em JSON Lines (um objeto por linha).
+    # A consulta só põe o registro (entradas, saídas e ativações, como números) em uma fila; uma
+    # thread de escrita agrupa os registros pendentes e grava o lote de uma vez, com rotação por
+    # tamanho. Cada lote é gravado sob uma trava de arquivo (<arquivo>.lock), então várias
+    # janelas ou processos podem registrar no mesmo arquivo sem intercalar linhas nem rotacionar
+    # ao mesmo tempo. Respeita o nível INFO do logger 'diagnosticos' (e logging.disable)
+
+    ARQUIVO_PADRAO = 'diagnosticos.jsonl'
+    TAMANHO_MAXIMO = 10 * 2**20  # Bytes antes da rotação
+    COPIAS = 5  # Arquivos rotacionados mantidos: diagnosticos.jsonl.1 ... .5
+    LOTE_MAXIMO = 1000  # Registros por gravação
+    SAIDAS = ('depressao', 'ansiedade', 'tea')
+
+    _compartilhados = {}
+    _trava_compartilhados = threading.Lock()
+    # Registros existentes, percorridos pelos ganchos de fork e de saída do processo (fim do módulo);
+    # a thread de escrita mantém o seu registro vivo até fecha()
+    _registros = weakref.WeakSet()
+
+    def __init__(self, arquivo=None, tamanho_maximo=None, copias=None):
+        self.arquivo = os.path.abspath(arquivo or self.ARQUIVO_PADRAO)
+        self.tamanho_maximo = tamanho_maximo or self.TAMANHO_MAXIMO
+        self.copias = self.COPIAS if copias is None else copias
+        self.logger = logging.getLogger('diagnosticos')
+        if self.logger.level == logging.NOTSET:
+            self.logger.setLevel(logging.INFO)
+        self.gravados = 0
+        self.lotes = 0
+        # Thread de escrita criada no primeiro registro; a trava impede duas threads de recriá-la
+        self.pid = None
+        self.escritor = None
+        self.trava = threading.Lock()
+        RegistroDiagnosticos._registros.add(self)
+
+    @classmethod
+    def compartilhado(cls, arquivo=None):
+        # Um único registro (e uma única thread de escrita) por arquivo em cada processo
+        caminho = os.path.abspath(arquivo or cls.ARQUIVO_PADRAO)
+        with cls._trava_compartilhados:
+            if caminho not in cls._compartilhados:
+                cls._compartilhados[caminho] = cls(caminho)
+            return cls._compartilhados[caminho]
+
+    @classmethod
+    def _apos_fork(cls):
+        # No filho, as travas podem ter sido copiadas fechadas por outra thread do pai
+        for registro in list(cls._registros):
+            registro.trava = threading.Lock()
+
+    @classmethod
+    def _fecha_todos(cls):
+        for registro in list(cls._registros):
+            registro.fecha()
+
+    def _ativo(self):
+        return self.pid == os.getpid() and self.escritor is not None and self.escritor.is_alive()
+
+    def _inicia(self):
+        # Fila e thread de escrita do processo atual (refeitas em um processo filho criado por fork)
+        self.pid = os.getpid()
+        self.fila = queue.SimpleQueue()
+        self.escritor = threading.Thread(target=self._escreve, name='registro-diagnosticos', daemon=True)
+        self.escritor.start()
+
+    def registra(self, entradas, saidas, ativacao=None):
+        # Chamado na consulta: só enfileira. Saídas ausentes (sem regra ativada) ficam null
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if not self._ativo():
+            with self.trava:
+                if not self._ativo():
+                    self._inicia()
+        self.fila.put((time.time(), dict(entradas), dict(saidas), ativacao))
+
+    def fecha(self):
+        # Grava o que estiver na fila e encerra a thread de escrita
+        if self._ativo():
+            self.fila.put(None)
+            self.escritor.join()
+
+    def _escreve(self):
+        continua = True
+        while continua:
+            lote = [self.fila.get()]
+            while len(lote) < self.LOTE_MAXIMO:
+                try:
+                    lote.append(self.fila.get_nowait())
+                except queue.Empty:
+                    break
+            if lote[-1] is None:
+                continua = False
+                lote.pop()
+            # A thread de escrita não pode morrer: um registro que não formata é descartado sozinho,
+            # um lote que não grava é perdido, e o erro vai para o stderr
+            linhas = []
+            for registro in lote:
+                try:
+                    linhas.append(self.formata(*registro) + '\n')
+                except Exception:
+                    logging.getLogger(__name__).exception("Registro descartado: %r", registro)
+            if linhas:
+                try:
+                    self._grava(''.join(linhas).encode('utf-8'))
+                except Exception:
+                    logging.getLogger(__name__).exception("Falha ao gravar %d registros em %s",
+                                                          len(linhas), self.arquivo)
+
+    def formata(self, instante, entradas, saidas, ativacao):
+        # Linha JSON de um registro; 'sem_regra' quando alguma saída não teve regra ativada
+        valores = {nome: saidas.get(nome) for nome in self.SAIDAS}
+        valores = {nome: None if valor is None or math.isnan(valor) else float(valor) for nome, valor in valores.items()}
+        registro = {
+            'instante': round(instante, 3),
+            'pid': self.pid,
+            'tipo': 'sem_regra' if None in valores.values() else 'diagnostico',
+            'entradas': {nome: float(valor) for nome, valor in entradas.items()},
+            'saidas': valores,
+            'ativacoes': [[regra, grau] for regra, grau in ativacao.obter_ativacoes()] if ativacao is not None else [],
+        }
+        return json.dumps(registro, ensure_ascii=False, separators=(',', ':'))
+
+    def _grava(self, dados):
+        with open(self.arquivo + '.lock', 'a+b') as trava:
+            self._trava(trava, True)
+            try:
+                tamanho = os.path.getsize(self.arquivo) if os.path.exists(self.arquivo) else 0
+                if tamanho and tamanho + len(dados) > self.tamanho_maximo:
+                    self._rotaciona()
+                descritor = os.open(self.arquivo, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(descritor, dados)
+                finally:
+                    os.close(descritor)
+            finally:
+                self._trava(trava, False)
+        self.gravados += dados.count(b'\n')
+        self.lotes += 1
+
+    def _rotaciona(self):
+        # diagnosticos.jsonl -> .1 -> .2 ...; a cópia mais antiga é descartada
+        if self.copias <= 0:
+            os.remove(self.arquivo)
+            return
+        for i in range(self.copias - 1, 0, -1):
+            if os.path.exists(f"{self.arquivo}.{i}"):
+                os.replace(f"{self.arquivo}.{i}", f"{self.arquivo}.{i + 1}")
+        os.replace(self.arquivo, f"{self.arquivo}.1")
+
+    @staticmethod
+    def _trava(arquivo, travar):
+        if fcntl is not None:
+            fcntl.flock(arquivo.fileno(), fcntl.LOCK_EX if travar else fcntl.LOCK_UN)
+        else:
+            arquivo.seek(0)
+            msvcrt.locking(arquivo.fileno(), msvcrt.LK_LOCK if travar else msvcrt.LK_UNLCK, 1)
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=RegistroDiagnosticos._apos_fork)
+atexit.register(RegistroDiagnosticos._fecha_todos)
+
+
+if __name__ == '__main__':
+    # Teste de concorrência: vários processos, cada um com várias threads, registrando no mesmo
+    # arquivo com rotação pequena; confere que nenhuma linha foi perdida ou corrompida
+    import argparse
+    import glob
+    import multiprocessing
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Teste de concorrência do registro de diagnósticos")
+    parser.add_argument('--processos', type=int, default=4)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--registros', type=int, default=2000, help="Registros por thread")
+    args = parser.parse_args()
+
+    class Ativacao:
+        def obter_ativacoes(self):
+            return [(144, 1.0), (145, 0.5)]
+
+    def produz(arquivo, processo):
+        registro = RegistroDiagnosticos(arquivo, tamanho_maximo=256 * 1024, copias=1000)
+        entradas = {f"entrada{i}": i / 3 for i in range(12)}
+
+        def thread(t):
+            for i in range(args.registros):
+                registro.registra({**entradas, 'id': processo * 10**6 + t * 10**4 + i},
+                                  {'depressao': 8.44, 'ansiedade': 1.56, 'tea': 1.56}, Ativacao())
+
+        inicio = time.perf_counter()
+        threads = [threading.Thread(target=thread, args=(t,)) for t in range(args.threads)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        enfileirado = time.perf_counter() - inicio
+        registro.fecha()
+        print(f"processo {processo}: {args.threads * args.registros} registros enfileirados em {enfileirado:.2f} s "
+              f"({enfileirado / (args.threads * args.registros) * 1e6:.1f} µs cada), {registro.lotes} lotes")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        arquivo = os.path.join(pasta, 'diagnosticos.jsonl')
+        processos = [multiprocessing.Process(target=produz, args=(arquivo, p)) for p in range(args.processos)]
+        for p in processos:
+            p.start()
+        for p in processos:
+            p.join()
+
+        ids = []
+        arquivos = glob.glob(arquivo + '*')
+        for caminho in arquivos:
+            if caminho.endswith('.lock'):
+                continue
+            with open(caminho, encoding='utf-8') as entrada:
+                ids.extend(json.loads(linha)['entradas']['id'] for linha in entrada)
+        esperado = args.processos * args.threads * args.registros
+        print(f"{len(ids)} linhas em {len(arquivos) - 1} arquivos; esperado {esperado}; "
+              f"duplicadas {len(ids) - len(set(ids))}")
+        if len(ids) != esperado or len(set(ids)) != esperado:
+            raise SystemExit(1)
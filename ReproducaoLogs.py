@@ -0,0 +1,195 @@
+import re
+import time
+
+import numpy as np
+
+from IndiceLogs import IndiceLogs
+from LogicaFuzzy import LogicaFuzzy
+
+
+class ReproducaoLogs:
+    # Reprodução do log de diagnósticos sobre a versão atual do LogicaFuzzy: lê o índice colunar
+    # (IndiceLogs), extrai das anotações escritas à mão no log os diagnósticos esperados
+    # ("OK dep. moderada", "dep. GRAVE ans. MODERADO"), recalcula em lote todas as entradas
+    # registradas e compara: concordância com as anotações, diferença em relação às saídas
+    # registradas, regras ativadas e diagnósticos por segundo
+
+    TOLERANCIA = 0.01  # As saídas do log têm duas casas decimais
+    ABREVIACOES = {'dep': 'depressao', 'ans': 'ansiedade', 'tea': 'tea'}
+    TERMOS = {'leve': 'leve', 'moderado': 'moderado', 'moderada': 'moderado', 'grave': 'grave'}
+    # "dep. GRAVE", "Ansiedade leve", "dep; grave", "tea leve": saída seguida do termo
+    ROTULO = re.compile(r"\b(dep|ans|tea)\w*\W{0,3}(leve|moderad[oa]|grave)\b", re.IGNORECASE)
+    CONFIRMACAO = re.compile(r"^ok\b", re.IGNORECASE)
+
+    def __init__(self, arquivo_log='logs.txt', pasta_indice=None, logica_fuzzy=None):
+        self.indice = IndiceLogs(arquivo_log, pasta_indice)
+        self.logica_fuzzy = logica_fuzzy or LogicaFuzzy(motor='vetorizado', cache=False, registro=False)
+        self.motor = self.logica_fuzzy._compila_motor()
+
+    def rotulos(self, anotacao):
+        # {saída: termo} citados na anotação; um "OK" sem termos confirma o diagnóstico registrado
+        rotulos = {}
+        for saida, termo in self.ROTULO.findall(anotacao):
+            rotulos[self.ABREVIACOES[saida.lower()]] = self.TERMOS[termo.lower()]
+        return rotulos, not rotulos and bool(self.CONFIRMACAO.match(anotacao))
+
+    def classifica(self, saidas):
+        # Termo de maior pertinência de cada saída (N x 3 -> N x 3 com o nome do termo; None sem regra)
+        termos = np.full(saidas.shape, None, dtype=object)
+        for c, (universo, pertinencias) in enumerate(zip(self.motor.universos_saida, self.motor.pertinencias_saida)):
+            graus = np.stack([np.interp(saidas[:, c], universo, mf) for mf in pertinencias], axis=1)
+            definidas = ~np.isnan(saidas[:, c])
+            termos[definidas, c] = np.asarray(self.motor.termos_saida[c], dtype=object)[graus[definidas].argmax(axis=1)]
+        return termos
+
+    def executa(self, repeticoes=3, motor='vetorizado'):
+        self.indice.atualiza()
+        entradas = self.indice.entradas()
+        registradas = self.indice.saidas()
+        completos = ~np.isnan(entradas).any(axis=1)
+        X = np.ascontiguousarray(entradas[completos])
+        registradas = registradas[completos]
+
+        # Diagnósticos por segundo: melhor de `repeticoes` passadas sobre todo o log
+        tempos = []
+        for _ in range(max(repeticoes, 1)):
+            inicio = time.perf_counter()
+            atuais = self._diagnostica(X, motor)
+            tempos.append(time.perf_counter() - inicio)
+        ativacoes = self.motor.avalia(X)[1] if len(X) else np.zeros((0, self.motor.n_regras))
+
+        resultado = {
+            'registros': len(self.indice),
+            'reproduzidos': len(X),
+            'entradas_incompletas': int((~completos).sum()),
+            'motor': motor,
+            'diagnosticos_por_segundo': len(X) / min(tempos) if len(X) and min(tempos) else 0.0,
+            'divergencias': self._divergencias(registradas, atuais, ativacoes, np.flatnonzero(completos)),
+            'concordancia': self._concordancia(registradas, atuais, np.flatnonzero(completos)),
+        }
+        return resultado
+
+    def _diagnostica(self, X, motor):
+        if motor == 'vetorizado':
+            return self.logica_fuzzy.diagnostico_lote(X)[0]
+        # Caminho da tela: uma consulta por vez pelo motor escolhido (infere, sem gravar no registro
+        # de diagnósticos); saídas sem regra ativada ficam NaN
+        saidas = np.full((len(X), len(self.indice.SAIDAS)), np.nan)
+        for i, linha in enumerate(X):
+            diagnostico = self.logica_fuzzy.infere(dict(zip(self.indice.ENTRADAS, linha)),
+                                                   self.logica_fuzzy.diagnostico_simulador)[0]
+            saidas[i] = [diagnostico.get(nome, np.nan) for nome in self.indice.SAIDAS]
+        return saidas
+
+    def _divergencias(self, registradas, atuais, ativacoes, registros):
+        # Saídas registradas x atuais (só onde as duas existem), mudanças de "sem regra" e de regras ativadas
+        resultado = {}
+        for c, nome in enumerate(self.indice.SAIDAS):
+            ambas = ~np.isnan(registradas[:, c]) & ~np.isnan(atuais[:, c])
+            diferenca = np.abs(registradas[ambas, c] - atuais[ambas, c])
+            resultado[nome] = {
+                'comparados': int(ambas.sum()),
+                'acima_tolerancia': int((diferenca > self.TOLERANCIA).sum()),
+                'diferenca_maxima': float(diferenca.max()) if diferenca.size else 0.0,
+                'diferenca_media': float(diferenca.mean()) if diferenca.size else 0.0,
+                'passaram_a_ter_regra': int((np.isnan(registradas[:, c]) & ~np.isnan(atuais[:, c])).sum()),
+                'deixaram_de_ter_regra': int((~np.isnan(registradas[:, c]) & np.isnan(atuais[:, c])).sum()),
+            }
+        # Regras ativadas: conjunto registrado no log x conjunto atual (registros com saída registrada).
+        # Os números são os da base de regras da época: inserir uma regra também conta como alteração
+        alteradas = []
+        for i, registro in enumerate(registros):
+            if np.isnan(registradas[i]).all():
+                continue
+            registrada = {regra for regra, _ in self.indice.ativacoes(registro)}
+            if registrada != set(np.flatnonzero(ativacoes[i] > 0).tolist()):
+                alteradas.append(int(registro))
+        resultado['regras_ativadas_alteradas'] = alteradas
+        return resultado
+
+    def _concordancia(self, registradas, atuais, registros):
+        # Diagnóstico esperado (anotação) x termo dominante da saída atual, por saída
+        termos_atuais = self.classifica(atuais)
+        termos_registrados = self.classifica(registradas)
+        posicao = {int(registro): i for i, registro in enumerate(registros)}
+        resultado = {nome: {'anotados': 0, 'concordantes': 0} for nome in self.indice.SAIDAS}
+        discordancias = []
+        confirmados = 0
+        for registro, anotacao in self.indice.anotacoes().items():
+            if registro not in posicao:
+                continue
+            i = posicao[registro]
+            rotulos, confirmado = self.rotulos(anotacao)
+            if confirmado:
+                # "OK" sem termos: o diagnóstico registrado na época foi aceito como esperado
+                confirmados += 1
+                rotulos = {nome: termos_registrados[i, c] for c, nome in enumerate(self.indice.SAIDAS)
+                           if termos_registrados[i, c] is not None}
+            for c, nome in enumerate(self.indice.SAIDAS):
+                if nome not in rotulos:
+                    continue
+                resultado[nome]['anotados'] += 1
+                if termos_atuais[i, c] == rotulos[nome]:
+                    resultado[nome]['concordantes'] += 1
+                else:
+                    discordancias.append({'registro': registro, 'anotacao': anotacao, 'saida': nome,
+                                          'esperado': rotulos[nome], 'atual': termos_atuais[i, c],
+                                          'valor': None if np.isnan(atuais[i, c]) else float(atuais[i, c])})
+        for dados in resultado.values():
+            dados['taxa'] = dados['concordantes'] / dados['anotados'] if dados['anotados'] else None
+        resultado['confirmados_sem_termo'] = confirmados
+        resultado['discordancias'] = discordancias
+        return resultado
+
+
+if __name__ == '__main__':
+    # python ReproducaoLogs.py [logs.txt] [--motor vetorizado|skfuzzy] [--repeticoes 3] [--json arquivo] [--verifica]
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Reproduz o log de diagnósticos sobre as regras atuais")
+    parser.add_argument('log', nargs='?', default='logs.txt')
+    parser.add_argument('--indice', default=IndiceLogs.PASTA_PADRAO, help="Pasta do índice colunar")
+    parser.add_argument('--motor', choices=('vetorizado', 'skfuzzy'), default='vetorizado',
+                        help="vetorizado: diagnostico_lote; skfuzzy: calcula_diagnostico, uma consulta por vez")
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--regras', default=None, help="Arquivo de regras (padrão: regras.csv)")
+    parser.add_argument('--json', default=None, help="Grava o relatório completo neste arquivo")
+    parser.add_argument('--verifica', action='store_true',
+                        help="Termina com erro se alguma saída registrada mudou além da tolerância")
+    args = parser.parse_args()
+
+    logica_fuzzy = LogicaFuzzy(motor=args.motor, arquivo_regras=args.regras, cache=False, registro=False)
+    reproducao = ReproducaoLogs(args.log, args.indice, logica_fuzzy)
+    relatorio = reproducao.executa(args.repeticoes, args.motor)
+
+    print(f"{relatorio['reproduzidos']} de {relatorio['registros']} registros reproduzidos "
+          f"({relatorio['diagnosticos_por_segundo']:,.0f} diagnósticos/s, motor {args.motor})")
+    print("\nConcordância com as anotações:")
+    concordancia = relatorio['concordancia']
+    for nome in IndiceLogs.SAIDAS:
+        dados = concordancia[nome]
+        taxa = f"{dados['taxa']:.1%}" if dados['taxa'] is not None else "-"
+        print(f"  {nome:10s} {dados['concordantes']}/{dados['anotados']} ({taxa})")
+    print(f"  ({concordancia['confirmados_sem_termo']} anotações \"OK\" sem termo usam o diagnóstico registrado)")
+    for discordancia in concordancia['discordancias']:
+        valor = f"{discordancia['valor']:.2f}" if discordancia['valor'] is not None else "sem regra"
+        print(f"  #{discordancia['registro']} {discordancia['saida']}: esperado {discordancia['esperado']}, "
+              f"atual {discordancia['atual'] or 'sem regra'} ({valor}) - \"{discordancia['anotacao']}\"")
+
+    print(f"\nDiferença em relação às saídas registradas (tolerância {ReproducaoLogs.TOLERANCIA}):")
+    divergencias = relatorio['divergencias']
+    for nome in IndiceLogs.SAIDAS:
+        dados = divergencias[nome]
+        print(f"  {nome:10s} {dados['acima_tolerancia']}/{dados['comparados']} acima da tolerância, "
+              f"máx. {dados['diferenca_maxima']:.2f}, média {dados['diferenca_media']:.3f}; "
+              f"passaram a ter regra: {dados['passaram_a_ter_regra']}, "
+              f"deixaram de ter: {dados['deixaram_de_ter_regra']}")
+    print(f"  Registros com outro conjunto de regras ativadas: {len(divergencias['regras_ativadas_alteradas'])}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, ensure_ascii=False, indent=2)
+    if args.verifica and any(divergencias[nome]['acima_tolerancia'] or divergencias[nome]['deixaram_de_ter_regra']
+                             for nome in IndiceLogs.SAIDAS):
+        raise SystemExit(1)
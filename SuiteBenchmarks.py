@@ -0,0 +1,297 @@
+import itertools
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+
+from IndiceLogs import IndiceLogs
+from LogicaFuzzy import LogicaFuzzy
+from RegistroDiagnosticos import RegistroDiagnosticos
+
+
+class SuiteBenchmarks:
+    # Benchmarks de cada etapa do diagnóstico sobre corpora fixos de entradas: as consultas
+    # registradas no logs.txt (pelo IndiceLogs) e um corpus aleatório de semente fixa. Cada
+    # benchmark guarda várias amostras de tempo por operação, para que `compara` possa separar uma
+    # regressão real do ruído da máquina (teste de Mann-Whitney sobre as amostras)
+
+    AMOSTRAS = 15
+    TEMPO_MINIMO = 0.05  # Segundos por amostra: operações rápidas são repetidas até atingir este tempo
+    TAMANHO_ALEATORIO = 256
+    NIVEL = 0.01  # Significância do teste
+    LIMIAR = 0.05  # Diferença mínima entre as medianas para sinalizar (5%)
+
+    BENCHMARKS = ('construcao', 'diagnostico', 'lote', 'ativacoes', 'grava_log', 'graficos', 'grafico_tela')
+    # Benchmarks que não dependem das entradas: medidos uma vez, fora dos corpora
+    SEM_CORPUS = ('construcao',)
+
+    def __init__(self, motor='vetorizado', arquivo_log='logs.txt', amostras=None, semente=0):
+        self.motor = motor
+        self.arquivo_log = arquivo_log
+        self.amostras = amostras or self.AMOSTRAS
+        self.semente = semente
+
+    def corpora(self):
+        # {nome: matriz N x 12}: as entradas completas do log (se existir) e o corpus aleatório
+        corpora = {}
+        if os.path.exists(self.arquivo_log):
+            with tempfile.TemporaryDirectory() as pasta:
+                indice = IndiceLogs(self.arquivo_log, pasta)
+                indice.atualiza()
+                entradas = np.array(indice.entradas())
+            corpora['logs'] = entradas[~np.isnan(entradas).any(axis=1)]
+        rng = np.random.default_rng(self.semente)
+        corpora['aleatorio'] = np.round(rng.uniform(0, 5, (self.TAMANHO_ALEATORIO, len(IndiceLogs.ENTRADAS))), 2)
+        return corpora
+
+    def mede(self, operacao, por_chamada=1):
+        # Amostras de segundos por operação; cada amostra repete `operacao` até TEMPO_MINIMO
+        operacao()  # Aquecimento
+        repeticoes = 1
+        inicio = time.perf_counter()
+        operacao()
+        duracao = time.perf_counter() - inicio
+        if duracao < self.TEMPO_MINIMO:
+            repeticoes = max(1, int(self.TEMPO_MINIMO / max(duracao, 1e-9)))
+        amostras = []
+        for _ in range(self.amostras):
+            inicio = time.perf_counter()
+            for _ in range(repeticoes):
+                operacao()
+            amostras.append((time.perf_counter() - inicio) / (repeticoes * por_chamada))
+        return amostras
+
+    def nova_logica(self, **opcoes):
+        return LogicaFuzzy(motor=self.motor, cache=False, registro=False, **opcoes)
+
+    def executa(self, apenas=None, progresso=None):
+        apenas = apenas or self.BENCHMARKS
+        resultados = {}
+        logica_fuzzy = None
+        if 'construcao' in apenas:
+            resultados['construcao'] = self._resultado(self.mede(self.nova_logica))
+            if progresso:
+                progresso('construcao', resultados['construcao'])
+        for corpus, X in self.corpora().items():
+            logica_fuzzy = logica_fuzzy or self.nova_logica()
+            for nome in apenas:
+                if nome in self.SEM_CORPUS:
+                    continue
+                chave = f"{nome}[{corpus}]"
+                resultados[chave] = self._resultado(getattr(self, f"_mede_{nome}")(logica_fuzzy, X), len(X))
+                if progresso:
+                    progresso(chave, resultados[chave])
+        return {'ambiente': self.ambiente(), 'resultados': resultados}
+
+    @staticmethod
+    def _resultado(amostras, linhas=None):
+        resultado = {'mediana': float(np.median(amostras)), 'amostras': amostras}
+        if linhas is not None:
+            resultado['linhas'] = linhas
+        return resultado
+
+    def ambiente(self):
+        import matplotlib
+
+        return {
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'motor': self.motor,
+            'amostras': self.amostras,
+            'semente': self.semente,
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'matplotlib': matplotlib.__version__,
+            'plataforma': platform.platform(),
+            'processador': platform.processor() or platform.machine(),
+            'cpus': os.cpu_count(),
+        }
+
+    # Uma operação de cada benchmark; as que percorrem o corpus avançam uma linha por chamada
+
+    @staticmethod
+    def _consultas(logica_fuzzy, X):
+        nomes = [v.label for v in logica_fuzzy.antecedentes()]
+        return itertools.cycle([dict(zip(nomes, linha)) for linha in X])
+
+    @staticmethod
+    def _diagnostica(logica_fuzzy, entradas):
+        try:
+            return logica_fuzzy.calcula_diagnostico(entradas)
+        except KeyError:
+            return None  # Sem regra ativada: mesmo custo de cálculo, sem resultado
+
+    def _mede_diagnostico(self, logica_fuzzy, X):
+        consultas = self._consultas(logica_fuzzy, X)
+        return self.mede(lambda: self._diagnostica(logica_fuzzy, next(consultas)))
+
+    def _mede_lote(self, logica_fuzzy, X):
+        # Segundos por linha de uma chamada de diagnostico_lote sobre o corpus inteiro
+        return self.mede(lambda: logica_fuzzy.diagnostico_lote(X), por_chamada=len(X))
+
+    def _mede_ativacoes(self, logica_fuzzy, X):
+        # Só a leitura das regras ativadas; os diagnósticos são calculados antes, fora do tempo
+        ativacoes = []
+        for entradas in itertools.islice(self._consultas(logica_fuzzy, X), len(X)):
+            self._diagnostica(logica_fuzzy, entradas)
+            ativacoes.append(logica_fuzzy.ultima_ativacao)
+        ciclo = itertools.cycle(ativacoes)
+
+        def operacao():
+            logica_fuzzy.ultima_ativacao = next(ciclo)
+            logica_fuzzy.ativacoes()
+        return self.mede(operacao)
+
+    def _mede_grava_log(self, logica_fuzzy, X):
+        # Custo na thread da consulta (enfileirar); a gravação em segundo plano vai para um arquivo temporário
+        with tempfile.TemporaryDirectory() as pasta:
+            registro = RegistroDiagnosticos(os.path.join(pasta, 'diagnosticos.jsonl'))
+            casos = []
+            for entradas in itertools.islice(self._consultas(logica_fuzzy, X), len(X)):
+                saidas = self._diagnostica(logica_fuzzy, entradas) or {}
+                casos.append((entradas, saidas, logica_fuzzy.ultima_ativacao))
+            ciclo = itertools.cycle(casos)
+            anterior, logica_fuzzy.registro = logica_fuzzy.registro, registro
+            try:
+                return self.mede(lambda: logica_fuzzy.grava_log(*next(ciclo)))
+            finally:
+                logica_fuzzy.registro = anterior
+                registro.fecha()
+
+    def _saidas_grafico(self, logica_fuzzy, X):
+        saidas = []
+        for entradas in itertools.islice(self._consultas(logica_fuzzy, X), min(len(X), 32)):
+            self._diagnostica(logica_fuzzy, entradas)
+            saidas.append(logica_fuzzy.saida_grafico())
+        return itertools.cycle(saidas)
+
+    def _mede_graficos(self, logica_fuzzy, X):
+        # Três figuras novas (desenha_graficos) rasterizadas, como no modo segundo_plano
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        saidas = self._saidas_grafico(logica_fuzzy, X)
+
+        def operacao():
+            for figura in logica_fuzzy.desenha_graficos(next(saidas)):
+                FigureCanvasAgg(figura).draw()
+        return self.mede(operacao)
+
+    def _mede_grafico_tela(self, logica_fuzzy, X):
+        # Figura reaproveitada da tela (GraficoDiagnostico): atualiza as áreas e redesenha o canvas
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        from GraficoDiagnostico import GraficoDiagnostico
+
+        grafico = GraficoDiagnostico(logica_fuzzy)
+        canvas = FigureCanvasAgg(grafico.figura)
+        saidas = self._saidas_grafico(logica_fuzzy, X)
+
+        def operacao():
+            grafico.atualiza(next(saidas))
+            canvas.draw()
+        return self.mede(operacao)
+
+    @classmethod
+    def compara(cls, base, atual, nivel=None, limiar=None):
+        # [(benchmark, mediana base, mediana atual, razão, p, situação)] dos benchmarks presentes nos dois.
+        # Situação: 'regressao' / 'melhora' quando o teste unilateral é significativo e a diferença
+        # das medianas passa do limiar; senão 'igual'
+        from scipy.stats import mannwhitneyu
+
+        nivel = cls.NIVEL if nivel is None else nivel
+        limiar = cls.LIMIAR if limiar is None else limiar
+        linhas = []
+        for nome, dados in atual['resultados'].items():
+            if nome not in base['resultados']:
+                continue
+            anteriores, novas = base['resultados'][nome]['amostras'], dados['amostras']
+            razao = np.median(novas) / np.median(anteriores)
+            p_pior = mannwhitneyu(novas, anteriores, alternative='greater').pvalue
+            p_melhor = mannwhitneyu(novas, anteriores, alternative='less').pvalue
+            situacao, p = 'igual', min(p_pior, p_melhor)
+            if p_pior < nivel and razao > 1 + limiar:
+                situacao, p = 'regressao', p_pior
+            elif p_melhor < nivel and razao < 1 - limiar:
+                situacao, p = 'melhora', p_melhor
+            linhas.append((nome, float(np.median(anteriores)), float(np.median(novas)), float(razao), float(p), situacao))
+        return linhas
+
+    @staticmethod
+    def unitario_lote(atual):
+        # [(corpus, segundos de uma consulta, segundos por linha em lote)], lado a lado, dos corpora
+        # em que os dois benchmarks foram medidos
+        resultados = atual['resultados']
+        linhas = []
+        for chave, dados in resultados.items():
+            if chave.startswith('diagnostico[') and 'lote' + chave[len('diagnostico'):] in resultados:
+                lote = resultados['lote' + chave[len('diagnostico'):]]
+                linhas.append((chave[len('diagnostico['):-1], dados['mediana'], lote['mediana']))
+        return linhas
+
+    @staticmethod
+    def formata_tempo(segundos):
+        for unidade, escala in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+            if segundos >= escala:
+                return f"{segundos / escala:.3g} {unidade}"
+        return f"{segundos / 1e-9:.3g} ns"
+
+
+if __name__ == '__main__':
+    # python SuiteBenchmarks.py executa [--saida benchmarks.json] [--motor vetorizado|skfuzzy] [--amostras 15]
+    # python SuiteBenchmarks.py compara base.json atual.json [--nivel 0.01] [--limiar 0.05]
+    import argparse
+    import json
+    import sys
+
+    parser = argparse.ArgumentParser(description="Benchmarks das etapas do diagnóstico, com linhas de base em JSON")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+    executa = subcomandos.add_parser('executa', help="Mede e grava os resultados (linha de base)")
+    executa.add_argument('--saida', default='benchmarks.json')
+    executa.add_argument('--motor', choices=LogicaFuzzy.MOTORES, default='vetorizado')
+    executa.add_argument('--amostras', type=int, default=SuiteBenchmarks.AMOSTRAS)
+    executa.add_argument('--log', default='logs.txt', help="Log cujas entradas formam o corpus 'logs'")
+    executa.add_argument('--apenas', nargs='+', choices=SuiteBenchmarks.BENCHMARKS, default=None)
+    executa.add_argument('--compara', default=None, help="Compara com esta linha de base ao terminar")
+    compara = subcomandos.add_parser('compara', help="Sinaliza regressões estatisticamente significativas")
+    compara.add_argument('base')
+    compara.add_argument('atual')
+    for sub in (executa, compara):
+        sub.add_argument('--nivel', type=float, default=SuiteBenchmarks.NIVEL)
+        sub.add_argument('--limiar', type=float, default=SuiteBenchmarks.LIMIAR)
+    args = parser.parse_args()
+
+    if args.comando == 'executa':
+        suite = SuiteBenchmarks(args.motor, args.log, args.amostras)
+        atual = suite.executa(args.apenas, progresso=lambda nome, resultado: print(
+            f"{nome:<26} {SuiteBenchmarks.formata_tempo(resultado['mediana']):>10}/op", flush=True))
+        for corpus, unitario, lote in SuiteBenchmarks.unitario_lote(atual):
+            print(f"{corpus}: uma consulta {SuiteBenchmarks.formata_tempo(unitario)}, em lote "
+                  f"{SuiteBenchmarks.formata_tempo(lote)}/linha ({unitario / lote:.0f}x)")
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(atual, arquivo, indent=1)
+        print(f"Resultados gravados em {args.saida}")
+        if args.compara is None:
+            sys.exit()
+        with open(args.compara, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+    else:
+        with open(args.base, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+        with open(args.atual, encoding='utf-8') as arquivo:
+            atual = json.load(arquivo)
+
+    for chave in ('motor', 'python', 'numpy', 'plataforma', 'cpus'):
+        if base['ambiente'].get(chave) != atual['ambiente'].get(chave):
+            print(f"Atenção: {chave} diferente ({base['ambiente'].get(chave)} -> {atual['ambiente'].get(chave)})")
+    linhas = SuiteBenchmarks.compara(base, atual, args.nivel, args.limiar)
+    print(f"{'benchmark':<26} {'base':>10} {'atual':>10} {'razão':>7} {'p':>9}")
+    for nome, mediana_base, mediana_atual, razao, p, situacao in linhas:
+        marca = {'regressao': '  REGRESSÃO', 'melhora': '  melhora'}.get(situacao, '')
+        print(f"{nome:<26} {SuiteBenchmarks.formata_tempo(mediana_base):>10} "
+              f"{SuiteBenchmarks.formata_tempo(mediana_atual):>10} {razao:7.2f} {p:9.2g}{marca}")
+    regressoes = [linha for linha in linhas if linha[-1] == 'regressao']
+    print(f"{len(regressoes)} regressões (p < {args.nivel} e mediana {args.limiar:.0%} acima da base)")
+    if regressoes:
+        raise SystemExit(1)
@@ -1,6 +1,10 @@
+import time
+
+INICIO = time.perf_counter()  # Referência do relatório de inicialização impresso pela App
+
 from App import App
 import ttkbootstrap as ttkb
 
 root = ttkb.Window()
-app = App(root)
+app = App(root, inicio=INICIO)
 root.mainloop()
\ No newline at end of file
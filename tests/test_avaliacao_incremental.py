@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from AvaliacaoIncremental import AvaliacaoIncremental
+from LogicaFuzzy import LogicaFuzzy
+
+
+@pytest.fixture(scope='module', params=['amostrada', 'analitica'])
+def motor(request):
+    return LogicaFuzzy(motor='vetorizado', cache=False, registro=False,
+                       defuzzificacao=request.param)._compila_motor()
+
+
+def sequencia(motor, n=300):
+    # Como na tela: a cada consulta um slider muda (às vezes para o mesmo valor)
+    rng = np.random.default_rng(0)
+    X = np.empty((n, len(motor.nomes_entrada)))
+    X[0] = rng.choice([0., 1., 2., 3., 4., 5.], X.shape[1])
+    for i in range(1, n):
+        X[i] = X[i - 1]
+        X[i, rng.integers(X.shape[1])] = np.round(rng.uniform(0, 5), 1)
+    return X
+
+
+def assert_igual(completa, parcial):
+    for a, b in zip(completa, parcial):
+        np.testing.assert_array_equal(a, b)
+
+
+def test_igual_a_avaliacao_completa(motor):
+    incremental = AvaliacaoIncremental(motor)
+    for linha in sequencia(motor):
+        assert_igual(motor.avalia(linha[None]), incremental.avalia(linha))
+    estatisticas = incremental.estatisticas()
+    assert estatisticas['consultas'] == 300
+    assert estatisticas['poupado_fuzzificacao'] > 0.5
+
+
+def test_reinicia(motor):
+    incremental = AvaliacaoIncremental(motor)
+    X = sequencia(motor, 20)
+    for linha in X:
+        incremental.avalia(linha)
+    incremental.reinicia()
+    incremental.zera_contadores()
+    assert_igual(motor.avalia(X[:1]), incremental.avalia(X[0]))
+    assert incremental.estatisticas()['variaveis_reaproveitadas'] == 0
+
+
+def test_modo_incremental_da_logica():
+    logica = LogicaFuzzy(motor='vetorizado', cache=False, registro=False, incremental=True)
+    completa = LogicaFuzzy(motor='vetorizado', cache=False, registro=False)
+    nomes = [v.label for v in logica.antecedentes()]
+    for linha in sequencia(logica.motor_vetorizado, 50):
+        entradas = dict(zip(nomes, linha))
+        assert logica.infere(entradas, incremental=logica.avaliacao_incremental)[0] == completa.infere(entradas)[0]
@@ -0,0 +1,29 @@
+import pytest
+
+from BaseRegras import BaseRegras
+
+
+def test_ida_e_volta_do_csv(tmp_path):
+    base = BaseRegras.carrega()
+    caminho = tmp_path / 'regras.csv'
+    base.salva(caminho)
+    assert caminho.read_bytes() == open(BaseRegras.ARQUIVO_PADRAO, 'rb').read()
+    relida = BaseRegras.carrega(caminho)
+    assert relida.nomes_entrada == base.nomes_entrada
+    assert relida.linhas == base.linhas
+    assert relida.regras() == base.regras()
+
+
+def test_termos_alternativos_preservados(tmp_path):
+    base = BaseRegras(['a', 'b'], [{'secao': 's', 'descricao': 'd', 'premissa': {'a': ('baixo', 'medio')},
+                                    'consequente': ('saida', 'leve')}])
+    caminho = tmp_path / 'regras.csv'
+    base.salva(caminho)
+    assert BaseRegras.carrega(caminho).linhas == base.linhas
+
+
+def test_regra_sem_consequente(tmp_path):
+    caminho = tmp_path / 'regras.csv'
+    caminho.write_text("secao,descricao,a,saida,termo\ns,d,baixo,,\n", encoding='utf-8')
+    with pytest.raises(ValueError):
+        BaseRegras.carrega(caminho)
@@ -0,0 +1,43 @@
+import pytest
+
+from CacheDiagnosticos import CacheDiagnosticos
+from LogicaFuzzy import LogicaFuzzy
+
+
+def test_chave_exata_por_padrao():
+    cache = CacheDiagnosticos()
+    cache.guarda(cache.chave([1.004, 2.0]), 'resultado')
+    assert cache.obtem(cache.chave([1.0, 2.0])) is None
+    assert cache.obtem(cache.chave([1.004, 2.0])) == 'resultado'
+
+
+def test_chave_quantizada_opcional():
+    cache = CacheDiagnosticos(passo=0.01)
+    assert cache.chave([1.004, 2.0]) == cache.chave([1.0, 2.0])
+    with pytest.raises(ValueError):
+        CacheDiagnosticos(passo=0)
+
+
+def test_descarta_o_usado_ha_mais_tempo():
+    cache = CacheDiagnosticos(capacidade=2)
+    cache.guarda((1,), 'a')
+    cache.guarda((2,), 'b')
+    cache.obtem((1,))
+    cache.guarda((3,), 'c')
+    assert cache.obtem((2,)) is None
+    assert cache.obtem((1,)) == 'a'
+    estatisticas = cache.estatisticas()
+    assert (estatisticas['tamanho'], estatisticas['remocoes']) == (2, 1)
+    cache.invalida()
+    assert cache.estatisticas()['tamanho'] == 0
+
+
+def test_consulta_repetida_vem_do_cache():
+    logica = LogicaFuzzy(motor='vetorizado', registro=False)
+    entradas = {v.label: 2.5 for v in logica.antecedentes()}
+    primeiro = logica.infere(entradas)
+    assert logica.infere(dict(entradas)) is primeiro
+    outro = dict(entradas, **{logica.antecedentes()[0].label: 2.501})
+    assert logica.infere(outro) is not primeiro
+    estatisticas = logica.cache.estatisticas()
+    assert (estatisticas['acertos'], estatisticas['falhas']) == (1, 2)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from LogicaFuzzy import LogicaFuzzy
+
+# Construir o ControlSystem do skfuzzy leva minutos: uma instância para o módulo inteiro
+
+
+@pytest.fixture(scope='module')
+def logica():
+    return LogicaFuzzy(motor='skfuzzy', cache=False, registro=False)
+
+
+def consultas(logica, n=8):
+    # Valores inteiros (vértices dos trapézios) e fracionários, sorteados com semente fixa
+    nomes = [v.label for v in logica.antecedentes()]
+    rng = np.random.default_rng(0)
+    linhas = [rng.choice([0., 1., 2., 3., 4., 5.], len(nomes)) for _ in range(n // 2)]
+    linhas += [np.round(rng.uniform(0, 5, len(nomes)), 2) for _ in range(n - n // 2)]
+    return [dict(zip(nomes, linha)) for linha in linhas]
+
+
+def test_vetorizado_igual_ao_skfuzzy(logica):
+    for entradas in consultas(logica):
+        saidas, ativacao, _ = logica.infere(entradas, logica.diagnostico_simulador)
+        saidas_vet, ativacao_vet, _ = logica.infere(entradas, motor='vetorizado')
+        assert saidas_vet.keys() == saidas.keys()
+        for nome, valor in saidas.items():
+            assert saidas_vet[nome] == pytest.approx(valor, rel=0, abs=1e-9)
+        np.testing.assert_allclose(ativacao_vet.graus, ativacao.graus, rtol=0, atol=1e-12)
+
+
+def test_lote_igual_ao_individual(logica):
+    entradas = consultas(logica)
+    saidas, sem_regra = logica.diagnostico_lote({nome: [e[nome] for e in entradas] for nome in entradas[0]})
+    for i, e in enumerate(entradas):
+        individual, _, _ = logica.infere(e, motor='vetorizado')
+        assert sem_regra[i] == (len(individual) < saidas.shape[1])
+        for c, nome in enumerate(logica.motor_vetorizado.nomes_saida):
+            if nome in individual:
+                assert saidas[i, c] == individual[nome]
+            else:
+                assert np.isnan(saidas[i, c])
+
+
+def test_centroide_analitico_proximo_da_amostragem_fina():
+    # O analítico independe da amostragem do universo; a referência é o amostrado em passo 0.01
+    analitica = LogicaFuzzy(motor='vetorizado', cache=False, registro=False, defuzzificacao='analitica')
+    fina = LogicaFuzzy(motor='vetorizado', cache=False, registro=False, resolucao_saida=0.01)
+    X = np.random.default_rng(1).uniform(0, 5, (200, len(analitica.antecedentes())))
+    valores, _, _ = analitica._compila_motor().avalia(X)
+    referencia, _, _ = fina._compila_motor().avalia(X)
+    np.testing.assert_allclose(valores, referencia, rtol=0, atol=1e-3)
+
+
+def test_resolucao_saida_invalida():
+    with pytest.raises(ValueError):
+        LogicaFuzzy(motor='vetorizado', registro=False, resolucao_saida=0.3)